@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Command line interface for n8n-workflow-analyzer.
+
+Usage:
+    python -m n8n_analyzer.cli pack data/raw_workflows data/processed_data/workflows.pack [--zstd]
+    python -m n8n_analyzer.cli unpack data/processed_data/workflows.pack data/unpacked
+    python -m n8n_analyzer.cli index data/raw_workflows data/processed_data/node_types.idx
+    python -m n8n_analyzer.cli support data/processed_data/node_types.idx n8n-nodes-base.webhook n8n-nodes-base.slack
+    python -m n8n_analyzer.cli duplicates data/raw_workflows [--threshold 0.9]
+"""
+
+import sys
+import argparse
+import logging
+from typing import List, Optional
+
+from n8n_analyzer.core.parser import find_workflow_files, parse_workflows_batch
+from n8n_analyzer.core.pack import pack_workflows, unpack_workflows
+from n8n_analyzer.graph.fingerprint import deduplicate_workflows, find_near_duplicates
+from n8n_analyzer.patterns.index import TransactionIndex
+
+
+def _pack(args: argparse.Namespace) -> int:
+    files = sorted(find_workflow_files(args.directory, recursive=not args.no_recursive))
+    written = pack_workflows(
+        files, args.archive,
+        base_dir=args.directory,
+        compress=args.zstd,
+        compression_level=args.level,
+        append=args.append
+    )
+    print(f"Packed {written} workflow files into {args.archive}")
+    return 0
+
+
+def _unpack(args: argparse.Namespace) -> int:
+    written = unpack_workflows(args.archive, args.output_dir)
+    print(f"Extracted {written} workflow files into {args.output_dir}")
+    return 0
+
+
+def _index(args: argparse.Namespace) -> int:
+    files = sorted(find_workflow_files(args.directory, recursive=not args.no_recursive))
+    if args.dedup is None:
+        workflows = parse_workflows_batch(files, skip_errors=True, workers=args.workers, fields=())
+    else:
+        # Fingerprints need the connections; near-duplicates are dropped before indexing
+        workflows = parse_workflows_batch(files, skip_errors=True, workers=args.workers, fields=('connections',))
+        workflows = deduplicate_workflows(workflows, threshold=args.dedup)
+    index = TransactionIndex.from_workflows(workflows)
+    index.save(args.index)
+    print(f"Indexed {len(index)} workflows ({len(index.vocabulary)} items) into {args.index}")
+    return 0
+
+
+def _duplicates(args: argparse.Namespace) -> int:
+    files = sorted(find_workflow_files(args.directory, recursive=not args.no_recursive))
+    workflows = parse_workflows_batch(files, skip_errors=True, workers=args.workers, fields=('connections',))
+    clusters = find_near_duplicates(workflows, threshold=args.threshold)
+    for cluster in clusters:
+        print(f"{len(cluster)} near-duplicates:")
+        for key in cluster:
+            print(f"  {key}")
+    redundant = sum(len(cluster) - 1 for cluster in clusters)
+    print(f"{len(clusters)} clusters, {redundant} of {len(files)} workflows are near-duplicates")
+    return 0
+
+
+def _support(args: argparse.Namespace) -> int:
+    index = TransactionIndex.load(args.index)
+    count = index.count(args.items)
+    print(f"{count} of {len(index)} workflows ({index.support(args.items):.2%}) contain {', '.join(args.items)}")
+    if args.list:
+        for key in index.matching_keys(args.items):
+            print(key)
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='n8n-analyzer', description='n8n workflow analyzer tools')
+    parser.add_argument('-v', '--verbose', action='store_true', help='Enable debug logging')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    pack_parser = subparsers.add_parser('pack', help='Consolidate a directory of workflow JSONs into one archive')
+    pack_parser.add_argument('directory', help='Directory containing workflow JSON files')
+    pack_parser.add_argument('archive', help='Destination archive path')
+    pack_parser.add_argument('--zstd', action='store_true', help='Compress records with zstd (requires zstandard)')
+    pack_parser.add_argument('--level', type=int, default=3, help='zstd compression level')
+    pack_parser.add_argument('--append', action='store_true', help='Append to an existing archive')
+    pack_parser.add_argument('--no-recursive', action='store_true', help='Do not search subdirectories')
+    pack_parser.set_defaults(handler=_pack)
+
+    unpack_parser = subparsers.add_parser('unpack', help='Extract an archive back into workflow JSON files')
+    unpack_parser.add_argument('archive', help='Archive path')
+    unpack_parser.add_argument('output_dir', help='Directory to extract into')
+    unpack_parser.set_defaults(handler=_unpack)
+
+    index_parser = subparsers.add_parser('index', help='Build a node type support index of a workflow directory')
+    index_parser.add_argument('directory', help='Directory containing workflow JSON files')
+    index_parser.add_argument('index', help='Destination index path')
+    index_parser.add_argument('--workers', type=int, default=None, help='Number of parser processes')
+    index_parser.add_argument('--no-recursive', action='store_true', help='Do not search subdirectories')
+    index_parser.add_argument('--dedup', type=float, default=None, metavar='THRESHOLD',
+                              help='Skip structural near-duplicates at this similarity (e.g. 0.9)')
+    index_parser.set_defaults(handler=_index)
+
+    support_parser = subparsers.add_parser('support', help='Count the workflows containing all given items')
+    support_parser.add_argument('index', help='Index path')
+    support_parser.add_argument('items', nargs='+', help='Items (node types) that must all be present')
+    support_parser.add_argument('--list', action='store_true', help='Also print the matching workflow files')
+    support_parser.set_defaults(handler=_support)
+
+    duplicates_parser = subparsers.add_parser('duplicates', help='Find structurally near-duplicate workflows')
+    duplicates_parser.add_argument('directory', help='Directory containing workflow JSON files')
+    duplicates_parser.add_argument('--threshold', type=float, default=0.9,
+                                   help='Jaccard similarity of node type and edge shingles (default: 0.9)')
+    duplicates_parser.add_argument('--workers', type=int, default=None, help='Number of parser processes')
+    duplicates_parser.add_argument('--no-recursive', action='store_true', help='Do not search subdirectories')
+    duplicates_parser.set_defaults(handler=_duplicates)
+
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO)
+    return args.handler(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,267 @@
+import os
+import time
+import pickle
+import sqlite3
+import hashlib
+import logging
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+from .models import N8nWorkflow
+
+
+# Configure logging for cache
+logger = logging.getLogger(__name__)
+
+# Protocol 5 supports out-of-band buffers and is the most compact protocol available
+PICKLE_PROTOCOL = 5
+
+
+@dataclass(frozen=True)
+class FileFingerprint:
+    """Identifies a specific version of a file on disk."""
+    mtime_ns: int
+    size: int
+    digest: Optional[str] = None  # Content hash, only computed when requested
+
+
+def file_fingerprint(file_path: str, with_hash: bool = False) -> FileFingerprint:
+    """
+    Compute the fingerprint of a file from its metadata and optionally its content.
+
+    Args:
+        file_path: Path to the file
+        with_hash: If True, also hash the file content (slower but robust to mtime-preserving edits)
+
+    Returns:
+        FileFingerprint: Fingerprint of the current file version
+
+    Raises:
+        OSError: If the file cannot be stat'ed or read
+    """
+    stat = os.stat(file_path)
+    digest = None
+    if with_hash:
+        with open(file_path, 'rb') as f:
+            digest = hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+    return FileFingerprint(mtime_ns=stat.st_mtime_ns, size=stat.st_size, digest=digest)
+
+
+class WorkflowCache:
+    """
+    Persistent on-disk cache of parsed workflows backed by SQLite.
+
+    Entries are keyed by file path and are only returned while the file's
+    fingerprint (mtime, size and optionally content hash) still matches.
+    Workflows are stored pickled; the total payload size is bounded by
+    max_bytes with least-recently-used eviction.
+
+    The SQLite connection is opened lazily per process, so a cache instance
+    can be passed to worker processes of a parallel batch parse. The hits and
+    misses counters are per process.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        max_bytes: int = 1024 * 1024 * 1024,
+        verify_hash: bool = False,
+        commit_interval: int = 256
+    ):
+        """
+        Args:
+            db_path: Path of the SQLite cache file (created if missing)
+            max_bytes: Upper bound on the total size of stored payloads
+            verify_hash: If True, also compare a content hash before returning an entry
+            commit_interval: Number of buffered writes flushed in a single transaction
+        """
+        self.db_path = db_path
+        self.max_bytes = max_bytes
+        self.verify_hash = verify_hash
+        self.commit_interval = commit_interval
+        self.hits = 0
+        self.misses = 0
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+        self._pending_puts: List[Tuple] = []
+        self._pending_touches: List[Tuple[float, str]] = []
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_conn'] = None
+        state['_pid'] = None
+        state['_pending_puts'] = []
+        state['_pending_touches'] = []
+        return state
+
+    def __enter__(self) -> 'WorkflowCache':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _connection(self) -> sqlite3.Connection:
+        # Connections must not be shared across a fork, so reopen in child processes
+        if self._conn is None or self._pid != os.getpid():
+            directory = os.path.dirname(os.path.abspath(self.db_path))
+            os.makedirs(directory, exist_ok=True)
+            self._conn = sqlite3.connect(self.db_path, timeout=30)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS workflows (
+                    path TEXT PRIMARY KEY,
+                    mtime_ns INTEGER NOT NULL,
+                    size INTEGER NOT NULL,
+                    digest TEXT,
+                    payload BLOB NOT NULL,
+                    nbytes INTEGER NOT NULL,
+                    accessed REAL NOT NULL
+                )
+                """
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_workflows_accessed ON workflows (accessed)")
+            self._conn.commit()
+            self._pid = os.getpid()
+        return self._conn
+
+    def fingerprint(self, file_path: str) -> FileFingerprint:
+        """Compute the fingerprint used by this cache for a file."""
+        return file_fingerprint(file_path, with_hash=self.verify_hash)
+
+    def get(self, file_path: str, fingerprint: Optional[FileFingerprint] = None) -> Optional[N8nWorkflow]:
+        """
+        Return the cached workflow for a file if it is still up to date.
+
+        Args:
+            file_path: Path of the workflow file
+            fingerprint: Current fingerprint of the file (computed if None)
+
+        Returns:
+            N8nWorkflow if a matching entry exists, otherwise None
+        """
+        if fingerprint is None:
+            fingerprint = self.fingerprint(file_path)
+
+        conn = self._connection()
+        row = conn.execute(
+            "SELECT mtime_ns, size, digest, payload FROM workflows WHERE path = ?",
+            (file_path,)
+        ).fetchone()
+
+        if row is None or row[0] != fingerprint.mtime_ns or row[1] != fingerprint.size \
+                or (self.verify_hash and row[2] != fingerprint.digest):
+            self.misses += 1
+            return None
+
+        try:
+            workflow = pickle.loads(row[3])
+        except Exception as e:
+            logger.warning(f"Discarding unreadable cache entry for {file_path}: {e}")
+            self.misses += 1
+            return None
+
+        self._pending_touches.append((time.time(), file_path))
+        if len(self._pending_touches) >= self.commit_interval:
+            self.flush()
+        self.hits += 1
+        return workflow
+
+    def put(self, file_path: str, workflow: N8nWorkflow, fingerprint: Optional[FileFingerprint] = None) -> None:
+        """
+        Store a parsed workflow for a file.
+
+        Args:
+            file_path: Path of the workflow file
+            workflow: Parsed workflow to cache
+            fingerprint: Fingerprint of the file version the workflow was parsed from
+                (computed if None; pass the pre-parse fingerprint to avoid races)
+        """
+        if fingerprint is None:
+            fingerprint = self.fingerprint(file_path)
+
+        payload = pickle.dumps(workflow, protocol=PICKLE_PROTOCOL)
+        if len(payload) > self.max_bytes:
+            return
+
+        self._pending_puts.append(
+            (file_path, fingerprint.mtime_ns, fingerprint.size, fingerprint.digest,
+             payload, len(payload), time.time())
+        )
+        if len(self._pending_puts) >= self.commit_interval:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Write buffered entries and access times in a single short transaction.
+
+        Writes are buffered so that concurrent worker processes only hold the
+        SQLite write lock briefly. Eviction runs whenever new entries are flushed.
+        """
+        if not self._pending_puts and not self._pending_touches:
+            return
+
+        conn = self._connection()
+        with conn:
+            if self._pending_touches:
+                conn.executemany("UPDATE workflows SET accessed = ? WHERE path = ?", self._pending_touches)
+            if self._pending_puts:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO workflows (path, mtime_ns, size, digest, payload, nbytes, accessed) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    self._pending_puts
+                )
+                self.evict()
+        self._pending_puts = []
+        self._pending_touches = []
+
+    def evict(self) -> int:
+        """
+        Remove least-recently-used entries until the cache fits in max_bytes.
+
+        Returns:
+            int: Number of evicted entries
+        """
+        conn = self._connection()
+        total = conn.execute("SELECT COALESCE(SUM(nbytes), 0) FROM workflows").fetchone()[0]
+        if total <= self.max_bytes:
+            return 0
+
+        evicted = []
+        for path, nbytes in conn.execute("SELECT path, nbytes FROM workflows ORDER BY accessed"):
+            if total <= self.max_bytes:
+                break
+            evicted.append((path,))
+            total -= nbytes
+
+        conn.executemany("DELETE FROM workflows WHERE path = ?", evicted)
+        logger.debug(f"Evicted {len(evicted)} workflows from cache {self.db_path}")
+        return len(evicted)
+
+    def size_bytes(self) -> int:
+        """Return the total size of stored payloads in bytes."""
+        self.flush()
+        return self._connection().execute("SELECT COALESCE(SUM(nbytes), 0) FROM workflows").fetchone()[0]
+
+    def __len__(self) -> int:
+        self.flush()
+        return self._connection().execute("SELECT COUNT(*) FROM workflows").fetchone()[0]
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        conn = self._connection()
+        with conn:
+            conn.execute("DELETE FROM workflows")
+        self._pending_puts = []
+        self._pending_touches = []
+
+    def close(self) -> None:
+        """Flush buffered writes and close the connection."""
+        if self._conn is not None and self._pid == os.getpid():
+            self.flush()
+            self._conn.close()
+        self._conn = None
+        self._pid = None
+        self._pending_puts = []
+        self._pending_touches = []
@@ -0,0 +1,276 @@
+import logging
+from array import array
+from typing import List, Dict, Iterable, Optional, Sequence
+
+import numpy as np
+
+from .models import N8nWorkflow
+from .parser import parse_workflows_batch
+
+
+# Configure logging for corpus
+logger = logging.getLogger(__name__)
+
+
+class WorkflowCorpus:
+    """
+    Columnar (struct-of-arrays) representation of a parsed workflow corpus.
+
+    Nodes and edges of all workflows are stored in flat NumPy columns so that
+    corpus-wide aggregations are vectorized instead of Python loops over
+    object graphs. Node types are integer-coded through a shared type
+    dictionary (type_names / type_codes).
+
+    Workflow i owns nodes node_offsets[i]:node_offsets[i + 1] and edges
+    edge_offsets[i]:edge_offsets[i + 1]. Edge endpoints are global node
+    indices; connections whose endpoints do not resolve to a node of the
+    same workflow are dropped and counted per workflow in unresolved_counts.
+    """
+
+    def __init__(
+        self,
+        workflow_names: List[str],
+        workflow_ids: List[Optional[str]],
+        file_paths: List[Optional[str]],
+        type_names: List[str],
+        node_offsets: np.ndarray,
+        node_type: np.ndarray,
+        node_type_version: np.ndarray,
+        node_x: np.ndarray,
+        node_y: np.ndarray,
+        edge_offsets: np.ndarray,
+        edge_source: np.ndarray,
+        edge_target: np.ndarray,
+        unresolved_counts: Optional[np.ndarray] = None
+    ):
+        self.workflow_names = workflow_names
+        self.workflow_ids = workflow_ids
+        self.file_paths = file_paths
+        self.type_names = type_names
+        self.type_codes: Dict[str, int] = {name: code for code, name in enumerate(type_names)}
+        self.node_offsets = node_offsets
+        self.node_type = node_type
+        self.node_type_version = node_type_version
+        self.node_x = node_x
+        self.node_y = node_y
+        self.edge_offsets = edge_offsets
+        self.edge_source = edge_source
+        self.edge_target = edge_target
+        self.unresolved_counts = (
+            np.zeros(len(workflow_names), dtype=np.int64) if unresolved_counts is None
+            else np.asarray(unresolved_counts, dtype=np.int64)
+        )
+        # Owning workflow of every node / edge, derived from the offsets
+        self.node_workflow = np.repeat(np.arange(self.n_workflows, dtype=np.int32), np.diff(node_offsets))
+        self.edge_workflow = np.repeat(np.arange(self.n_workflows, dtype=np.int32), np.diff(edge_offsets))
+
+    @classmethod
+    def from_workflows(cls, workflows: Iterable[N8nWorkflow]) -> 'WorkflowCorpus':
+        """
+        Build a corpus from a stream of workflows without retaining the workflow objects.
+
+        Args:
+            workflows: Iterable of parsed workflows (e.g. parse_workflows_batch output)
+
+        Returns:
+            WorkflowCorpus: The columnar corpus
+        """
+        names: List[str] = []
+        ids: List[Optional[str]] = []
+        paths: List[Optional[str]] = []
+        type_names: List[str] = []
+        type_codes: Dict[str, int] = {}
+
+        # Typed stdlib arrays keep the build at a few bytes per value
+        node_offsets = array('q', [0])
+        node_type = array('i')
+        node_type_version = array('i')
+        node_x = array('i')
+        node_y = array('i')
+        edge_offsets = array('q', [0])
+        edge_source = array('q')
+        edge_target = array('q')
+        unresolved_counts = array('q')
+
+        for workflow in workflows:
+            base = len(node_type)
+            unresolved = 0
+            local: Dict[str, int] = {}
+            by_name: Dict[str, int] = {}
+            for i, node in enumerate(workflow.nodes):
+                code = type_codes.get(node.type)
+                if code is None:
+                    code = type_codes[node.type] = len(type_names)
+                    type_names.append(node.type)
+                node_type.append(code)
+                node_type_version.append(node.typeVersion)
+                node_x.append(node.position[0])
+                node_y.append(node.position[1])
+                local.setdefault(node.id, base + i)
+                by_name.setdefault(node.name, base + i)
+
+            for connection in workflow.connections:
+                # n8n exports reference nodes by name; fall back to it when the id is unknown
+                source = local.get(connection.source_node_id, by_name.get(connection.source_node_id))
+                target = local.get(connection.target_node_id, by_name.get(connection.target_node_id))
+                if source is None or target is None:
+                    unresolved += 1
+                    continue
+                edge_source.append(source)
+                edge_target.append(target)
+
+            node_offsets.append(len(node_type))
+            edge_offsets.append(len(edge_source))
+            unresolved_counts.append(unresolved)
+            names.append(workflow.name)
+            ids.append(workflow.id)
+            paths.append(workflow.file_path)
+
+        unresolved = sum(unresolved_counts)
+        if unresolved:
+            logger.warning(f"Dropped {unresolved} connections with unresolved endpoints")
+
+        return cls(
+            workflow_names=names,
+            workflow_ids=ids,
+            file_paths=paths,
+            type_names=type_names,
+            node_offsets=np.frombuffer(node_offsets, dtype=np.int64).copy(),
+            node_type=np.frombuffer(node_type, dtype=np.int32).copy(),
+            node_type_version=np.frombuffer(node_type_version, dtype=np.int32).copy(),
+            node_x=np.frombuffer(node_x, dtype=np.int32).copy(),
+            node_y=np.frombuffer(node_y, dtype=np.int32).copy(),
+            edge_offsets=np.frombuffer(edge_offsets, dtype=np.int64).copy(),
+            edge_source=np.frombuffer(edge_source, dtype=np.int64).copy(),
+            edge_target=np.frombuffer(edge_target, dtype=np.int64).copy(),
+            unresolved_counts=np.frombuffer(unresolved_counts, dtype=np.int64).copy()
+        )
+
+    @classmethod
+    def from_files(cls, file_paths: List[str], **batch_kwargs) -> 'WorkflowCorpus':
+        """
+        Parse workflow files and build a corpus from them.
+
+        Args:
+            file_paths: Paths to JSON workflow files
+            **batch_kwargs: Forwarded to parse_workflows_batch (skip_errors, workers, cache, ...)
+
+        Returns:
+            WorkflowCorpus: The columnar corpus
+        """
+        return cls.from_workflows(parse_workflows_batch(file_paths, **batch_kwargs))
+
+    @property
+    def n_workflows(self) -> int:
+        return len(self.node_offsets) - 1
+
+    @property
+    def n_nodes(self) -> int:
+        return len(self.node_type)
+
+    @property
+    def n_edges(self) -> int:
+        return len(self.edge_source)
+
+    @property
+    def unresolved_edges(self) -> int:
+        """Total number of dropped connections across the corpus."""
+        return int(self.unresolved_counts.sum())
+
+    def __len__(self) -> int:
+        return self.n_workflows
+
+    def type_code(self, node_type: str) -> int:
+        """Return the integer code of a node type, or -1 if it does not occur in the corpus."""
+        return self.type_codes.get(node_type, -1)
+
+    def type_histogram(self) -> Dict[str, int]:
+        """Return the number of nodes of each type across the corpus."""
+        counts = np.bincount(self.node_type, minlength=len(self.type_names))
+        return {name: int(count) for name, count in zip(self.type_names, counts)}
+
+    def workflow_type_support(self) -> Dict[str, int]:
+        """Return the number of workflows containing each node type at least once."""
+        pairs = np.unique(self.node_workflow.astype(np.int64) * len(self.type_names) + self.node_type)
+        counts = np.bincount(pairs % max(len(self.type_names), 1), minlength=len(self.type_names))
+        return {name: int(count) for name, count in zip(self.type_names, counts)}
+
+    def nodes_per_workflow(self) -> np.ndarray:
+        """Return the node count of each workflow."""
+        return np.diff(self.node_offsets)
+
+    def edges_per_workflow(self) -> np.ndarray:
+        """Return the (resolved) connection count of each workflow."""
+        return np.diff(self.edge_offsets)
+
+    def out_degree(self) -> np.ndarray:
+        """Return the out-degree of every node (indexed by global node index)."""
+        return np.bincount(self.edge_source, minlength=self.n_nodes)
+
+    def in_degree(self) -> np.ndarray:
+        """Return the in-degree of every node (indexed by global node index)."""
+        return np.bincount(self.edge_target, minlength=self.n_nodes)
+
+    def workflows_with_types(self, node_types: Sequence[str]) -> np.ndarray:
+        """
+        Return the indices of workflows that contain all of the given node types.
+
+        Args:
+            node_types: Node type names that must all be present
+
+        Returns:
+            np.ndarray: Sorted workflow indices
+        """
+        result = np.arange(self.n_workflows)
+        for node_type in node_types:
+            code = self.type_code(node_type)
+            if code < 0:
+                return np.empty(0, dtype=np.int64)
+            result = np.intersect1d(result, self.node_workflow[self.node_type == code], assume_unique=False)
+        return result
+
+    def select(self, workflow_indices: Sequence[int]) -> 'WorkflowCorpus':
+        """
+        Return a new corpus containing only the given workflows (type dictionary is kept).
+
+        Args:
+            workflow_indices: Indices of the workflows to keep, in the desired order
+
+        Returns:
+            WorkflowCorpus: The filtered corpus
+        """
+        indices = np.asarray(workflow_indices, dtype=np.int64)
+        node_counts = np.diff(self.node_offsets)[indices]
+        edge_counts = np.diff(self.edge_offsets)[indices]
+
+        node_index = _ranges(self.node_offsets[indices], node_counts)
+        edge_index = _ranges(self.edge_offsets[indices], edge_counts)
+
+        new_node_offsets = np.concatenate(([0], np.cumsum(node_counts)))
+        # Shift edge endpoints from the old to the new node numbering, per workflow
+        shift = np.repeat(new_node_offsets[:-1] - self.node_offsets[indices], edge_counts)
+
+        return WorkflowCorpus(
+            workflow_names=[self.workflow_names[i] for i in indices],
+            workflow_ids=[self.workflow_ids[i] for i in indices],
+            file_paths=[self.file_paths[i] for i in indices],
+            type_names=self.type_names,
+            node_offsets=new_node_offsets,
+            node_type=self.node_type[node_index],
+            node_type_version=self.node_type_version[node_index],
+            node_x=self.node_x[node_index],
+            node_y=self.node_y[node_index],
+            edge_offsets=np.concatenate(([0], np.cumsum(edge_counts))),
+            edge_source=self.edge_source[edge_index] + shift,
+            edge_target=self.edge_target[edge_index] + shift,
+            unresolved_counts=self.unresolved_counts[indices]
+        )
+
+
+def _ranges(starts: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    """Concatenate the integer ranges [start, start + count) without a Python loop."""
+    total = int(counts.sum())
+    if total == 0:
+        return np.empty(0, dtype=np.int64)
+    offsets = np.repeat(starts - np.concatenate(([0], np.cumsum(counts)[:-1])), counts)
+    return np.arange(total, dtype=np.int64) + offsets
@@ -0,0 +1,185 @@
+import os
+import json
+import mmap
+import logging
+from typing import Any, Callable, Dict, List, Optional
+
+
+# Configure logging for JSON backends
+logger = logging.getLogger(__name__)
+
+# Environment variable selecting the backend ('auto' or a name from BACKEND_PREFERENCE)
+JSON_BACKEND_ENV = 'N8N_JSON_BACKEND'
+
+# Fastest first; 'auto' picks the first one that is installed
+BACKEND_PREFERENCE = ['orjson', 'simdjson', 'ujson', 'json']
+
+# Files at least this large are decoded from a memory map instead of a copied buffer
+MMAP_THRESHOLD = 1024 * 1024
+
+
+class JsonBackend:
+    """
+    A JSON decoder operating on raw bytes.
+
+    Decode errors are raised as ValueError (or a subclass), whatever the
+    underlying library.
+    """
+
+    def __init__(self, name: str, loads: Callable[[Any], Any], accepts_buffer: bool = False):
+        """
+        Args:
+            name: Backend name
+            loads: Function decoding a bytes object into Python objects
+            accepts_buffer: Whether loads can decode a memoryview (e.g. of an mmap) without copying
+        """
+        self.name = name
+        self.loads = loads
+        self.accepts_buffer = accepts_buffer
+
+    def __repr__(self) -> str:
+        return f"JsonBackend({self.name!r})"
+
+    def load_file(self, file_path: str) -> Any:
+        """
+        Read a file as bytes and decode it.
+
+        Args:
+            file_path: Path to the JSON file
+
+        Returns:
+            The decoded document
+
+        Raises:
+            ValueError: If the content is not valid JSON
+            OSError: If the file cannot be read
+        """
+        with open(file_path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if self.accepts_buffer and size >= MMAP_THRESHOLD:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    with memoryview(mapped) as buffer:
+                        return self.loads(buffer)
+            return self.loads(f.read())
+
+
+def _make_orjson() -> JsonBackend:
+    import orjson
+    return JsonBackend('orjson', orjson.loads, accepts_buffer=True)
+
+
+def _make_simdjson() -> JsonBackend:
+    import simdjson
+
+    def loads(data):
+        try:
+            return simdjson.loads(data)
+        except ValueError:
+            raise
+        except Exception as e:
+            # pysimdjson reports some malformed documents with non-ValueError exceptions
+            raise ValueError(str(e)) from e
+
+    return JsonBackend('simdjson', loads)
+
+
+def _make_ujson() -> JsonBackend:
+    import ujson
+    return JsonBackend('ujson', ujson.loads)
+
+
+def _make_json() -> JsonBackend:
+    return JsonBackend('json', json.loads)
+
+
+_FACTORIES: Dict[str, Callable[[], JsonBackend]] = {
+    'orjson': _make_orjson,
+    'simdjson': _make_simdjson,
+    'ujson': _make_ujson,
+    'json': _make_json,
+}
+
+_backends: Dict[str, Optional[JsonBackend]] = {}
+_selected: Optional[JsonBackend] = None
+
+
+def _load_backend(name: str) -> Optional[JsonBackend]:
+    if name not in _backends:
+        try:
+            _backends[name] = _FACTORIES[name]()
+        except ImportError:
+            _backends[name] = None
+    return _backends[name]
+
+
+def available_backends() -> List[str]:
+    """Return the names of the installed backends, fastest first."""
+    return [name for name in BACKEND_PREFERENCE if _load_backend(name) is not None]
+
+
+def get_json_backend(name: Optional[str] = None) -> JsonBackend:
+    """
+    Return a JSON backend.
+
+    Args:
+        name: Backend name or 'auto'. If None, the backend chosen with
+            set_json_backend() is returned, otherwise the one named by the
+            N8N_JSON_BACKEND environment variable (default 'auto').
+
+    Returns:
+        JsonBackend: The requested backend
+
+    Raises:
+        ValueError: If the name is unknown or the backend is not installed
+    """
+    if name is None:
+        if _selected is not None:
+            return _selected
+        name = os.getenv(JSON_BACKEND_ENV, 'auto')
+
+    if name == 'auto':
+        for candidate in BACKEND_PREFERENCE:
+            backend = _load_backend(candidate)
+            if backend is not None:
+                return backend
+
+    if name not in _FACTORIES:
+        raise ValueError(f"Unknown JSON backend '{name}' (expected 'auto' or one of {BACKEND_PREFERENCE})")
+
+    backend = _load_backend(name)
+    if backend is None:
+        raise ValueError(f"JSON backend '{name}' is not installed")
+    return backend
+
+
+def set_json_backend(name: Optional[str]) -> JsonBackend:
+    """
+    Select the process-wide default backend.
+
+    The choice applies to the current process (and to workers forked from
+    it); set N8N_JSON_BACKEND to configure spawned worker processes too.
+
+    Args:
+        name: Backend name, 'auto', or None to go back to the environment setting
+
+    Returns:
+        JsonBackend: The selected backend (or the environment default for None)
+    """
+    global _selected
+    _selected = None
+    if name is None:
+        return get_json_backend()
+    _selected = get_json_backend(name)
+    logger.debug(f"Using JSON backend '{_selected.name}'")
+    return _selected
+
+
+def load_json_file(file_path: str) -> Any:
+    """
+    Decode a JSON file with the default backend.
+
+    Raises:
+        ValueError: If the content is not valid JSON
+        OSError: If the file cannot be read
+    """
+    return get_json_backend().load_file(file_path)
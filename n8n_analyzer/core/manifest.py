@@ -0,0 +1,221 @@
+import os
+import ujson
+import logging
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Optional
+
+from .cache import FileFingerprint, file_fingerprint
+from .stats import STATUS_COUNTERS, summarize_workflow_file
+
+
+# Configure logging for manifest
+logger = logging.getLogger(__name__)
+
+MANIFEST_VERSION = 1
+
+
+@dataclass
+class ManifestEntry:
+    """Fingerprint and derived aggregates of a single workflow file."""
+    fingerprint: Optional[FileFingerprint]  # None for files that could not be stat'ed
+    status: str  # 'readable_files' or the name of the error counter
+    name: Optional[str] = None
+    nodes: int = 0
+    connections: int = 0
+    node_types: Dict[str, int] = field(default_factory=dict)
+
+
+@dataclass
+class ManifestDiff:
+    """Files that changed between two manifest updates."""
+    added: List[str] = field(default_factory=list)
+    modified: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    unchanged: int = 0
+
+    @property
+    def changed(self) -> int:
+        return len(self.added) + len(self.modified) + len(self.removed)
+
+
+class CorpusManifest:
+    """
+    Incrementally maintained corpus statistics.
+
+    The manifest records each file's fingerprint together with the aggregates
+    it contributes to the corpus totals. On update only added or modified
+    files are summarized again; the contributions of modified and removed
+    files are subtracted, so the totals stay in sync in O(changed files)
+    parsing work (every file is still stat'ed to detect changes).
+    """
+
+    def __init__(self, with_hash: bool = False):
+        """
+        Args:
+            with_hash: If True, fingerprints include a content hash
+        """
+        self.with_hash = with_hash
+        self.entries: Dict[str, ManifestEntry] = {}
+        self.status_counts: Counter = Counter()
+        self.total_nodes = 0
+        self.total_connections = 0
+        self.node_type_counts: Counter = Counter()
+
+    def _add(self, entry: ManifestEntry, sign: int = 1) -> None:
+        self.status_counts[entry.status] += sign
+        self.total_nodes += sign * entry.nodes
+        self.total_connections += sign * entry.connections
+        for node_type, count in entry.node_types.items():
+            self.node_type_counts[node_type] += sign * count
+            if self.node_type_counts[node_type] <= 0:
+                del self.node_type_counts[node_type]
+
+    def _fingerprint(self, file_path: str) -> Optional[FileFingerprint]:
+        try:
+            return file_fingerprint(file_path, with_hash=self.with_hash)
+        except OSError:
+            return None
+
+    def update(self, file_paths: List[str]) -> ManifestDiff:
+        """
+        Bring the manifest in sync with the given set of files.
+
+        Files present in the manifest but absent from file_paths are treated
+        as deleted and their contributions are removed.
+
+        Args:
+            file_paths: Current list of workflow file paths (e.g. from find_workflow_files)
+
+        Returns:
+            ManifestDiff: Added, modified and removed files
+        """
+        diff = ManifestDiff()
+        current = set()
+
+        for file_path in file_paths:
+            current.add(file_path)
+            fingerprint = self._fingerprint(file_path)
+            previous = self.entries.get(file_path)
+
+            if previous is not None:
+                if fingerprint is not None and previous.fingerprint == fingerprint:
+                    diff.unchanged += 1
+                    continue
+                self._add(previous, sign=-1)
+                diff.modified.append(file_path)
+            else:
+                diff.added.append(file_path)
+
+            entry = self._summarize(file_path, fingerprint)
+            self.entries[file_path] = entry
+            self._add(entry)
+
+        for file_path in [path for path in self.entries if path not in current]:
+            self._add(self.entries.pop(file_path), sign=-1)
+            diff.removed.append(file_path)
+
+        logger.info(
+            f"Manifest updated: {len(diff.added)} added, {len(diff.modified)} modified, "
+            f"{len(diff.removed)} removed, {diff.unchanged} unchanged"
+        )
+        return diff
+
+    def _summarize(self, file_path: str, fingerprint: Optional[FileFingerprint]) -> ManifestEntry:
+        status, summary = summarize_workflow_file(file_path)
+        if summary is None:
+            return ManifestEntry(fingerprint=fingerprint, status=status)
+        return ManifestEntry(
+            fingerprint=fingerprint,
+            status=status,
+            name=summary['name'],
+            nodes=summary['nodes'],
+            connections=summary['connections'],
+            node_types=summary['node_types']
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return corpus statistics in the same shape as get_workflow_stats.
+
+        Returns:
+            Dict with the get_workflow_stats keys plus 'node_type_counts'
+        """
+        stats: Dict[str, Any] = {'total_files': len(self.entries)}
+        for status in STATUS_COUNTERS:
+            stats[status] = self.status_counts.get(status, 0)
+        stats['total_nodes'] = self.total_nodes
+        stats['total_connections'] = self.total_connections
+        stats['workflow_names'] = [
+            entry.name for entry in self.entries.values() if entry.status == 'readable_files'
+        ]
+        stats['node_type_counts'] = dict(self.node_type_counts)
+        return stats
+
+    def save(self, manifest_path: str) -> None:
+        """
+        Write the manifest to a JSON file atomically.
+
+        Args:
+            manifest_path: Destination path
+        """
+        entries = {}
+        for file_path, entry in self.entries.items():
+            fingerprint = entry.fingerprint
+            entries[file_path] = {
+                'fingerprint': None if fingerprint is None else [fingerprint.mtime_ns, fingerprint.size, fingerprint.digest],
+                'status': entry.status,
+                'name': entry.name,
+                'nodes': entry.nodes,
+                'connections': entry.connections,
+                'node_types': entry.node_types
+            }
+
+        directory = os.path.dirname(os.path.abspath(manifest_path))
+        os.makedirs(directory, exist_ok=True)
+        temp_path = f"{manifest_path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            ujson.dump({'version': MANIFEST_VERSION, 'with_hash': self.with_hash, 'entries': entries}, f)
+        os.replace(temp_path, manifest_path)
+
+    @classmethod
+    def load(cls, manifest_path: str) -> 'CorpusManifest':
+        """
+        Load a manifest written by save(); totals are rebuilt from the entries.
+
+        Args:
+            manifest_path: Path of the manifest file
+
+        Returns:
+            CorpusManifest: The loaded manifest
+
+        Raises:
+            ValueError: If the manifest has an unsupported version
+        """
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            data = ujson.load(f)
+
+        if data.get('version') != MANIFEST_VERSION:
+            raise ValueError(f"Unsupported manifest version: {data.get('version')}")
+
+        manifest = cls(with_hash=data.get('with_hash', False))
+        for file_path, raw in data['entries'].items():
+            fingerprint = raw['fingerprint']
+            entry = ManifestEntry(
+                fingerprint=None if fingerprint is None else FileFingerprint(*fingerprint),
+                status=raw['status'],
+                name=raw['name'],
+                nodes=raw['nodes'],
+                connections=raw['connections'],
+                node_types=raw['node_types']
+            )
+            manifest.entries[file_path] = entry
+            manifest._add(entry)
+        return manifest
+
+    @classmethod
+    def load_or_create(cls, manifest_path: str, with_hash: bool = False) -> 'CorpusManifest':
+        """Load a manifest if the file exists, otherwise return an empty one."""
+        if os.path.exists(manifest_path):
+            return cls.load(manifest_path)
+        return cls(with_hash=with_hash)
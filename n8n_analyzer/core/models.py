@@ -2,7 +2,8 @@
 from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional, Tuple
 
-@dataclass
+# Models are slotted: at corpus scale the per-instance __dict__ dominates memory.
+@dataclass(slots=True)
 class N8nNode:
     """Represents a single node in an n8n workflow."""
     id: str  # The unique identifier of the node within the workflow (e.g., "SET_ITEM_1")
@@ -13,7 +14,7 @@ class N8nNode:
     parameters: Dict[str, Any] = field(default_factory=dict)
     notes: Optional[str] = None # If 'notesInFlow' is true and notes are present
 
-@dataclass
+@dataclass(slots=True)
 class N8nConnection:
     """Represents a single connection between two nodes in an n8n workflow."""
     source_node_id: str
@@ -21,8 +22,74 @@ class N8nConnection:
     target_node_id: str
     target_node_input_port: str  # e.g., "main", "0", "1" (for different input slots)
 
-@dataclass
-class N8nWorkflow:
+class WorkflowIndex:
+    """
+    Lookup tables over a workflow's nodes and connections.
+
+    Maps node ids and names to nodes and holds the outgoing and incoming
+    connections of every node. Connection endpoints are resolved by node id,
+    falling back to the node name (n8n exports reference nodes by name);
+    unresolved endpoints are kept under their raw reference.
+    """
+    __slots__ = ('nodes', 'connections', 'node_keys', 'connection_keys',
+                 'nodes_by_id', 'nodes_by_name', 'outgoing', 'incoming')
+
+    def __init__(self, nodes: List[N8nNode], connections: List[N8nConnection]):
+        self.nodes = nodes
+        self.connections = connections
+        self.node_keys = _node_keys(nodes)
+        self.connection_keys = _connection_keys(connections)
+        self.nodes_by_id: Dict[str, N8nNode] = {}
+        self.nodes_by_name: Dict[str, N8nNode] = {}
+        for node in nodes:
+            # First occurrence wins, matching a linear scan
+            self.nodes_by_id.setdefault(node.id, node)
+            self.nodes_by_name.setdefault(node.name, node)
+
+        self.outgoing: Dict[str, List[N8nConnection]] = {}
+        self.incoming: Dict[str, List[N8nConnection]] = {}
+        for connection in connections:
+            source = self.resolve(connection.source_node_id)
+            target = self.resolve(connection.target_node_id)
+            self.outgoing.setdefault(source, []).append(connection)
+            self.incoming.setdefault(target, []).append(connection)
+
+    def resolve(self, node_ref: str) -> str:
+        """Return the node id referenced by a connection endpoint (id or name)."""
+        if node_ref in self.nodes_by_id:
+            return node_ref
+        node = self.nodes_by_name.get(node_ref)
+        return node.id if node is not None else node_ref
+
+    def is_current(self, nodes: List[N8nNode], connections: List[N8nConnection]) -> bool:
+        """
+        Check whether the index still describes the given node and connection lists.
+
+        Compares every node's identity, id and name and every connection's
+        identity and endpoints, so replaced lists, appended or swapped items
+        and in-place renames are all detected.
+        """
+        return (self.nodes is nodes and self.connections is connections
+                and self.node_keys == _node_keys(nodes)
+                and self.connection_keys == _connection_keys(connections))
+
+
+def _node_keys(nodes: List[N8nNode]) -> List[Tuple[int, str, str]]:
+    return [(id(node), node.id, node.name) for node in nodes]
+
+
+def _connection_keys(connections: List[N8nConnection]) -> List[Tuple[int, str, str]]:
+    return [(id(connection), connection.source_node_id, connection.target_node_id) for connection in connections]
+
+
+class _IndexSlot:
+    # Holds N8nWorkflow's cached index in a slot outside the dataclass fields,
+    # so fields(), asdict(), repr and equality never see it
+    __slots__ = ('_index',)
+
+
+@dataclass(slots=True)
+class N8nWorkflow(_IndexSlot):
     """Represents an entire n8n workflow."""
     name: str
     nodes: List[N8nNode]
@@ -35,12 +102,50 @@ class N8nWorkflow:
     staticData: Optional[Dict[str, Any]] = field(default_factory=dict) # For 'Workflow static data'
     file_path: Optional[str] = None # Store the path of the file this workflow was loaded from
 
+    def __post_init__(self):
+        self._index = None
+
+    def __getstate__(self):
+        # The lookup index is derived data; rebuild it lazily after unpickling
+        return {name: getattr(self, name) for name in self.__dataclass_fields__}
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+        object.__setattr__(self, '_index', None)
+
+    @property
+    def index(self) -> WorkflowIndex:
+        """
+        Lazily built lookup index over nodes and connections.
+
+        The index is checked against the current nodes and connections on
+        every access and rebuilt when they were replaced, added, removed or
+        edited in place (node ids and names, connection endpoints).
+        """
+        if self._index is None or not self._index.is_current(self.nodes, self.connections):
+            self._index = WorkflowIndex(self.nodes, self.connections)
+        return self._index
+
+    def invalidate_index(self) -> None:
+        """Drop the lookup index so it is rebuilt on next use."""
+        self._index = None
+
     def get_node_by_id(self, node_id: str) -> Optional[N8nNode]:
         """Helper to find a node by its ID."""
-        for node in self.nodes:
-            if node.id == node_id:
-                return node
-        return None
+        return self.index.nodes_by_id.get(node_id)
+
+    def get_node_by_name(self, name: str) -> Optional[N8nNode]:
+        """Helper to find a node by its display name."""
+        return self.index.nodes_by_name.get(name)
+
+    def get_outgoing_connections(self, node_id: str) -> List[N8nConnection]:
+        """Connections leaving the given node."""
+        return self.index.outgoing.get(node_id, [])
+
+    def get_incoming_connections(self, node_id: str) -> List[N8nConnection]:
+        """Connections entering the given node."""
+        return self.index.incoming.get(node_id, [])
 
 if __name__ == '__main__':
     node1 = N8nNode(id="StartNode_1", name="Start", type="n8n-nodes-base.start", typeVersion=1, position=(100, 100))
@@ -0,0 +1,373 @@
+import os
+import json
+import mmap
+import struct
+import logging
+from typing import List, Dict, Any, Generator, Iterable, Optional, Tuple, Union
+
+from .models import N8nWorkflow
+from .json_backend import get_json_backend
+from .parser import WorkflowParseError, build_workflow, _normalize_fields, _handle_batch_error
+
+try:
+    import zstandard
+except ImportError:  # Optional dependency, only needed for compressed archives
+    zstandard = None
+
+
+# Configure logging for packed corpora
+logger = logging.getLogger(__name__)
+
+# Archive layout:
+#   header  MAGIC
+#   records [u32 payload length][u8 flags][payload] ...
+#   index   JSON list of [name, payload offset, payload length, flags]
+#   footer  [u64 index offset][INDEX_MAGIC]
+# Appending truncates the index, writes new records and rewrites index + footer.
+# If the footer is missing (e.g. an interrupted append) the index is rebuilt
+# by scanning the length-prefixed records.
+MAGIC = b"N8NPACK1"
+INDEX_MAGIC = b"N8NIDX01"
+_RECORD_HEADER = struct.Struct('<IB')
+_FOOTER = struct.Struct('<Q8s')
+
+FLAG_ZSTD = 0x01
+
+
+class PackedCorpusError(Exception):
+    """Raised for malformed or unsupported packed corpus archives."""
+    pass
+
+
+def _require_zstandard() -> None:
+    if zstandard is None:
+        raise PackedCorpusError("zstd-compressed archives require the 'zstandard' package")
+
+
+def _read_index(f, file_size: int, archive_path: str) -> Optional[List[List[Any]]]:
+    """
+    Read the index from the footer, or return None if there is no valid footer.
+
+    Raises:
+        PackedCorpusError: If the footer is valid but the index it points to is not
+    """
+    if file_size < len(MAGIC) + _FOOTER.size:
+        return None
+    f.seek(file_size - _FOOTER.size)
+    index_offset, magic = _FOOTER.unpack(f.read(_FOOTER.size))
+    if magic != INDEX_MAGIC or not len(MAGIC) <= index_offset <= file_size - _FOOTER.size:
+        return None
+    f.seek(index_offset)
+    try:
+        # JSONDecodeError and UnicodeDecodeError are both ValueErrors
+        index = json.loads(f.read(file_size - _FOOTER.size - index_offset))
+    except ValueError as e:
+        raise PackedCorpusError(f"Corrupt index in {archive_path}") from e
+    if not isinstance(index, list) or not all(isinstance(entry, list) and len(entry) == 4 for entry in index):
+        raise PackedCorpusError(f"Corrupt index in {archive_path}")
+    return index
+
+
+def _scan_records(buffer, end: int) -> Tuple[List[List[Any]], int]:
+    """
+    Rebuild the index by walking the length-prefixed records.
+
+    Records carry no names, so recovered entries are named by their position.
+
+    Returns:
+        Tuple of (index entries, offset just past the last complete record)
+    """
+    entries = []
+    offset = len(MAGIC)
+    while offset + _RECORD_HEADER.size <= end:
+        length, flags = _RECORD_HEADER.unpack_from(buffer, offset)
+        payload_offset = offset + _RECORD_HEADER.size
+        if payload_offset + length > end:
+            break
+        entries.append([f"record_{len(entries):08d}.json", payload_offset, length, flags])
+        offset = payload_offset + length
+    return entries, offset
+
+
+def pack_workflows(
+    file_paths: Iterable[str],
+    archive_path: str,
+    base_dir: Optional[str] = None,
+    compress: bool = False,
+    compression_level: int = 3,
+    append: bool = False
+) -> int:
+    """
+    Consolidate workflow JSON files into a single packed archive.
+
+    Files are stored as-is (optionally zstd-compressed); they are not parsed
+    or validated, so invalid files surface when the archive is read.
+
+    Args:
+        file_paths: Workflow JSON files to pack
+        archive_path: Destination archive
+        base_dir: Record names are paths relative to this directory (default: the
+            file's basename)
+        compress: If True, compress each record with zstd
+        compression_level: zstd compression level
+        append: If True, add the files to an existing archive instead of overwriting it
+
+    Returns:
+        int: Number of records written
+
+    Raises:
+        PackedCorpusError: If the existing archive is invalid or zstd is unavailable
+    """
+    if compress:
+        _require_zstandard()
+        compressor = zstandard.ZstdCompressor(level=compression_level)
+
+    if append and os.path.exists(archive_path):
+        f = open(archive_path, 'r+b')
+        if f.read(len(MAGIC)) != MAGIC:
+            f.close()
+            raise PackedCorpusError(f"Not a packed corpus archive: {archive_path}")
+        file_size = os.fstat(f.fileno()).st_size
+        try:
+            index = _read_index(f, file_size, archive_path)
+        except PackedCorpusError:
+            f.close()
+            raise
+        if index is None:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                index, end = _scan_records(mapped, file_size)
+        else:
+            f.seek(file_size - _FOOTER.size)
+            end = _FOOTER.unpack(f.read(_FOOTER.size))[0]
+        f.seek(end)
+        f.truncate()
+    else:
+        directory = os.path.dirname(os.path.abspath(archive_path))
+        os.makedirs(directory, exist_ok=True)
+        f = open(archive_path, 'wb')
+        f.write(MAGIC)
+        index = []
+
+    written = 0
+    try:
+        for file_path in file_paths:
+            with open(file_path, 'rb') as source:
+                payload = source.read()
+            flags = 0
+            if compress:
+                payload = compressor.compress(payload)
+                flags |= FLAG_ZSTD
+
+            name = os.path.relpath(file_path, base_dir) if base_dir else os.path.basename(file_path)
+            f.write(_RECORD_HEADER.pack(len(payload), flags))
+            index.append([name, f.tell(), len(payload), flags])
+            f.write(payload)
+            written += 1
+
+        index_offset = f.tell()
+        f.write(json.dumps(index, separators=(',', ':')).encode('utf-8'))
+        f.write(_FOOTER.pack(index_offset, INDEX_MAGIC))
+    finally:
+        f.close()
+
+    logger.info(f"Packed {written} workflows into {archive_path} ({len(index)} records total)")
+    return written
+
+
+class PackedCorpusReader:
+    """
+    Random-access and sequential reader for packed workflow archives.
+
+    The archive is memory-mapped; records are addressed by position or by
+    name. Workflows parsed from an archive get a file_path of the form
+    '<archive path>::<record name>'.
+    """
+
+    def __init__(self, archive_path: str):
+        """
+        Args:
+            archive_path: Path of the packed archive
+
+        Raises:
+            PackedCorpusError: If the file is not a packed corpus archive
+        """
+        self.archive_path = archive_path
+        self._file = open(archive_path, 'rb')
+        try:
+            if self._file.read(len(MAGIC)) != MAGIC:
+                raise PackedCorpusError(f"Not a packed corpus archive: {archive_path}")
+            file_size = os.fstat(self._file.fileno()).st_size
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            index = _read_index(self._file, file_size, archive_path)
+            if index is None:
+                logger.warning(f"Archive {archive_path} has no valid index, rebuilding it from the records")
+                index, _ = _scan_records(self._mmap, file_size)
+        except Exception:
+            self._file.close()
+            raise
+
+        self._entries: List[Tuple[int, int, int]] = [(offset, length, flags) for _, offset, length, flags in index]
+        self.names: List[str] = [entry[0] for entry in index]
+        self._positions: Dict[str, int] = {name: i for i, name in enumerate(self.names)}
+        self._decompressor = None
+
+    def __enter__(self) -> 'PackedCorpusReader':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release the memory map and file handle."""
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._file.close()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._positions
+
+    def _position(self, key: Union[int, str]) -> int:
+        if isinstance(key, str):
+            if key not in self._positions:
+                raise KeyError(f"No record named '{key}' in {self.archive_path}")
+            return self._positions[key]
+        return range(len(self._entries))[key]
+
+    def read_bytes(self, key: Union[int, str]) -> bytes:
+        """
+        Return the raw (decompressed) JSON of a record.
+
+        Args:
+            key: Record position or name
+        """
+        payload = self._payload(self._position(key))
+        if isinstance(payload, memoryview):
+            with payload:
+                return payload.tobytes()
+        return payload
+
+    def _payload(self, position: int) -> Union[bytes, memoryview]:
+        # Uncompressed records are a zero-copy view into the memory map; callers
+        # must drop it before the reader is closed.
+        offset, length, flags = self._entries[position]
+        view = memoryview(self._mmap)[offset:offset + length]
+        if flags & FLAG_ZSTD:
+            _require_zstandard()
+            if self._decompressor is None:
+                self._decompressor = zstandard.ZstdDecompressor()
+            return self._decompressor.decompressobj().decompress(view)
+        return view
+
+    def parse(self, key: Union[int, str], fields: Optional[Iterable[str]] = None) -> N8nWorkflow:
+        """
+        Parse a record into an N8nWorkflow.
+
+        Args:
+            key: Record position or name
+            fields: Optional field projection (see parse_single_workflow)
+
+        Raises:
+            WorkflowParseError: If the record is not a valid workflow
+        """
+        position = self._position(key)
+        return self._parse_position(position, _normalize_fields(fields))
+
+    def _parse_position(self, position: int, fields) -> N8nWorkflow:
+        source = f"{self.archive_path}::{self.names[position]}"
+        backend = get_json_backend()
+        try:
+            raw = self._payload(position)
+            try:
+                data = backend.loads(raw if backend.accepts_buffer else bytes(raw))
+            except ValueError as e:
+                raise WorkflowParseError("Invalid JSON format", source, e)
+            finally:
+                # Release the view now; a traceback holding it would keep the map from closing
+                if isinstance(raw, memoryview):
+                    raw.release()
+            return build_workflow(data, source, fields)
+        except WorkflowParseError:
+            raise
+        except Exception as e:
+            raise WorkflowParseError("Unexpected error during parsing", source, e)
+
+    def iter_raw(self) -> Generator[Tuple[str, bytes], None, None]:
+        """Yield (name, raw JSON bytes) for every record in archive order."""
+        for position, name in enumerate(self.names):
+            yield name, self.read_bytes(position)
+
+    def iter_workflows(
+        self,
+        skip_errors: bool = False,
+        fields: Optional[Iterable[str]] = None
+    ) -> Generator[N8nWorkflow, None, None]:
+        """
+        Parse every record in archive order (sequential reads through the memory map).
+
+        Args:
+            skip_errors: If True, skip records that can't be parsed; if False, raise on first error
+            fields: Optional field projection (see parse_single_workflow)
+
+        Yields:
+            N8nWorkflow: Parsed workflow objects one at a time
+        """
+        fields = _normalize_fields(fields)
+        for position in range(len(self._entries)):
+            try:
+                workflow = self._parse_position(position, fields)
+            except WorkflowParseError as e:
+                _handle_batch_error(e, skip_errors)
+                continue
+            yield workflow
+
+
+def parse_packed_workflows(
+    archive_path: str,
+    skip_errors: bool = False,
+    fields: Optional[Iterable[str]] = None
+) -> Generator[N8nWorkflow, None, None]:
+    """
+    Stream the workflows of a packed archive, like parse_workflows_batch does for files.
+
+    Args:
+        archive_path: Path of the packed archive
+        skip_errors: If True, skip records that can't be parsed; if False, raise on first error
+        fields: Optional field projection (see parse_single_workflow)
+
+    Yields:
+        N8nWorkflow: Parsed workflow objects one at a time
+    """
+    with PackedCorpusReader(archive_path) as reader:
+        yield from reader.iter_workflows(skip_errors=skip_errors, fields=fields)
+
+
+def unpack_workflows(archive_path: str, output_dir: str) -> int:
+    """
+    Extract every record of a packed archive back into individual JSON files.
+
+    Args:
+        archive_path: Path of the packed archive
+        output_dir: Directory to write the files into (record names are relative paths)
+
+    Returns:
+        int: Number of files written
+
+    Raises:
+        PackedCorpusError: If a record name would escape output_dir
+    """
+    root = os.path.abspath(output_dir)
+    written = 0
+    with PackedCorpusReader(archive_path) as reader:
+        for name, payload in reader.iter_raw():
+            target = os.path.abspath(os.path.join(root, name))
+            if os.path.commonpath([root, target]) != root:
+                raise PackedCorpusError(f"Record name escapes the output directory: {name}")
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            with open(target, 'wb') as f:
+                f.write(payload)
+            written += 1
+    return written
@@ -1,19 +1,37 @@
 import os
+import sys
 import ujson
 import logging
-from typing import List, Dict, Any, Generator, Optional, Tuple
+import itertools
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, FIRST_COMPLETED, wait
+from typing import List, Dict, Any, FrozenSet, Generator, Iterable, Optional, Tuple
 from pathlib import Path
 
 from .models import N8nWorkflow, N8nNode, N8nConnection
+from .cache import WorkflowCache
+from .json_backend import load_json_file
+from .stats import WorkflowStatsAccumulator, accumulate_stats
 
 
 # Configure logging for parser
 logger = logging.getLogger(__name__)
 
+# Fields that can be selected with the `fields` projection. Node id, name and
+# type, and the workflow name/id/active flag, are always parsed.
+PROJECTABLE_FIELDS = frozenset({
+    'typeVersion', 'position', 'parameters', 'notes',  # node fields
+    'connections', 'tags', 'settings', 'meta', 'staticData'  # workflow fields
+})
+
+# Projection for type-level scans: node identity plus the connection graph
+HEADER_FIELDS = frozenset({'connections'})
+
 
 class WorkflowParseError(Exception):
     """Custom exception for workflow parsing errors."""
     def __init__(self, message: str, file_path: Optional[str] = None, original_error: Optional[Exception] = None):
+        self.message = message
         self.file_path = file_path
         self.original_error = original_error
         
@@ -25,14 +43,30 @@ class WorkflowParseError(Exception):
             error_msg += f" (Original error: {str(original_error)})"
         
         super().__init__(error_msg)
+    
+    def __reduce__(self):
+        # Rebuild from the original arguments so errors raised in worker
+        # processes keep their file_path/original_error when unpickled.
+        return (self.__class__, (self.message, self.file_path, self.original_error))
 
 
-def parse_single_workflow(file_path: str) -> N8nWorkflow:
+def parse_single_workflow(
+    file_path: str, 
+    cache: Optional[WorkflowCache] = None,
+    fields: Optional[Iterable[str]] = None
+) -> N8nWorkflow:
     """
     Parse a single n8n workflow JSON file into an N8nWorkflow object.
     
     Args:
         file_path: Path to the JSON workflow file
+        cache: Optional persistent cache; an up-to-date entry is returned without
+            reading the JSON, and freshly parsed workflows are stored in it
+        fields: Optional projection, a subset of PROJECTABLE_FIELDS (e.g. HEADER_FIELDS).
+            Fields not selected are left at their defaults (typeVersion 0,
+            position (0, 0), empty dicts/lists, None) and are not validated.
+            Projected workflows are never written to the cache; a cached full
+            workflow is projected the same way before it is returned.
         
     Returns:
         N8nWorkflow: Parsed workflow object
@@ -40,51 +74,30 @@ def parse_single_workflow(file_path: str) -> N8nWorkflow:
     Raises:
         WorkflowParseError: If file cannot be read or parsed
     """
+    fields = _normalize_fields(fields)
     try:
         # Check if file exists
         if not os.path.exists(file_path):
             raise WorkflowParseError("File not found", file_path)
         
-        # Read and parse JSON
-        with open(file_path, 'r', encoding='utf-8') as f:
-            try:
-                data = ujson.load(f)
-            except ujson.JSONDecodeError as e:
-                raise WorkflowParseError("Invalid JSON format", file_path, e)
-        
-        # Validate required fields
-        if not isinstance(data, dict):
-            raise WorkflowParseError("JSON root must be an object", file_path)
-        
-        if 'name' not in data:
-            raise WorkflowParseError("Missing required field 'name'", file_path)
-        
-        if 'nodes' not in data:
-            raise WorkflowParseError("Missing required field 'nodes'", file_path)
-        
-        if 'connections' not in data:
-            raise WorkflowParseError("Missing required field 'connections'", file_path)
+        if cache is not None:
+            # Fingerprint before reading so a concurrent edit invalidates the entry
+            fingerprint = cache.fingerprint(file_path)
+            cached = cache.get(file_path, fingerprint)
+            if cached is not None:
+                logger.debug(f"Loaded workflow '{cached.name}' for {file_path} from cache")
+                return _project_workflow(cached, fields) if fields is not None else cached
         
-        # Parse nodes and connections
+        # Read and parse JSON
         try:
-            nodes = _parse_nodes(data['nodes'])
-            connections = _parse_connections(data['connections'])
-        except Exception as e:
-            raise WorkflowParseError("Error parsing workflow structure", file_path, e)
+            data = load_json_file(file_path)
+        except ValueError as e:
+            raise WorkflowParseError("Invalid JSON format", file_path, e)
+        
+        workflow = build_workflow(data, file_path, fields)
         
-        # Create workflow object
-        workflow = N8nWorkflow(
-            name=data['name'],
-            nodes=nodes,
-            connections=connections,
-            id=data.get('id'),
-            active=data.get('active'),
-            tags=data.get('tags', {}),
-            settings=data.get('settings', {}),
-            meta=data.get('meta', {}),
-            staticData=data.get('staticData', {}),
-            file_path=file_path
-        )
+        if cache is not None and fields is None:
+            cache.put(file_path, workflow, fingerprint)
         
         logger.debug(f"Successfully parsed workflow '{workflow.name}' from {file_path}")
         return workflow
@@ -95,16 +108,142 @@ def parse_single_workflow(file_path: str) -> N8nWorkflow:
         raise WorkflowParseError("Unexpected error during parsing", file_path, e)
 
 
+def build_workflow(
+    data: Any, 
+    file_path: Optional[str] = None, 
+    fields: Optional[FrozenSet[str]] = None
+) -> N8nWorkflow:
+    """
+    Validate decoded workflow JSON and build an N8nWorkflow from it.
+    
+    Args:
+        data: Decoded JSON document
+        file_path: Source of the document, used for error messages and stored on the workflow
+        fields: Optional projection (see parse_single_workflow)
+        
+    Returns:
+        N8nWorkflow: Parsed workflow object
+        
+    Raises:
+        WorkflowParseError: If the document is not a valid workflow
+    """
+    # Validate required fields
+    if not isinstance(data, dict):
+        raise WorkflowParseError("JSON root must be an object", file_path)
+    
+    if 'name' not in data:
+        raise WorkflowParseError("Missing required field 'name'", file_path)
+    
+    if 'nodes' not in data:
+        raise WorkflowParseError("Missing required field 'nodes'", file_path)
+    
+    if 'connections' not in data:
+        raise WorkflowParseError("Missing required field 'connections'", file_path)
+    
+    def selected(name: str) -> bool:
+        return fields is None or name in fields
+    
+    # Parse nodes and connections
+    try:
+        nodes = _parse_nodes(data['nodes'], fields)
+        connections = _parse_connections(data['connections']) if selected('connections') else []
+    except Exception as e:
+        raise WorkflowParseError("Error parsing workflow structure", file_path, e)
+    
+    # Create workflow object
+    return N8nWorkflow(
+        name=data['name'],
+        nodes=nodes,
+        connections=connections,
+        id=data.get('id'),
+        active=data.get('active'),
+        tags=data.get('tags', {}) if selected('tags') else {},
+        settings=data.get('settings', {}) if selected('settings') else {},
+        meta=data.get('meta', {}) if selected('meta') else {},
+        staticData=data.get('staticData', {}) if selected('staticData') else {},
+        file_path=file_path
+    )
+
+
+def _project_workflow(workflow: N8nWorkflow, fields: FrozenSet[str]) -> N8nWorkflow:
+    """
+    Reset the fields of a fully parsed workflow that a projection leaves out.
+    
+    The result matches build_workflow with the same projection, so a cached
+    workflow and a fresh projected parse are interchangeable. The workflow
+    is modified in place and returned.
+    """
+    for node in workflow.nodes:
+        if 'typeVersion' not in fields:
+            node.typeVersion = 0
+        if 'position' not in fields:
+            node.position = (0, 0)
+        if 'parameters' not in fields:
+            node.parameters = {}
+        if 'notes' not in fields:
+            node.notes = None
+    if 'connections' not in fields:
+        workflow.connections = []
+    for name in ('tags', 'settings', 'meta', 'staticData'):
+        if name not in fields:
+            setattr(workflow, name, {})
+    return workflow
+
+
+def _normalize_fields(fields: Optional[Iterable[str]]) -> Optional[FrozenSet[str]]:
+    """
+    Validate a field projection.
+    
+    Args:
+        fields: Requested fields, or None for a full parse
+        
+    Returns:
+        Frozen set of fields, or None for a full parse
+        
+    Raises:
+        ValueError: If an unknown field is requested
+    """
+    if fields is None:
+        return None
+    # Identity fields are always parsed, so requesting them is a no-op
+    fields = frozenset(fields) - {'id', 'name', 'type'}
+    unknown = fields - PROJECTABLE_FIELDS
+    if unknown:
+        raise ValueError(f"Unknown workflow fields in projection: {sorted(unknown)}")
+    return fields
+
+
 def parse_workflows_batch(
     file_paths: List[str], 
-    skip_errors: bool = False
+    skip_errors: bool = False,
+    workers: Optional[int] = None,
+    executor: Optional[Executor] = None,
+    ordered: bool = True,
+    chunksize: Optional[int] = None,
+    cache: Optional[WorkflowCache] = None,
+    fields: Optional[Iterable[str]] = None
 ) -> Generator[N8nWorkflow, None, None]:
     """
     Memory-efficient batch parsing of multiple workflow files using generators.
     
+    By default files are parsed sequentially in the calling process. Passing
+    ``workers`` (or an existing ``executor``) splits the file paths into chunks
+    that are parsed in a process pool; only a bounded number of chunks is kept
+    in flight so results are still streamed rather than accumulated.
+    
     Args:
         file_paths: List of paths to JSON workflow files
         skip_errors: If True, skip files that can't be parsed; if False, raise on first error
+        workers: Number of worker processes; None or 1 parses in the calling process.
+            With an executor it is the parallelism assumed when sizing chunks and
+            the in-flight window (os.cpu_count() if None)
+        executor: Optional existing executor to dispatch chunks to (not shut down by this function)
+        ordered: If True, yield workflows in the order of file_paths; if False, yield
+            chunks as soon as they complete
+        chunksize: Number of files per dispatched chunk (derived from the file count if None)
+        cache: Optional persistent cache consulted before parsing each file; it is
+            shared with worker processes, which open their own connection to it
+        fields: Optional field projection applied to every workflow (see parse_single_workflow)
         
     Yields:
         N8nWorkflow: Parsed workflow objects one at a time
@@ -112,32 +251,175 @@ def parse_workflows_batch(
     Raises:
         WorkflowParseError: If skip_errors=False and any file fails to parse
     """
-    for file_path in file_paths:
+    fields = _normalize_fields(fields)
+    if executor is None and (workers is None or workers <= 1):
         try:
-            workflow = parse_single_workflow(file_path)
-            yield workflow
-            
-        except WorkflowParseError as e:
-            if skip_errors:
-                logger.warning(f"Skipping file due to parse error: {e}")
-                continue
-            else:
-                raise
-        except Exception as e:
-            error = WorkflowParseError("Unexpected error during batch parsing", file_path, e)
-            if skip_errors:
-                logger.warning(f"Skipping file due to unexpected error: {error}")
-                continue
+            for file_path in file_paths:
+                workflow, error = _parse_for_batch(file_path, cache, fields)
+                if error is not None:
+                    _handle_batch_error(error, skip_errors)
+                    continue
+                yield workflow
+        finally:
+            if cache is not None:
+                cache.flush()
+        return
+    
+    file_paths = list(file_paths)
+    owns_executor = executor is None
+    if owns_executor:
+        executor = ProcessPoolExecutor(max_workers=workers)
+    max_workers = workers or os.cpu_count() or 1
+    
+    if chunksize is None:
+        chunksize = _default_chunksize(len(file_paths), max_workers)
+    chunks = (
+        file_paths[start:start + chunksize]
+        for start in range(0, len(file_paths), chunksize)
+    )
+    # Keep a couple of chunks queued per worker so workers never starve while
+    # the consumer is still processing earlier results.
+    max_in_flight = max_workers * 2
+    
+    pending = deque()
+    try:
+        for chunk in itertools.islice(chunks, max_in_flight):
+            pending.append(executor.submit(_parse_chunk, chunk, skip_errors, cache, fields))
+        
+        while pending:
+            if ordered:
+                future = pending.popleft()
             else:
-                raise error
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                future = done.pop()
+                pending.remove(future)
+            
+            results = future.result()
+            
+            next_chunk = next(chunks, None)
+            if next_chunk is not None:
+                pending.append(executor.submit(_parse_chunk, next_chunk, skip_errors, cache, fields))
+            
+            for workflow, error in results:
+                if error is not None:
+                    _handle_batch_error(error, skip_errors)
+                    continue
+                yield workflow
+    finally:
+        for future in pending:
+            future.cancel()
+        if owns_executor:
+            executor.shutdown(wait=True, cancel_futures=True)
 
 
-def _parse_nodes(nodes_data: List[Dict[str, Any]]) -> List[N8nNode]:
+def _parse_for_batch(
+    file_path: str, 
+    cache: Optional[WorkflowCache] = None,
+    fields: Optional[FrozenSet[str]] = None
+) -> Tuple[Optional[N8nWorkflow], Optional[WorkflowParseError]]:
+    """
+    Parse a single file for batch processing, returning the error instead of raising it.
+    
+    Args:
+        file_path: Path to the JSON workflow file
+        cache: Optional persistent workflow cache
+        fields: Optional field projection
+        
+    Returns:
+        Tuple of (workflow, None) on success or (None, error) on failure
+    """
+    try:
+        return parse_single_workflow(file_path, cache, fields), None
+    except WorkflowParseError as e:
+        return None, e
+    except Exception as e:
+        return None, WorkflowParseError("Unexpected error during batch parsing", file_path, e)
+
+
+def _parse_chunk(
+    file_paths: List[str], 
+    skip_errors: bool,
+    cache: Optional[WorkflowCache] = None,
+    fields: Optional[FrozenSet[str]] = None
+) -> List[Tuple[Optional[N8nWorkflow], Optional[WorkflowParseError]]]:
+    """
+    Parse a chunk of files inside a worker process.
+    
+    When skip_errors is False the chunk stops at the first failure, since the
+    consumer will raise on it and never look at the remaining files.
+    
+    Args:
+        file_paths: Paths of the files in this chunk
+        skip_errors: Batch error mode, used to stop early on the first error
+        cache: Optional persistent workflow cache, flushed before returning
+        fields: Optional field projection
+        
+    Returns:
+        List of (workflow, error) tuples in the order of file_paths
+    """
+    results = []
+    for file_path in file_paths:
+        workflow, error = _parse_for_batch(file_path, cache, fields)
+        results.append((workflow, error))
+        if error is not None and not skip_errors:
+            break
+    if cache is not None:
+        cache.flush()
+    return results
+
+
+def _handle_batch_error(error: WorkflowParseError, skip_errors: bool) -> None:
+    """
+    Apply the batch error policy to a parse error.
+    
+    Args:
+        error: The error raised while parsing a file
+        skip_errors: If True, log and continue; if False, re-raise
+        
+    Raises:
+        WorkflowParseError: If skip_errors is False
+    """
+    if not skip_errors:
+        raise error
+    logger.warning(f"Skipping file due to parse error: {error}")
+
+
+def _default_chunksize(total_files: int, workers: int) -> int:
+    """
+    Pick a chunk size that amortizes inter-process overhead while keeping load balanced.
+    
+    Aims for roughly four chunks per worker, bounded to [1, 256] files per chunk.
+    
+    Args:
+        total_files: Number of files to dispatch
+        workers: Number of worker processes
+        
+    Returns:
+        int: Files per chunk
+    """
+    return max(1, min(256, total_files // (workers * 4) or 1))
+
+
+def _intern(value: Any) -> Any:
+    """
+    Intern repeated strings (node types, ids, port names) so equal values share one object.
+    
+    Node ids are interned so connection endpoints share the node's id string.
+    Non-string values are returned unchanged.
+    """
+    return sys.intern(value) if type(value) is str else value
+
+
+def _parse_nodes(
+    nodes_data: List[Dict[str, Any]], 
+    fields: Optional[FrozenSet[str]] = None
+) -> List[N8nNode]:
     """
     Parse node data from JSON into N8nNode objects.
     
     Args:
         nodes_data: List of node dictionaries from JSON
+        fields: Optional projection; unselected node fields are skipped
         
     Returns:
         List[N8nNode]: List of parsed node objects
@@ -147,30 +429,41 @@ def _parse_nodes(nodes_data: List[Dict[str, Any]]) -> List[N8nNode]:
     """
     nodes = []
     
+    with_type_version = fields is None or 'typeVersion' in fields
+    with_position = fields is None or 'position' in fields
+    with_parameters = fields is None or 'parameters' in fields
+    with_notes = fields is None or 'notes' in fields
+    required_fields = ['id', 'name', 'type']
+    if with_type_version:
+        required_fields.append('typeVersion')
+    if with_position:
+        required_fields.append('position')
+    
     for node_data in nodes_data:
         try:
             # Validate required fields
-            required_fields = ['id', 'name', 'type', 'typeVersion', 'position']
             for field in required_fields:
                 if field not in node_data:
                     raise ValueError(f"Node missing required field '{field}': {node_data}")
             
             # Parse position - handle both list and tuple formats
-            position = node_data['position']
-            if isinstance(position, (list, tuple)) and len(position) >= 2:
-                position_tuple = (int(position[0]), int(position[1]))
-            else:
-                raise ValueError(f"Invalid position format: {position}")
+            position_tuple = (0, 0)
+            if with_position:
+                position = node_data['position']
+                if isinstance(position, (list, tuple)) and len(position) >= 2:
+                    position_tuple = (int(position[0]), int(position[1]))
+                else:
+                    raise ValueError(f"Invalid position format: {position}")
             
             # Create node object
             node = N8nNode(
-                id=node_data['id'],
+                id=_intern(node_data['id']),
                 name=node_data['name'],
-                type=node_data['type'],
-                typeVersion=int(node_data['typeVersion']),
+                type=_intern(node_data['type']),
+                typeVersion=int(node_data['typeVersion']) if with_type_version else 0,
                 position=position_tuple,
-                parameters=node_data.get('parameters', {}),
-                notes=node_data.get('notes')
+                parameters=node_data.get('parameters', {}) if with_parameters else {},
+                notes=node_data.get('notes') if with_notes else None
             )
             
             nodes.append(node)
@@ -235,10 +528,10 @@ def _parse_connections(connections_data: Dict[str, Any]) -> List[N8nConnection]:
                         target_input_port = 'main' if target_index == 0 else str(target_index)
                         
                         connection = N8nConnection(
-                            source_node_id=source_node_id,
-                            source_node_output_port=output_port,
-                            target_node_id=target_node_id,
-                            target_node_input_port=target_input_port
+                            source_node_id=_intern(source_node_id),
+                            source_node_output_port=_intern(output_port),
+                            target_node_id=_intern(target_node_id),
+                            target_node_input_port=_intern(target_input_port)
                         )
                         
                         connections.append(connection)
@@ -281,58 +574,65 @@ def find_workflow_files(directory: str, recursive: bool = True) -> List[str]:
     return [str(f) for f in json_files]
 
 
-def get_workflow_stats(file_paths: List[str]) -> Dict[str, Any]:
+def get_workflow_stats(
+    file_paths: List[str],
+    max_names: Optional[int] = None,
+    workers: Optional[int] = None,
+    executor: Optional[Executor] = None,
+    chunksize: Optional[int] = None,
+    slowest: int = 10,
+    seed: Optional[int] = None
+) -> Dict[str, Any]:
     """
     Get basic statistics about a collection of workflow files without fully parsing them.
     Useful for large datasets where you want to get an overview first.
     
+    Files are processed in a single pass. With ``workers`` (or an ``executor``)
+    the files are split into shards whose partial statistics are computed in a
+    process pool and merged.
+    
     Args:
         file_paths: List of workflow file paths
+        max_names: Bound on the returned workflow_names (None keeps all, 0 keeps
+            none, otherwise a uniform reservoir sample of that size)
+        workers: Number of worker processes; None or 1 runs in the calling process.
+            With an executor it is the parallelism assumed when sizing shards
+            (os.cpu_count() if None)
+        executor: Optional existing executor to dispatch shards to (not shut down by this function)
+        chunksize: Number of files per shard (derived from the file count if None)
+        slowest: Number of slowest files reported in file_timing
+        seed: Seed for the workflow name reservoir sample
         
     Returns:
-        Dict with statistics: total_files, readable_files, parse_errors, etc.
+        Dict with statistics: total_files, readable_files, parse_errors, etc.,
+        plus per-file timing percentiles under 'file_timing'
     """
-    stats = {
-        'total_files': len(file_paths),
-        'readable_files': 0,
-        'parse_errors': 0,
-        'missing_files': 0,
-        'invalid_json': 0,
-        'missing_required_fields': 0,
-        'total_nodes': 0,
-        'total_connections': 0,
-        'workflow_names': []
-    }
+    if executor is None and (workers is None or workers <= 1):
+        return accumulate_stats(file_paths, max_names=max_names, slowest=slowest, seed=seed).result()
     
-    for file_path in file_paths:
-        try:
-            if not os.path.exists(file_path):
-                stats['missing_files'] += 1
-                continue
-                
-            with open(file_path, 'r', encoding='utf-8') as f:
-                try:
-                    data = ujson.load(f)
-                except ujson.JSONDecodeError:
-                    stats['invalid_json'] += 1
-                    continue
-            
-            # Check required fields
-            if not all(field in data for field in ['name', 'nodes', 'connections']):
-                stats['missing_required_fields'] += 1
-                continue
-            
-            stats['readable_files'] += 1
-            stats['total_nodes'] += len(data.get('nodes', []))
-            stats['total_connections'] += sum(
-                len(connections) for connections in data.get('connections', {}).values()
-            )
-            stats['workflow_names'].append(data['name'])
-            
-        except Exception:
-            stats['parse_errors'] += 1
+    file_paths = list(file_paths)
+    owns_executor = executor is None
+    if owns_executor:
+        executor = ProcessPoolExecutor(max_workers=workers)
+    max_workers = workers or os.cpu_count() or 1
+    
+    if chunksize is None:
+        chunksize = _default_chunksize(len(file_paths), max_workers)
+    shards = [file_paths[start:start + chunksize] for start in range(0, len(file_paths), chunksize)]
+    seeds = [None if seed is None else seed + i for i in range(len(shards))]
+    
+    accumulator = WorkflowStatsAccumulator(max_names=max_names, slowest=slowest, seed=seed)
+    try:
+        for partial in executor.map(
+            accumulate_stats, shards, 
+            itertools.repeat(max_names), itertools.repeat(slowest), seeds
+        ):
+            accumulator.merge(partial)
+    finally:
+        if owns_executor:
+            executor.shutdown(wait=True, cancel_futures=True)
     
-    return stats
+    return accumulator.result()
 
 
 # Example usage and testing
@@ -0,0 +1,272 @@
+import os
+import math
+import time
+import heapq
+import random
+from typing import List, Dict, Any, Optional, Tuple
+
+from .json_backend import load_json_file
+
+
+# Error counters reported by summarize_workflow_file, in get_workflow_stats order
+STATUS_COUNTERS = ['readable_files', 'parse_errors', 'missing_files', 'invalid_json', 'missing_required_fields']
+
+# Per-file timings are kept in log-scale buckets (~9% wide) starting at 1 microsecond,
+# so percentiles are mergeable across shards and memory stays constant.
+_TIMING_BASE = 1e-6
+_TIMING_BUCKETS_PER_OCTAVE = 8
+
+
+def summarize_workflow_file(file_path: str) -> Tuple[str, Optional[Dict[str, Any]]]:
+    """
+    Compute the per-workflow aggregates used by corpus statistics from the raw JSON.
+    
+    Args:
+        file_path: Path to the JSON workflow file
+        
+    Returns:
+        Tuple of (status, summary). status is 'readable_files' on success, otherwise
+        the name of the error counter ('missing_files', 'invalid_json',
+        'missing_required_fields' or 'parse_errors') and summary is None.
+        The summary holds 'name', 'nodes', 'connections' and a 'node_types'
+        histogram mapping node type to count.
+    """
+    try:
+        if not os.path.exists(file_path):
+            return 'missing_files', None
+            
+        try:
+            data = load_json_file(file_path)
+        except ValueError:
+            return 'invalid_json', None
+        
+        # Check required fields
+        if not all(field in data for field in ['name', 'nodes', 'connections']):
+            return 'missing_required_fields', None
+        
+        node_types: Dict[str, int] = {}
+        for node in data.get('nodes', []):
+            node_type = node.get('type') if isinstance(node, dict) else None
+            if node_type is not None:
+                node_types[node_type] = node_types.get(node_type, 0) + 1
+        
+        return 'readable_files', {
+            'name': data['name'],
+            'nodes': len(data.get('nodes', [])),
+            'connections': sum(
+                len(connections) for connections in data.get('connections', {}).values()
+            ),
+            'node_types': node_types
+        }
+        
+    except Exception:
+        return 'parse_errors', None
+
+
+class WorkflowStatsAccumulator:
+    """
+    Mergeable single-pass accumulator for corpus statistics.
+
+    Each shard of files can be accumulated independently (e.g. in a worker
+    process) and the partial results combined with merge(). Workflow names
+    are either all kept (max_names=None), dropped (max_names=0) or reservoir
+    sampled to at most max_names entries. Per-file processing times are
+    tracked in a log-scale histogram for percentiles, together with the
+    slowest files.
+    """
+
+    def __init__(self, max_names: Optional[int] = None, slowest: int = 10, seed: Optional[int] = None):
+        """
+        Args:
+            max_names: Bound on retained workflow names (None keeps all, 0 keeps none)
+            slowest: Number of slowest files to report
+            seed: Seed for the reservoir sample
+        """
+        self.max_names = max_names
+        self.slowest = slowest
+        self.counts: Dict[str, int] = {status: 0 for status in STATUS_COUNTERS}
+        self.total_files = 0
+        self.total_nodes = 0
+        self.total_connections = 0
+        self.names: List[str] = []
+        self.names_seen = 0
+        self.timing_buckets: Dict[int, int] = {}
+        self.timing_total = 0.0
+        self.timing_max = 0.0
+        self.slowest_files: List[Tuple[float, str]] = []  # min-heap of (seconds, path)
+        self._random = random.Random(seed)
+
+    def add_file(self, file_path: str) -> None:
+        """Summarize a workflow file and add it, recording how long it took."""
+        start = time.perf_counter()
+        status, summary = summarize_workflow_file(file_path)
+        self.add(status, summary, time.perf_counter() - start, file_path)
+
+    def add(self, status: str, summary: Optional[Dict[str, Any]], elapsed: float, file_path: str) -> None:
+        """
+        Add the summary of a single file.
+
+        Args:
+            status: Status returned by summarize_workflow_file
+            summary: Summary returned by summarize_workflow_file (None on error)
+            elapsed: Seconds spent on the file
+            file_path: Path of the file
+        """
+        self.total_files += 1
+        self.counts[status] += 1
+        self._add_timing(elapsed, file_path)
+        if summary is None:
+            return
+        self.total_nodes += summary['nodes']
+        self.total_connections += summary['connections']
+        self._add_name(summary['name'])
+
+    def _add_name(self, name: str) -> None:
+        self.names_seen += 1
+        if self.max_names is None or len(self.names) < self.max_names:
+            self.names.append(name)
+        elif self.max_names > 0:
+            # Algorithm R: keep the new name with probability max_names / names_seen
+            slot = self._random.randrange(self.names_seen)
+            if slot < self.max_names:
+                self.names[slot] = name
+
+    def _add_timing(self, elapsed: float, file_path: str) -> None:
+        bucket = _timing_bucket(elapsed)
+        self.timing_buckets[bucket] = self.timing_buckets.get(bucket, 0) + 1
+        self.timing_total += elapsed
+        self.timing_max = max(self.timing_max, elapsed)
+        if self.slowest > 0:
+            if len(self.slowest_files) < self.slowest:
+                heapq.heappush(self.slowest_files, (elapsed, file_path))
+            elif elapsed > self.slowest_files[0][0]:
+                heapq.heapreplace(self.slowest_files, (elapsed, file_path))
+
+    def merge(self, other: 'WorkflowStatsAccumulator') -> 'WorkflowStatsAccumulator':
+        """
+        Fold another accumulator into this one.
+
+        Args:
+            other: Accumulator of a disjoint set of files
+
+        Returns:
+            WorkflowStatsAccumulator: self, for chaining
+        """
+        self.total_files += other.total_files
+        for status, count in other.counts.items():
+            self.counts[status] += count
+        self.total_nodes += other.total_nodes
+        self.total_connections += other.total_connections
+
+        self.names = self._merge_names(other)
+        self.names_seen += other.names_seen
+
+        for bucket, count in other.timing_buckets.items():
+            self.timing_buckets[bucket] = self.timing_buckets.get(bucket, 0) + count
+        self.timing_total += other.timing_total
+        self.timing_max = max(self.timing_max, other.timing_max)
+        for item in other.slowest_files:
+            if len(self.slowest_files) < self.slowest:
+                heapq.heappush(self.slowest_files, item)
+            elif self.slowest > 0 and item[0] > self.slowest_files[0][0]:
+                heapq.heapreplace(self.slowest_files, item)
+        return self
+
+    def _merge_names(self, other: 'WorkflowStatsAccumulator') -> List[str]:
+        if self.max_names is None:
+            return self.names + other.names
+        if self.names_seen + other.names_seen <= self.max_names:
+            return self.names + other.names
+
+        # Both reservoirs are uniform samples of their shards, so drawing without
+        # replacement from the combined population picks a side in proportion
+        # to the number of its names not drawn yet.
+        mine, theirs = self.names[:], other.names[:]
+        self._random.shuffle(mine)
+        self._random.shuffle(theirs)
+        mine_left, theirs_left = self.names_seen, other.names_seen
+        merged = []
+        while len(merged) < self.max_names and (mine or theirs):
+            if theirs and (not mine or self._random.randrange(mine_left + theirs_left) >= mine_left):
+                merged.append(theirs.pop())
+                theirs_left -= 1
+            else:
+                merged.append(mine.pop())
+                mine_left -= 1
+        return merged
+
+    def percentile(self, q: float) -> float:
+        """
+        Return the approximate q-th percentile (0-100) of per-file processing time in seconds.
+
+        The value is the upper edge of the histogram bucket containing the
+        percentile, capped at the maximum observed time.
+        """
+        total = sum(self.timing_buckets.values())
+        if total == 0:
+            return 0.0
+        rank = max(1, math.ceil(total * q / 100.0))
+        seen = 0
+        for bucket in sorted(self.timing_buckets):
+            seen += self.timing_buckets[bucket]
+            if seen >= rank:
+                return min(_timing_bucket_upper(bucket), self.timing_max)
+        return self.timing_max
+
+    def result(self) -> Dict[str, Any]:
+        """
+        Return the statistics in the get_workflow_stats format.
+
+        Returns:
+            Dict with total_files, the status counters, total_nodes,
+            total_connections, workflow_names, and a 'file_timing' section
+            (mean/p50/p90/p99/max seconds and the slowest files)
+        """
+        stats: Dict[str, Any] = {'total_files': self.total_files}
+        stats.update(self.counts)
+        stats['total_nodes'] = self.total_nodes
+        stats['total_connections'] = self.total_connections
+        stats['workflow_names'] = list(self.names)
+        stats['file_timing'] = {
+            'mean': self.timing_total / self.total_files if self.total_files else 0.0,
+            'p50': self.percentile(50),
+            'p90': self.percentile(90),
+            'p99': self.percentile(99),
+            'max': self.timing_max,
+            'slowest_files': [(path, elapsed) for elapsed, path in sorted(self.slowest_files, reverse=True)]
+        }
+        return stats
+
+
+def accumulate_stats(
+    file_paths: List[str], 
+    max_names: Optional[int] = None, 
+    slowest: int = 10, 
+    seed: Optional[int] = None
+) -> WorkflowStatsAccumulator:
+    """
+    Accumulate statistics for a shard of files (suitable as a process pool task).
+
+    Args:
+        file_paths: Paths of the files in this shard
+        max_names: Bound on retained workflow names
+        slowest: Number of slowest files to keep
+        seed: Seed for the reservoir sample
+
+    Returns:
+        WorkflowStatsAccumulator: Statistics of the shard
+    """
+    accumulator = WorkflowStatsAccumulator(max_names=max_names, slowest=slowest, seed=seed)
+    for file_path in file_paths:
+        accumulator.add_file(file_path)
+    return accumulator
+
+
+def _timing_bucket(elapsed: float) -> int:
+    if elapsed <= _TIMING_BASE:
+        return 0
+    return int(math.log2(elapsed / _TIMING_BASE) * _TIMING_BUCKETS_PER_OCTAVE) + 1
+
+
+def _timing_bucket_upper(bucket: int) -> float:
+    return _TIMING_BASE * 2 ** (bucket / _TIMING_BUCKETS_PER_OCTAVE)
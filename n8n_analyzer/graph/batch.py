@@ -0,0 +1,305 @@
+import logging
+from typing import List, Dict, Any, Iterable, Optional
+
+import numpy as np
+from scipy import sparse
+from scipy.sparse import csgraph
+
+try:
+    import pandas as pd
+except ImportError:  # Optional dependency, only needed for CorpusGraph.feature_table
+    pd = None
+
+from ..core.models import N8nWorkflow
+from .csr import WorkflowGraph, _node_lookup
+
+
+# Configure logging for batched graph metrics
+logger = logging.getLogger(__name__)
+
+
+FEATURE_COLUMNS = (
+    'nodes', 'edges', 'density', 'max_in_degree', 'max_out_degree', 'sources', 'sinks',
+    'branching_factor', 'components', 'is_dag', 'longest_path'
+)
+
+
+class CorpusGraph:
+    """
+    Every workflow of a corpus as one block-diagonal sparse adjacency matrix.
+
+    Workflow i owns the nodes offsets[i]:offsets[i + 1]; since no edge
+    crosses blocks, whole-corpus sparse operations (degrees, components,
+    level-synchronous topological sorting) yield per-workflow results after
+    a segmented reduction over the offsets.
+    """
+
+    def __init__(self, adjacency: sparse.csr_matrix, offsets: np.ndarray, keys: List[Optional[str]]):
+        """
+        Args:
+            adjacency: Block-diagonal (n_nodes, n_nodes) CSR adjacency of the corpus
+            offsets: First node of every workflow, plus the total node count (length n_workflows + 1)
+            keys: Key of every workflow (e.g. its file path)
+        """
+        self.adjacency = adjacency
+        self.offsets = offsets
+        self.keys = keys
+
+    @classmethod
+    def from_graphs(cls, graphs: Iterable[WorkflowGraph], keys: Optional[Iterable[Optional[str]]] = None) -> 'CorpusGraph':
+        """
+        Stack workflow graphs into one block-diagonal matrix.
+
+        The CSR arrays are written directly; going through scipy.sparse.block_diag
+        would build one COO matrix per workflow.
+
+        Args:
+            graphs: Workflow graphs
+            keys: Key of every graph (defaults to None for each)
+        """
+        offsets = [0]
+        row_lengths: List[int] = []
+        indices: List[int] = []
+        for graph in graphs:
+            base = offsets[-1]
+            for targets in graph._adjacency():
+                row_lengths.append(len(targets))
+                indices.extend([base + target for target in targets])
+            offsets.append(base + graph.n_nodes)
+
+        n_nodes = offsets[-1]
+        indptr = np.zeros(n_nodes + 1, dtype=np.int64)
+        np.cumsum(row_lengths, out=indptr[1:])
+        adjacency = sparse.csr_matrix(
+            (np.ones(len(indices), dtype=np.int8), np.array(indices, dtype=np.int64), indptr),
+            shape=(n_nodes, n_nodes)
+        )
+        keys = list(keys) if keys is not None else [None] * (len(offsets) - 1)
+        return cls(adjacency, np.array(offsets, dtype=np.int64), keys)
+
+    @classmethod
+    def from_workflows(cls, workflows: Iterable[N8nWorkflow]) -> 'CorpusGraph':
+        """
+        Stack a stream of workflows, keyed by file path.
+
+        Connection endpoints are resolved as in WorkflowGraph.from_workflow,
+        but straight into corpus-wide edge arrays; duplicate edges are then
+        dropped and the CSR arrays built with NumPy, without a WorkflowGraph
+        per workflow.
+        """
+        keys: List[Optional[str]] = []
+        offsets = [0]
+        edge_counts: List[int] = []
+        sources: List[int] = []
+        targets: List[int] = []
+        for workflow in workflows:
+            nodes = workflow.nodes
+            connections = workflow.connections
+            positions = {node.id: i for i, node in enumerate(nodes)}
+            resolve = positions.get
+            workflow_sources = [resolve(connection.source_node_id) for connection in connections]
+            workflow_targets = [resolve(connection.target_node_id) for connection in connections]
+            if len(positions) != len(nodes) or None in workflow_sources or None in workflow_targets:
+                # Duplicate ids or endpoints given by name: fall back to the full lookup
+                positions, _, lookup = _node_lookup(workflow)
+                resolve = lookup.get
+                pairs = [(resolve(connection.source_node_id), resolve(connection.target_node_id))
+                         for connection in connections]
+                pairs = [(source, target) for source, target in pairs if source is not None and target is not None]
+                workflow_sources = [source for source, _ in pairs]
+                workflow_targets = [target for _, target in pairs]
+            sources += workflow_sources
+            targets += workflow_targets
+            edge_counts.append(len(workflow_sources))
+            offsets.append(offsets[-1] + len(positions))
+            keys.append(workflow.file_path)
+
+        n_nodes = offsets[-1]
+        # Shift local node indices by the workflow offsets, then keep sorted
+        # distinct (source, target) pairs, which are the CSR rows in order
+        base = np.repeat(np.array(offsets[:-1], dtype=np.int64), edge_counts)
+        edges = (np.array(sources, dtype=np.int64) + base) * n_nodes + np.array(targets, dtype=np.int64) + base
+        edges.sort()
+        if len(edges):
+            edges = edges[np.concatenate(([True], edges[1:] != edges[:-1]))]
+        indptr = np.zeros(n_nodes + 1, dtype=np.int64)
+        if n_nodes:
+            np.cumsum(np.bincount(edges // n_nodes, minlength=n_nodes), out=indptr[1:])
+        adjacency = sparse.csr_matrix(
+            (np.ones(len(edges), dtype=np.int8), edges % n_nodes if n_nodes else edges, indptr),
+            shape=(n_nodes, n_nodes)
+        )
+        return cls(adjacency, np.array(offsets, dtype=np.int64), keys)
+
+    @property
+    def n_workflows(self) -> int:
+        return len(self.offsets) - 1
+
+    @property
+    def n_nodes(self) -> int:
+        return int(self.offsets[-1])
+
+    @property
+    def n_edges(self) -> int:
+        return int(self.adjacency.nnz)
+
+    def workflow_of_nodes(self) -> np.ndarray:
+        """Workflow index of every node."""
+        return np.repeat(np.arange(self.n_workflows), np.diff(self.offsets))
+
+    def workflow_adjacency(self, i: int) -> sparse.csr_matrix:
+        """The adjacency block of workflow i."""
+        start, end = self.offsets[i], self.offsets[i + 1]
+        return self.adjacency[start:end, start:end]
+
+    def out_degree(self) -> np.ndarray:
+        """Out-degree of every node."""
+        return np.diff(self.adjacency.indptr)
+
+    def in_degree(self) -> np.ndarray:
+        """In-degree of every node."""
+        return np.bincount(self.adjacency.indices, minlength=self.n_nodes)
+
+    def segment_sum(self, values: np.ndarray) -> np.ndarray:
+        """Sum of a per-node array over each workflow."""
+        totals = np.zeros(self.n_nodes + 1, dtype=np.result_type(values, np.int64))
+        np.cumsum(values, out=totals[1:])
+        return totals[self.offsets[1:]] - totals[self.offsets[:-1]]
+
+    def segment_max(self, values: np.ndarray, empty: Any = 0) -> np.ndarray:
+        """Maximum of a per-node array over each workflow (empty for workflows without nodes)."""
+        result = np.full(self.n_workflows, empty, dtype=np.result_type(values, type(empty)))
+        non_empty = np.flatnonzero(np.diff(self.offsets) > 0)
+        if len(non_empty):
+            # reduceat over the starts of non-empty workflows only, so no segment is empty
+            result[non_empty] = np.maximum.reduceat(values, self.offsets[non_empty])
+        return result
+
+    def levels(self) -> np.ndarray:
+        """
+        Longest path (in edges) ending at every node, by level-synchronous topological sorting.
+
+        All workflows are sorted at once: each round removes every node whose
+        predecessors are all removed, so the number of rounds is the deepest
+        workflow's depth rather than the number of nodes.
+
+        Returns:
+            int64 array; -1 for nodes on or downstream of a cycle
+        """
+        indptr, indices = self.adjacency.indptr, self.adjacency.indices
+        remaining = self.in_degree()
+        depth = np.full(self.n_nodes, -1, dtype=np.int64)
+        frontier = np.flatnonzero(remaining == 0)
+        level = 0
+        while len(frontier):
+            depth[frontier] = level
+            # Successors of the whole frontier in one gather
+            starts = indptr[frontier]
+            lengths = indptr[frontier + 1] - starts
+            positions = np.repeat(starts - np.cumsum(lengths) + lengths, lengths) + np.arange(lengths.sum())
+            targets = indices[positions]
+            remaining -= np.bincount(targets, minlength=self.n_nodes)
+            # A node reached from several frontier nodes appears once per edge
+            ready = np.sort(targets[remaining[targets] == 0])
+            frontier = ready[np.concatenate(([True], ready[1:] != ready[:-1]))] if len(ready) else ready
+            level += 1
+        return depth
+
+    def component_counts(self) -> np.ndarray:
+        """Number of weakly connected components of every workflow."""
+        _, labels = csgraph.connected_components(self.adjacency, directed=True, connection='weak')
+        _, first_nodes = np.unique(labels, return_index=True)
+        return np.bincount(self.workflow_of_nodes()[first_nodes], minlength=self.n_workflows)
+
+    def features(self) -> Dict[str, np.ndarray]:
+        """
+        Structural features of every workflow, computed for the whole corpus at once.
+
+        Returns:
+            Dict of FEATURE_COLUMNS to arrays with one entry per workflow.
+            The keys match graph_metrics, plus branching_factor (mean out-degree
+            of nodes with successors); longest_path is -1 for cyclic workflows
+        """
+        out_degree = self.out_degree()
+        in_degree = self.in_degree()
+        nodes = np.diff(self.offsets)
+        edges = self.segment_sum(out_degree)
+        sinks = self.segment_sum(out_degree == 0)
+        depth = self.levels()
+        is_dag = self.segment_sum(depth < 0) == 0
+        with np.errstate(divide='ignore', invalid='ignore'):
+            density = np.where(nodes > 1, edges / (nodes * (nodes - 1.0)), 0.0)
+            branching_factor = np.where(nodes > sinks, edges / (nodes - sinks), 0.0)
+        return {
+            'nodes': nodes,
+            'edges': edges,
+            'density': density,
+            'max_in_degree': self.segment_max(in_degree),
+            'max_out_degree': self.segment_max(out_degree),
+            'sources': self.segment_sum(in_degree == 0),
+            'sinks': sinks,
+            'branching_factor': branching_factor,
+            'components': self.component_counts(),
+            'is_dag': is_dag,
+            'longest_path': np.where(is_dag, self.segment_max(depth), -1)
+        }
+
+    def feature_table(self):
+        """
+        Per-workflow features as a pandas DataFrame indexed by workflow key.
+
+        Raises:
+            ImportError: If pandas is not installed
+        """
+        if pd is None:
+            raise ImportError("CorpusGraph.feature_table requires pandas")
+        return pd.DataFrame(self.features(), index=pd.Index(self.keys, name='workflow'), columns=FEATURE_COLUMNS)
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Corpus-level structural summary.
+
+        Returns:
+            Dict with totals, the mean and maximum of the per-workflow
+            features, the share of acyclic workflows and the corpus-wide
+            in/out-degree distributions (count of nodes per degree)
+        """
+        features = self.features()
+        summary: Dict[str, Any] = {
+            'workflows': self.n_workflows,
+            'nodes': self.n_nodes,
+            'edges': self.n_edges,
+            'dag_fraction': float(features['is_dag'].mean()) if self.n_workflows else 0.0
+        }
+        for column in ('nodes', 'edges', 'density', 'branching_factor', 'components', 'longest_path'):
+            values = features[column]
+            if column == 'longest_path':
+                values = values[features['is_dag']]
+            summary[f'mean_{column}'] = float(values.mean()) if len(values) else 0.0
+            summary[f'max_{column}'] = values.max().item() if len(values) else 0
+        summary['in_degree_distribution'] = np.bincount(self.in_degree()).tolist()
+        summary['out_degree_distribution'] = np.bincount(self.out_degree()).tolist()
+        return summary
+
+
+def corpus_graph_metrics(workflows: Iterable[N8nWorkflow]) -> List[Dict[str, Any]]:
+    """
+    Graph metrics of every workflow in a stream, with the workflow name and file path.
+
+    The metrics are computed for the whole corpus at once on a CorpusGraph
+    rather than workflow by workflow. Each dict has the keys of graph_metrics
+    plus branching_factor; longest_path is None for cyclic workflows.
+    """
+    names: List[str] = []
+
+    def named():
+        for workflow in workflows:
+            names.append(workflow.name)
+            yield workflow
+
+    corpus = CorpusGraph.from_workflows(named())
+    features = corpus.features()
+    features['longest_path'] = np.where(features['is_dag'], features['longest_path'], None)
+    keys = FEATURE_COLUMNS + ('name', 'file_path')
+    columns = [features[column].tolist() for column in FEATURE_COLUMNS] + [names, corpus.keys]
+    return [dict(zip(keys, values)) for values in zip(*columns)]
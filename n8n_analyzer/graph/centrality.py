@@ -0,0 +1,258 @@
+import math
+import time
+import random
+import logging
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import List, Dict, MutableMapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from ..core.models import N8nWorkflow
+from .csr import WorkflowGraph
+
+
+# Configure logging for centrality
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CentralityResult:
+    """
+    Betweenness centrality of every node of a workflow graph.
+
+    error_bound bounds the absolute error of every normalized value with
+    probability 1 - delta; it is 0 for exact results.
+    """
+    node_ids: List[str]
+    values: np.ndarray
+    exact: bool
+    n_pivots: int
+    error_bound: float = 0.0
+
+    def top(self, k: int = 5) -> List[Tuple[str, float]]:
+        """The k most central nodes as (node id, centrality), highest first."""
+        order = np.argsort(-self.values, kind='stable')[:k]
+        return [(self.node_ids[i], float(self.values[i])) for i in order]
+
+
+def _accumulate_dependencies(adjacency: List[List[int]], source: int, centrality: List[float]) -> None:
+    # One source of Brandes' algorithm: BFS counting shortest paths, then
+    # back-propagation of pair dependencies in order of decreasing distance
+    n = len(adjacency)
+    sigma = [0] * n
+    sigma[source] = 1
+    distance = [-1] * n
+    distance[source] = 0
+    predecessors: List[List[int]] = [[] for _ in range(n)]
+    visited = []
+    queue = deque([source])
+    while queue:
+        v = queue.popleft()
+        visited.append(v)
+        next_distance = distance[v] + 1
+        for w in adjacency[v]:
+            if distance[w] < 0:
+                distance[w] = next_distance
+                queue.append(w)
+            if distance[w] == next_distance:
+                sigma[w] += sigma[v]
+                predecessors[w].append(v)
+
+    delta = [0.0] * n
+    for w in reversed(visited):
+        coefficient = (1.0 + delta[w]) / sigma[w]
+        for v in predecessors[w]:
+            delta[v] += sigma[v] * coefficient
+        if w != source:
+            centrality[w] += delta[w]
+
+
+def betweenness_centrality(
+    graph: WorkflowGraph,
+    pivots: Optional[Sequence[int]] = None,
+    normalized: bool = True,
+    deadline: Optional[float] = None
+) -> Tuple[np.ndarray, int]:
+    """
+    Betweenness centrality by Brandes' algorithm, exact or from sampled pivots.
+
+    With pivots, only shortest paths from those sources are accumulated and
+    the result is scaled by n / len(pivots), an unbiased estimate of the
+    exact value. Values follow networkx.betweenness_centrality for directed
+    graphs (normalized by 1 / ((n - 1)(n - 2))).
+
+    Args:
+        graph: Workflow graph
+        pivots: Source nodes to sample (None for the exact computation over all nodes)
+        normalized: Whether to normalize the values
+        deadline: time.perf_counter() value after which no further pivot is
+            started (at least one always is); the estimate is scaled by the
+            number of pivots actually used
+
+    Returns:
+        Tuple of (centrality of every node, number of sources used)
+    """
+    adjacency = graph._adjacency()
+    n = len(adjacency)
+    sources = range(n) if pivots is None else pivots
+    centrality = [0.0] * n
+    used = 0
+    for source in sources:
+        if used and deadline is not None and time.perf_counter() > deadline:
+            break
+        _accumulate_dependencies(adjacency, source, centrality)
+        used += 1
+
+    values = np.array(centrality)
+    if used and used < n:
+        values *= n / used
+    if normalized and n > 2:
+        values /= (n - 1) * (n - 2)
+    return values, used
+
+
+def hoeffding_error(n_nodes: int, n_pivots: int, delta: float) -> float:
+    """
+    Bound on the absolute error of every normalized estimate, holding with probability 1 - delta.
+
+    Each pivot contributes a value in [0, n / (n - 1)] to a node's estimate;
+    Hoeffding's inequality with a union bound over the nodes gives the bound.
+    """
+    if n_pivots <= 0:
+        return math.inf
+    spread = n_nodes / (n_nodes - 1) if n_nodes > 1 else 1.0
+    return spread * math.sqrt(math.log(2 * max(n_nodes, 1) / delta) / (2 * n_pivots))
+
+
+def pivots_for_error(n_nodes: int, epsilon: float, delta: float) -> int:
+    """Number of pivots for which hoeffding_error is at most epsilon."""
+    spread = n_nodes / (n_nodes - 1) if n_nodes > 1 else 1.0
+    return math.ceil(spread ** 2 * math.log(2 * max(n_nodes, 1) / delta) / (2 * epsilon ** 2))
+
+
+class CentralityService:
+    """
+    Betweenness centrality with exact or sampled computation and a result cache.
+
+    Graphs with at most exact_threshold nodes are computed exactly. Larger
+    graphs use uniformly sampled pivots sized by the error budget
+    (epsilon, delta), or every node (in random order) when the budget would
+    need as many pivots as there are nodes. A time budget caps the pivots
+    of any graph above exact_threshold, so a computation that would have
+    been exact may return a sampled estimate with its error bound instead.
+    Results are cached under the structural hash of the graph, so a
+    workflow whose node types and connections are unchanged is never
+    recomputed.
+    """
+
+    def __init__(
+        self,
+        exact_threshold: int = 100,
+        epsilon: float = 0.1,
+        delta: float = 0.1,
+        time_budget: Optional[float] = None,
+        normalized: bool = True,
+        seed: Optional[int] = None,
+        cache: Optional[MutableMapping[str, CentralityResult]] = None,
+        max_cache_entries: int = 10000
+    ):
+        """
+        Args:
+            exact_threshold: Largest graph (in nodes) always computed exactly
+            epsilon: Target bound on the absolute error of normalized values
+            delta: Probability that the bound may be exceeded
+            time_budget: Seconds allowed per graph above exact_threshold (None for no limit)
+            normalized: Whether to normalize the values
+            seed: Random seed for pivot sampling
+            cache: Mapping to cache results in (e.g. a shelve for a persistent
+                cache); by default an in-memory LRU of max_cache_entries results
+            max_cache_entries: Size of the default in-memory cache
+
+        Raises:
+            ValueError: If epsilon or delta is out of range
+        """
+        if not 0 < epsilon:
+            raise ValueError(f"epsilon must be positive, got {epsilon}")
+        if not 0 < delta < 1:
+            raise ValueError(f"delta must be in (0, 1), got {delta}")
+        self.exact_threshold = exact_threshold
+        self.epsilon = epsilon
+        self.delta = delta
+        self.time_budget = time_budget
+        self.normalized = normalized
+        self.seed = seed
+        self.max_cache_entries = max_cache_entries
+        self.cache: MutableMapping[str, CentralityResult] = cache if cache is not None else OrderedDict()
+        self._lru = cache is None
+        self.hits = 0
+        self.misses = 0
+
+    def _cache_key(self, structural_hash: str) -> str:
+        # Results also depend on the settings, which matters for shared persistent caches
+        return (f"{structural_hash}:{self.normalized}:{self.exact_threshold}:"
+                f"{self.epsilon}:{self.delta}:{self.time_budget}:{self.seed}")
+
+    def centrality(self, graph: Union[WorkflowGraph, N8nWorkflow]) -> CentralityResult:
+        """
+        Betweenness centrality of a workflow or workflow graph.
+
+        Args:
+            graph: Workflow or its WorkflowGraph
+
+        Returns:
+            CentralityResult: Values indexed like the graph's nodes
+        """
+        if isinstance(graph, N8nWorkflow):
+            graph = WorkflowGraph.from_workflow(graph)
+        structural_hash = graph.structural_hash()
+        key = self._cache_key(structural_hash)
+        cached = self.cache.get(key)
+        if cached is not None:
+            self.hits += 1
+            if self._lru:
+                self.cache.move_to_end(key)
+            # The structure matches, but node ids may have been renamed
+            return CentralityResult(graph.node_ids, cached.values, cached.exact, cached.n_pivots, cached.error_bound)
+
+        self.misses += 1
+        result = self._compute(graph, structural_hash)
+        self.cache[key] = result
+        if self._lru and len(self.cache) > self.max_cache_entries:
+            self.cache.popitem(last=False)
+        return result
+
+    def _compute(self, graph: WorkflowGraph, structural_hash: str) -> CentralityResult:
+        n = graph.n_nodes
+        n_pivots = min(pivots_for_error(n, self.epsilon, self.delta), n)
+        if n <= self.exact_threshold or (n_pivots == n and self.time_budget is None):
+            values, _ = betweenness_centrality(graph, normalized=self.normalized)
+            return CentralityResult(graph.node_ids, values, True, n)
+
+        # Seeded per graph structure, so results do not depend on processing order.
+        # With n_pivots == n this is every node in random order, so a deadline
+        # that stops it early still leaves a uniform sample.
+        rng = random.Random(f"{self.seed}:{structural_hash}")
+        pivots = rng.sample(range(n), n_pivots)
+        deadline = time.perf_counter() + self.time_budget if self.time_budget is not None else None
+        values, used = betweenness_centrality(graph, pivots, normalized=self.normalized, deadline=deadline)
+        if used == n:
+            return CentralityResult(graph.node_ids, values, True, n)
+        if used < n_pivots:
+            logger.debug(f"Time budget reached after {used} of {n_pivots} pivots on a {n}-node graph")
+        return CentralityResult(graph.node_ids, values, False, used, hoeffding_error(n, used, self.delta))
+
+    def bottlenecks(self, workflow: N8nWorkflow, k: int = 5) -> List[Dict[str, object]]:
+        """
+        The k nodes of a workflow with the highest betweenness centrality.
+
+        Returns:
+            List of dicts with node_id, name, type and centrality, highest first
+        """
+        graph = WorkflowGraph.from_workflow(workflow)
+        result = self.centrality(graph)
+        nodes = workflow.index.nodes_by_id
+        return [
+            {'node_id': node_id, 'name': nodes[node_id].name, 'type': nodes[node_id].type, 'centrality': value}
+            for node_id, value in result.top(k)
+        ]
@@ -0,0 +1,411 @@
+import hashlib
+import logging
+from collections import deque
+from itertools import accumulate, chain
+from typing import List, Dict, Any, Iterable, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..core.models import N8nWorkflow
+
+
+# Configure logging for workflow graphs
+logger = logging.getLogger(__name__)
+
+
+class WorkflowGraph:
+    """
+    Compact directed graph of a workflow over integer node indices.
+
+    Nodes are indices into node_ids / node_types. The adjacency is available
+    in CSR (compressed sparse row) form, where the successors of node v are
+    indices[indptr[v]:indptr[v + 1]], and as per-node successor lists, which
+    the traversal algorithms use since workflows are small enough that
+    Python lists beat array slicing. Either form is derived from the other
+    on first use. Parallel connections (e.g. through different ports)
+    collapse into one edge, as in a NetworkX DiGraph, and self-loops are kept.
+    """
+    __slots__ = ('node_ids', 'node_types', '_indptr', '_indices', '_lists', '_reverse')
+
+    def __init__(
+        self,
+        node_ids: List[str],
+        node_types: List[str],
+        indptr: np.ndarray,
+        indices: np.ndarray
+    ):
+        """
+        Args:
+            node_ids: Node id of every node index
+            node_types: Node type of every node index
+            indptr: CSR row pointers, length len(node_ids) + 1
+            indices: CSR column indices (successors, sorted within each row)
+        """
+        self.node_ids = node_ids
+        self.node_types = node_types
+        self._indptr: Optional[np.ndarray] = indptr
+        self._indices: Optional[np.ndarray] = indices
+        self._lists: Optional[List[List[int]]] = None
+        self._reverse: Optional['WorkflowGraph'] = None
+
+    @classmethod
+    def from_edges(
+        cls,
+        n_nodes: int,
+        edges: Iterable[Tuple[int, int]],
+        node_ids: Optional[List[str]] = None,
+        node_types: Optional[List[str]] = None
+    ) -> 'WorkflowGraph':
+        """
+        Build a graph from (source, target) index pairs.
+
+        Args:
+            n_nodes: Number of nodes
+            edges: Directed edges; duplicates are dropped
+            node_ids: Optional node ids (default: the indices as strings)
+            node_types: Optional node types (default: empty strings)
+        """
+        successors: List[List[int]] = [[] for _ in range(n_nodes)]
+        for source, target in set(edges):
+            successors[source].append(target)
+        return cls._from_successors(
+            successors,
+            node_ids if node_ids is not None else [str(v) for v in range(n_nodes)],
+            node_types if node_types is not None else [''] * n_nodes
+        )
+
+    @classmethod
+    def _from_successors(
+        cls,
+        successors: List[List[int]],
+        node_ids: List[str],
+        node_types: List[str]
+    ) -> 'WorkflowGraph':
+        # successors holds distinct targets per node; the CSR arrays are built on first use
+        for targets in successors:
+            targets.sort()
+        graph = cls(node_ids, node_types, None, None)
+        graph._lists = successors
+        return graph
+
+    @classmethod
+    def from_workflow(cls, workflow: N8nWorkflow) -> 'WorkflowGraph':
+        """
+        Build the graph of a workflow straight from its nodes and connections.
+
+        Connection endpoints are resolved by node id or name, as in
+        WorkflowIndex.resolve; connections to unknown nodes are dropped. The
+        lookup is built directly from the nodes, so no WorkflowIndex is needed.
+        """
+        positions, node_types, lookup = _node_lookup(workflow)
+        successors: List[List[int]] = [[] for _ in node_types]
+        seen = set()
+        for connection in workflow.connections:
+            source = lookup.get(connection.source_node_id)
+            target = lookup.get(connection.target_node_id)
+            if source is not None and target is not None and (source, target) not in seen:
+                seen.add((source, target))
+                successors[source].append(target)
+        return cls._from_successors(successors, list(positions), node_types)
+
+    @property
+    def indptr(self) -> np.ndarray:
+        if self._indptr is None:
+            self._indptr = np.array([0, *accumulate(map(len, self._lists))], dtype=np.int64)
+        return self._indptr
+
+    @property
+    def indices(self) -> np.ndarray:
+        if self._indices is None:
+            self._indices = np.fromiter(chain.from_iterable(self._lists), dtype=np.int32)
+        return self._indices
+
+    @property
+    def n_nodes(self) -> int:
+        return len(self.node_ids)
+
+    @property
+    def n_edges(self) -> int:
+        return len(self._indices) if self._indices is not None else sum(map(len, self._lists))
+
+    def edges(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Return (sources, targets) arrays of all edges."""
+        sources = np.repeat(np.arange(self.n_nodes, dtype=np.int32), np.diff(self.indptr))
+        return sources, self.indices
+
+    def successors(self, node: int) -> np.ndarray:
+        return self.indices[self.indptr[node]:self.indptr[node + 1]]
+
+    def predecessors(self, node: int) -> np.ndarray:
+        return self.reverse().successors(node)
+
+    def out_degree(self) -> np.ndarray:
+        """Out-degree of every node."""
+        return np.diff(self.indptr)
+
+    def in_degree(self) -> np.ndarray:
+        """In-degree of every node."""
+        return np.bincount(self.indices, minlength=self.n_nodes)
+
+    def reverse(self) -> 'WorkflowGraph':
+        """The graph with every edge reversed (cached)."""
+        if self._reverse is None:
+            predecessors: List[List[int]] = [[] for _ in self.node_ids]
+            for source, targets in enumerate(self._adjacency()):
+                for target in targets:
+                    predecessors[target].append(source)
+            self._reverse = WorkflowGraph._from_successors(predecessors, self.node_ids, self.node_types)
+            self._reverse._reverse = self
+        return self._reverse
+
+    def _adjacency(self) -> List[List[int]]:
+        if self._lists is None:
+            indptr = self._indptr.tolist()
+            indices = self._indices.tolist()
+            self._lists = [indices[indptr[v]:indptr[v + 1]] for v in range(len(indptr) - 1)]
+        return self._lists
+
+    def topological_order(self) -> List[int]:
+        """
+        Return the nodes in topological order (Kahn's algorithm).
+
+        Raises:
+            ValueError: If the graph has a cycle
+        """
+        order, _ = self._kahn()
+        if len(order) < self.n_nodes:
+            raise ValueError("Graph contains a cycle")
+        return order
+
+    def _kahn(self, in_degree: Optional[List[int]] = None) -> Tuple[List[int], List[int]]:
+        # Returns the nodes in topological order (only those outside cycles if
+        # there are any) and the number of edges of the longest path into each
+        adjacency = self._adjacency()
+        if in_degree is None:
+            in_degree = [0] * len(adjacency)
+            for targets in adjacency:
+                for target in targets:
+                    in_degree[target] += 1
+        remaining = list(in_degree)
+        depth = [0] * len(adjacency)
+        order = [v for v, degree in enumerate(remaining) if degree == 0]
+        for v in order:
+            next_depth = depth[v] + 1
+            for w in adjacency[v]:
+                if depth[w] < next_depth:
+                    depth[w] = next_depth
+                remaining[w] -= 1
+                if remaining[w] == 0:
+                    order.append(w)
+        return order, depth
+
+    def is_dag(self) -> bool:
+        """Whether the graph has no directed cycle."""
+        return len(self._kahn()[0]) == self.n_nodes
+
+    def reachable(self, sources: Sequence[int]) -> np.ndarray:
+        """
+        Nodes reachable from the given nodes (breadth-first search).
+
+        Returns:
+            Boolean mask over nodes; the sources themselves are included
+        """
+        adjacency = self._adjacency()
+        seen = [False] * self.n_nodes
+        queue = deque(sources)
+        for source in sources:
+            seen[source] = True
+        while queue:
+            for w in adjacency[queue.popleft()]:
+                if not seen[w]:
+                    seen[w] = True
+                    queue.append(w)
+        return np.array(seen, dtype=bool)
+
+    def descendants(self, node: int) -> List[int]:
+        """Nodes reachable from node, excluding node itself unless it lies on a cycle."""
+        adjacency = self._adjacency()
+        seen = set()
+        stack = list(adjacency[node])
+        while stack:
+            v = stack.pop()
+            if v not in seen:
+                seen.add(v)
+                stack.extend(adjacency[v])
+        return sorted(seen)
+
+    def ancestors(self, node: int) -> List[int]:
+        """Nodes from which node is reachable."""
+        return self.reverse().descendants(node)
+
+    def longest_path(self, weights: Optional[Sequence[float]] = None) -> Tuple[float, List[int]]:
+        """
+        Longest (critical) path of a DAG by dynamic programming over the topological order.
+
+        Args:
+            weights: Optional node weights (e.g. execution cost); the path weight is
+                the sum of its node weights. Without weights, the length is the
+                number of edges.
+
+        Returns:
+            Tuple of (path length or weight, node indices along the path)
+
+        Raises:
+            ValueError: If the graph has a cycle
+        """
+        if self.n_nodes == 0:
+            return 0, []
+        order = self.topological_order()
+        adjacency = self._adjacency()
+        node_weight = [1] * self.n_nodes if weights is None else list(weights)
+        best = list(node_weight)
+        parent = [-1] * self.n_nodes
+        for v in order:
+            for w in adjacency[v]:
+                candidate = best[v] + node_weight[w]
+                if candidate > best[w]:
+                    best[w] = candidate
+                    parent[w] = v
+
+        end = max(range(self.n_nodes), key=best.__getitem__)
+        path = [end]
+        while parent[path[-1]] != -1:
+            path.append(parent[path[-1]])
+        path.reverse()
+        length = best[end] - 1 if weights is None else best[end]
+        return length, path
+
+    def weakly_connected_components(self) -> Tuple[int, np.ndarray]:
+        """
+        Connected components ignoring edge direction (union-find).
+
+        Returns:
+            Tuple of (number of components, component label of every node);
+            labels are numbered in order of each component's lowest node
+        """
+        n_components, parent = self._union_find()
+        labels = []
+        numbering: Dict[int, int] = {}
+        for v in range(len(parent)):
+            root = v
+            while parent[root] != root:
+                root = parent[root]
+            labels.append(numbering.setdefault(root, len(numbering)))
+        return n_components, np.array(labels, dtype=np.int32)
+
+    def _union_find(self) -> Tuple[int, List[int]]:
+        # Returns the number of weak components and the union-find parent
+        # pointers, whose roots are the lowest node of each component
+        adjacency = self._adjacency()
+        parent = list(range(len(adjacency)))
+        n_components = len(adjacency)
+        for source, targets in enumerate(adjacency):
+            for target in targets:
+                # Union by lower root with path halving, inlined for speed
+                a = source
+                while parent[a] != a:
+                    parent[a] = a = parent[parent[a]]
+                b = target
+                while parent[b] != b:
+                    parent[b] = b = parent[parent[b]]
+                if a != b:
+                    if a < b:
+                        parent[b] = a
+                    else:
+                        parent[a] = b
+                    n_components -= 1
+        return n_components, parent
+
+    def structural_hash(self) -> str:
+        """
+        Hash of the graph structure and node types.
+
+        Node ids, names and parameters are left out, so renaming nodes or
+        editing parameters keeps the hash while any change to the node types
+        or connections changes it.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update('\0'.join(self.node_types).encode('utf-8'))
+        digest.update(b'\1')
+        digest.update(np.ascontiguousarray(self.indptr, dtype=np.int64).tobytes())
+        digest.update(np.ascontiguousarray(self.indices, dtype=np.int32).tobytes())
+        return digest.hexdigest()
+
+    def to_networkx(self):
+        """
+        Convert to a networkx.DiGraph (node keys are node ids, with a 'type' attribute).
+
+        Raises:
+            ImportError: If networkx is not installed
+        """
+        import networkx as nx
+        graph = nx.DiGraph()
+        graph.add_nodes_from((node_id, {'type': node_type}) for node_id, node_type in zip(self.node_ids, self.node_types))
+        sources, targets = self.edges()
+        graph.add_edges_from((self.node_ids[s], self.node_ids[t]) for s, t in zip(sources.tolist(), targets.tolist()))
+        return graph
+
+
+def _node_lookup(workflow: N8nWorkflow) -> Tuple[Dict[str, int], List[str], Dict[str, int]]:
+    """
+    Number the nodes of a workflow and map connection endpoints to them.
+
+    Returns:
+        Tuple of (node id -> index, node types by index, endpoint -> index),
+        where endpoints resolve by node id or, failing that, by node name
+    """
+    nodes = workflow.nodes
+    positions = {node.id: i for i, node in enumerate(nodes)}
+    if len(positions) == len(nodes):
+        # Common case of unique ids; reversed so that the first node of a name wins
+        lookup = {nodes[i].name: i for i in range(len(nodes) - 1, -1, -1)}
+        lookup.update(positions)
+        return positions, [node.type for node in nodes], lookup
+
+    positions = {}
+    node_types = []
+    lookup = {}
+    for node in nodes:
+        # First occurrence wins, matching WorkflowIndex
+        index = positions.get(node.id)
+        if index is None:
+            index = positions[node.id] = len(node_types)
+            node_types.append(node.type)
+        lookup.setdefault(node.name, index)
+    lookup.update(positions)
+    return positions, node_types, lookup
+
+
+def graph_metrics(graph: WorkflowGraph) -> Dict[str, Any]:
+    """
+    Structural metrics of a workflow graph.
+
+    Returns:
+        Dict with nodes, edges, density, max in/out degree, number of trigger
+        (source) and terminal (sink) nodes, weakly connected components,
+        is_dag and longest_path (number of edges, None for cyclic graphs)
+    """
+    adjacency = graph._adjacency()
+    n = len(adjacency)
+    out_degree = [len(targets) for targets in adjacency]
+    n_edges = sum(out_degree)
+    in_degree = [0] * n
+    for targets in adjacency:
+        for target in targets:
+            in_degree[target] += 1
+    order, depth = graph._kahn(in_degree)
+    is_dag = len(order) == n
+    n_components, _ = graph._union_find()
+    return {
+        'nodes': n,
+        'edges': n_edges,
+        'density': n_edges / (n * (n - 1)) if n > 1 else 0.0,
+        'max_in_degree': max(in_degree, default=0),
+        'max_out_degree': max(out_degree, default=0),
+        'sources': in_degree.count(0),
+        'sinks': out_degree.count(0),
+        'components': n_components,
+        'is_dag': is_dag,
+        'longest_path': max(depth, default=0) if is_dag else None
+    }
+
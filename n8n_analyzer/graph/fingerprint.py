@@ -0,0 +1,379 @@
+import hashlib
+import logging
+from collections import Counter
+from typing import List, Dict, Hashable, Iterable, Iterator, Optional, Tuple
+
+import numpy as np
+
+from ..core.models import N8nWorkflow
+from .csr import WorkflowGraph
+
+
+# Configure logging for workflow fingerprints
+logger = logging.getLogger(__name__)
+
+# Universal hashing modulo the Mersenne prime 2**61 - 1; with 32-bit shingle
+# hashes and 31-bit multipliers the products fit in uint64 without overflow
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint32(0xFFFFFFFF)
+
+
+def workflow_shingles(workflow: N8nWorkflow) -> List[str]:
+    """
+    Structural shingles of a workflow: its node types and typed edges.
+
+    Repeated node types and edges get an occurrence number ('t:set#2'), so
+    the Jaccard similarity of shingle sets also reflects how often each
+    type and connection appears. Names and parameters are ignored.
+
+    Args:
+        workflow: Parsed workflow (connections are needed for edge shingles)
+
+    Returns:
+        List of distinct shingle strings
+    """
+    graph = WorkflowGraph.from_workflow(workflow)
+    types = graph.node_types
+    counts = Counter(f't:{node_type}' for node_type in types)
+    counts.update(
+        f'e:{types[source]}>{types[target]}'
+        for source, targets in enumerate(graph._adjacency()) for target in targets
+    )
+    return [f'{shingle}#{k}' for shingle, count in counts.items() for k in range(1, count + 1)]
+
+
+class MinHasher:
+    """
+    MinHash signatures of shingle sets.
+
+    The fraction of equal positions in two signatures is an unbiased
+    estimate of the Jaccard similarity of the shingle sets. Shingles are
+    hashed to 32 bits with a stable hash, so signatures are reproducible
+    across processes for the same num_perm and seed.
+    """
+
+    def __init__(self, num_perm: int = 128, seed: int = 1):
+        """
+        Args:
+            num_perm: Number of hash functions (signature length)
+            seed: Seed of the hash functions
+
+        Raises:
+            ValueError: If num_perm is not positive
+        """
+        if num_perm <= 0:
+            raise ValueError(f"num_perm must be positive, got {num_perm}")
+        self.num_perm = num_perm
+        self.seed = seed
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, 1 << 31, size=num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, 1 << 31, size=num_perm, dtype=np.uint64)
+        # Distinct shingles seen so far; the first _n_permuted of them have
+        # their permuted hashes in the rows of _permuted, whose capacity grows
+        # by doubling, and the rest wait in _pending
+        self._ids: Dict[str, int] = {}
+        self._pending: List[str] = []
+        self._permuted = np.empty((1024, num_perm), dtype=np.uint32)
+        self._n_permuted = 0
+
+    def _shingle_ids(self, shingles: Iterable[str]) -> List[int]:
+        ids = self._ids
+        result = []
+        for shingle in set(shingles):
+            shingle_id = ids.get(shingle)
+            if shingle_id is None:
+                shingle_id = ids[shingle] = len(ids)
+                self._pending.append(shingle)
+            result.append(shingle_id)
+        return result
+
+    def _extend_permuted(self) -> None:
+        # Hash the shingles added since the last call under all permutations
+        new = self._pending
+        if not new:
+            return
+        values = np.fromiter(
+            (int.from_bytes(hashlib.blake2b(shingle.encode('utf-8'), digest_size=4).digest(), 'little')
+             for shingle in new),
+            dtype=np.uint64, count=len(new)
+        )
+        permuted = (values[:, None] * self._a[None, :] + self._b[None, :]) % _MERSENNE_PRIME
+        start, end = self._n_permuted, self._n_permuted + len(new)
+        if end > len(self._permuted):
+            grown = np.empty((max(end, 2 * len(self._permuted)), self.num_perm), dtype=np.uint32)
+            grown[:start] = self._permuted[:start]
+            self._permuted = grown
+        self._permuted[start:end] = permuted & np.uint64(0xFFFFFFFF)
+        self._n_permuted = end
+        self._pending = []
+
+    def signature(self, shingles: Iterable[str]) -> np.ndarray:
+        """MinHash signature of one shingle set (all 0xFFFFFFFF for an empty set)."""
+        return self.signatures([shingles])[0]
+
+    def signatures(self, shingle_sets: Iterable[Iterable[str]], chunk_size: int = 65536) -> np.ndarray:
+        """
+        MinHash signatures of many shingle sets at once.
+
+        Every distinct shingle is hashed under all permutations only once;
+        signatures are then row gathers and segmented minima over chunks
+        of about chunk_size shingles, which bounds memory for large corpora.
+
+        Returns:
+            uint32 array of shape (n_sets, num_perm)
+        """
+        codes: List[int] = []
+        offsets = [0]
+        for shingles in shingle_sets:
+            codes.extend(self._shingle_ids(shingles))
+            offsets.append(len(codes))
+        self._extend_permuted()
+
+        n_sets = len(offsets) - 1
+        result = np.full((n_sets, self.num_perm), _MAX_HASH, dtype=np.uint32)
+        codes = np.array(codes, dtype=np.int64)
+        offsets = np.array(offsets, dtype=np.int64)
+        start = 0
+        while start < n_sets:
+            # Sets start..end cover at least one and at most about chunk_size shingles
+            end = max(start + 1, int(np.searchsorted(offsets, offsets[start] + chunk_size, side='right')) - 1)
+            end = min(end, n_sets)
+            chunk_offsets = offsets[start:end + 1]
+            non_empty = np.flatnonzero(np.diff(chunk_offsets) > 0)
+            if len(non_empty):
+                block = self._permuted[codes[chunk_offsets[0]:chunk_offsets[-1]]]
+                starts = chunk_offsets[non_empty] - chunk_offsets[0]
+                result[start + non_empty] = np.minimum.reduceat(block, starts, axis=0)
+            start = end
+        return result
+
+    def workflow_signatures(self, workflows: Iterable[N8nWorkflow]) -> np.ndarray:
+        """MinHash signatures of the structural shingles of workflows."""
+        return self.signatures(workflow_shingles(workflow) for workflow in workflows)
+
+
+def estimate_jaccard(signature: np.ndarray, other: np.ndarray) -> float:
+    """Estimated Jaccard similarity of the shingle sets behind two signatures."""
+    return float(np.mean(signature == other))
+
+
+def lsh_parameters(num_perm: int, threshold: float, false_positive_weight: float = 0.1) -> Tuple[int, int]:
+    """
+    Choose the number of bands and rows per band for a similarity threshold.
+
+    Two signatures become candidates when all rows of at least one band
+    agree, which happens with probability 1 - (1 - s**rows)**bands for
+    Jaccard similarity s. The split minimizes the weighted area under that
+    curve below the threshold (false positives) and above the curve beyond
+    it (false negatives).
+
+    Args:
+        num_perm: Signature length
+        threshold: Jaccard similarity threshold in (0, 1)
+        false_positive_weight: Weight of false positives against false negatives;
+            low by default since candidates are verified afterwards, so false
+            positives only cost time while false negatives lose duplicates
+
+    Returns:
+        Tuple of (bands, rows) with bands * rows <= num_perm
+    """
+    below = np.linspace(0, threshold, 200)
+    above = np.linspace(threshold, 1, 200)
+    best, best_error = (1, num_perm), np.inf
+    for rows in range(1, num_perm + 1):
+        bands = num_perm // rows
+        # Mean over an evenly spaced grid times its width approximates the area
+        false_positive = np.mean(1 - (1 - below ** rows) ** bands) * threshold
+        false_negative = np.mean((1 - above ** rows) ** bands) * (1 - threshold)
+        error = false_positive_weight * false_positive + (1 - false_positive_weight) * false_negative
+        if error < best_error:
+            best, best_error = (bands, rows), error
+    return best
+
+
+class LSHIndex:
+    """
+    Locality-sensitive hashing index over MinHash signatures.
+
+    Signatures are cut into bands; each band is hashed into a bucket, and
+    workflows sharing a bucket in any band are candidate near-duplicates.
+    Candidates are then verified against the signature-estimated Jaccard
+    similarity, so lookups touch only a handful of workflows instead of the
+    whole corpus.
+    """
+
+    def __init__(self, threshold: float = 0.9, num_perm: int = 128, bands: Optional[int] = None, rows: Optional[int] = None):
+        """
+        Args:
+            threshold: Estimated Jaccard similarity at which workflows are near-duplicates
+            num_perm: Signature length
+            bands: Number of bands (chosen from the threshold if None)
+            rows: Rows per band (chosen from the threshold if None)
+
+        Raises:
+            ValueError: If the threshold is out of range or bands * rows exceeds num_perm
+        """
+        if not 0 < threshold <= 1:
+            raise ValueError(f"threshold must be in (0, 1], got {threshold}")
+        if bands is None or rows is None:
+            bands, rows = lsh_parameters(num_perm, min(threshold, 0.999))
+        if bands * rows > num_perm:
+            raise ValueError(f"bands * rows ({bands * rows}) exceeds num_perm ({num_perm})")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = rows
+        self._buckets: List[Dict[bytes, List[Hashable]]] = [{} for _ in range(bands)]
+        self._signatures: Dict[Hashable, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._signatures
+
+    def _band_keys(self, signature: np.ndarray) -> List[bytes]:
+        if len(signature) != self.num_perm:
+            raise ValueError(f"Expected a signature of length {self.num_perm}, got {len(signature)}")
+        return [signature[band * self.rows:(band + 1) * self.rows].tobytes() for band in range(self.bands)]
+
+    def add(self, key: Hashable, signature: np.ndarray) -> None:
+        """
+        Index a signature under a key.
+
+        Raises:
+            ValueError: If the key is already indexed or the signature has the wrong length
+        """
+        if key in self._signatures:
+            raise ValueError(f"Key already indexed: {key!r}")
+        for buckets, band_key in zip(self._buckets, self._band_keys(signature)):
+            buckets.setdefault(band_key, []).append(key)
+        self._signatures[key] = signature
+
+    def candidates(self, signature: np.ndarray) -> List[Hashable]:
+        """Keys sharing at least one band bucket with the signature (unverified)."""
+        found: Dict[Hashable, None] = {}
+        for buckets, band_key in zip(self._buckets, self._band_keys(signature)):
+            for key in buckets.get(band_key, ()):
+                found[key] = None
+        return list(found)
+
+    def query(self, signature: np.ndarray) -> List[Tuple[Hashable, float]]:
+        """
+        Indexed near-duplicates of a signature.
+
+        Returns:
+            List of (key, estimated Jaccard similarity) at or above the
+            threshold, most similar first
+        """
+        matches = []
+        for key in self.candidates(signature):
+            similarity = estimate_jaccard(signature, self._signatures[key])
+            if similarity >= self.threshold:
+                matches.append((key, similarity))
+        matches.sort(key=lambda match: -match[1])
+        return matches
+
+    def clusters(self) -> List[List[Hashable]]:
+        """
+        Group the indexed keys into near-duplicate clusters.
+
+        Verified candidate pairs are joined transitively (union-find), so a
+        cluster is a connected component of the near-duplicate relation.
+
+        Returns:
+            Clusters of two or more keys, in insertion order, largest first
+        """
+        keys = list(self._signatures)
+        position = {key: i for i, key in enumerate(keys)}
+        parent = list(range(len(keys)))
+
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        for key, signature in self._signatures.items():
+            for other, _ in self.query(signature):
+                a, b = find(position[key]), find(position[other])
+                if a != b:
+                    parent[max(a, b)] = min(a, b)
+
+        groups: Dict[int, List[Hashable]] = {}
+        for i, key in enumerate(keys):
+            groups.setdefault(find(i), []).append(key)
+        clusters = [group for group in groups.values() if len(group) > 1]
+        clusters.sort(key=len, reverse=True)
+        return clusters
+
+
+def find_near_duplicates(
+    workflows: Iterable[N8nWorkflow],
+    threshold: float = 0.9,
+    num_perm: int = 128,
+    seed: int = 1
+) -> List[List[str]]:
+    """
+    Near-duplicate clusters of a corpus.
+
+    Args:
+        workflows: Workflows (keyed by file path, or by position if it is None)
+        threshold: Estimated Jaccard similarity of structural shingles
+        num_perm: Signature length
+        seed: MinHash seed
+
+    Returns:
+        Clusters of workflow keys with at least two members, largest first
+    """
+    workflows = list(workflows)
+    keys = [workflow.file_path if workflow.file_path is not None else str(i) for i, workflow in enumerate(workflows)]
+    signatures = MinHasher(num_perm, seed).workflow_signatures(workflows)
+    index = LSHIndex(threshold, num_perm)
+    for key, signature in zip(keys, signatures):
+        index.add(key, signature)
+    return index.clusters()
+
+
+def deduplicate_workflows(
+    workflows: Iterable[N8nWorkflow],
+    threshold: float = 0.9,
+    num_perm: int = 128,
+    seed: int = 1,
+    duplicates: Optional[Dict[str, str]] = None
+) -> Iterator[N8nWorkflow]:
+    """
+    Stream workflows, skipping near-duplicates of earlier ones.
+
+    Each workflow is looked up in an LSH index of the workflows kept so far;
+    only workflows without a near-duplicate are yielded and indexed. Feeding
+    the result to mining keeps copy-pasted workflows from inflating supports,
+    e.g. mine_frequent_itemsets(deduplicate_workflows(workflows)).
+
+    Args:
+        workflows: Stream of workflows (parsed with connections)
+        threshold: Estimated Jaccard similarity of structural shingles
+        num_perm: Signature length
+        seed: MinHash seed
+        duplicates: Optional dict filled with skipped workflow key -> kept workflow key
+
+    Yields:
+        N8nWorkflow: The first workflow of every group of near-duplicates
+    """
+    hasher = MinHasher(num_perm, seed)
+    index = LSHIndex(threshold, num_perm)
+    kept = skipped = 0
+    for i, workflow in enumerate(workflows):
+        key = workflow.file_path if workflow.file_path is not None else str(i)
+        signature = hasher.signature(workflow_shingles(workflow))
+        matches = index.query(signature)
+        if matches:
+            skipped += 1
+            if duplicates is not None:
+                duplicates[key] = matches[0][0]
+            continue
+        if key not in index:
+            index.add(key, signature)
+        kept += 1
+        yield workflow
+    logger.info(f"Kept {kept} workflows, skipped {skipped} near-duplicates")
@@ -0,0 +1,218 @@
+import logging
+from typing import List, Iterable, Optional, Tuple
+
+import numpy as np
+from scipy import sparse
+from sklearn.cluster import MiniBatchKMeans
+from sklearn.decomposition import TruncatedSVD
+
+from ..core.models import N8nWorkflow
+from .transactions import TransactionEncoder
+
+
+# Configure logging for workflow clustering
+logger = logging.getLogger(__name__)
+
+
+def tfidf(matrix: sparse.csr_matrix, idf: np.ndarray) -> sparse.csr_matrix:
+    """
+    Weight a binary workflow x item matrix by inverse document frequency and L2-normalize its rows.
+
+    Args:
+        matrix: Binary (n_workflows, n_features) CSR matrix
+        idf: Inverse document frequency of every feature
+
+    Returns:
+        float32 CSR matrix with unit-length rows (empty rows stay zero)
+    """
+    weighted = sparse.csr_matrix(matrix, dtype=np.float32, copy=True)
+    weighted.data *= idf[weighted.indices].astype(np.float32)
+    norms = np.sqrt(np.asarray(weighted.multiply(weighted).sum(axis=1)).ravel())
+    norms[norms == 0] = 1.0
+    weighted.data /= np.repeat(norms, np.diff(weighted.indptr)).astype(np.float32)
+    return weighted
+
+
+def inverse_document_frequency(document_frequency: np.ndarray, n_documents: int) -> np.ndarray:
+    """Smoothed idf, ln((1 + n) / (1 + df)) + 1, as in scikit-learn's TfidfTransformer."""
+    return np.log((1.0 + n_documents) / (1.0 + np.asarray(document_frequency, dtype=np.float64))) + 1.0
+
+
+class WorkflowClusterer:
+    """
+    Clusters workflows on sparse TF-IDF vectors of their feature items.
+
+    Items come from a TransactionEncoder: node types, node type plus
+    parameter value and node type bigrams along connections. The TF-IDF
+    matrix stays sparse; TruncatedSVD reduces it to a small dense embedding
+    (latent semantic analysis), whose unit-normalized rows are clustered
+    with mini-batch k-means. The vocabulary, idf weights and SVD are fixed
+    by fit (or the first partial_fit); later partial_fit calls only move
+    the cluster centers, so new workflows can be added as they arrive.
+    Items first seen after that are ignored.
+    """
+
+    def __init__(
+        self,
+        n_clusters: int = 20,
+        n_components: int = 50,
+        min_df: int = 2,
+        encoder: Optional[TransactionEncoder] = None,
+        batch_size: int = 1024,
+        random_state: Optional[int] = None
+    ):
+        """
+        Args:
+            n_clusters: Number of clusters
+            n_components: Embedding dimensions (capped below the number of features)
+            min_df: Items in fewer workflows are dropped from the features
+            encoder: Item encoder (default: TransactionEncoder with its defaults)
+            batch_size: Mini-batch size of k-means
+            random_state: Seed for the SVD and k-means
+        """
+        self.n_clusters = n_clusters
+        self.n_components = n_components
+        self.min_df = min_df
+        self.encoder = encoder if encoder is not None else TransactionEncoder()
+        self.batch_size = batch_size
+        self.random_state = random_state
+        self.features: Optional[np.ndarray] = None  # vocabulary ids of the feature columns
+        self.idf: Optional[np.ndarray] = None
+        self.svd: Optional[TruncatedSVD] = None
+        self.kmeans: Optional[MiniBatchKMeans] = None
+        self._columns: Optional[np.ndarray] = None  # vocabulary id -> feature column or -1
+        self.keys: List[Optional[str]] = []  # file paths of the workflows clustered by fit
+        self.labels: Optional[np.ndarray] = None  # their clusters
+
+    @property
+    def is_fitted(self) -> bool:
+        return self.kmeans is not None
+
+    def _encode(self, workflows: Iterable[N8nWorkflow], grow: bool) -> Tuple[sparse.csr_matrix, List[Optional[str]]]:
+        # Binary workflow x vocabulary matrix; with grow=False unknown items are dropped
+        vocabulary = self.encoder.vocabulary
+        indptr = [0]
+        indices: List[int] = []
+        keys = []
+        for workflow in workflows:
+            indices.extend(vocabulary.encode(self.encoder.items(workflow), grow=grow))
+            indptr.append(len(indices))
+            keys.append(workflow.file_path)
+        matrix = sparse.csr_matrix(
+            (np.ones(len(indices), dtype=np.float32), np.array(indices, dtype=np.int64), np.array(indptr)),
+            shape=(len(keys), len(vocabulary))
+        )
+        return matrix, keys
+
+    def _feature_matrix(self, matrix: sparse.csr_matrix) -> sparse.csr_matrix:
+        # Restrict to the feature columns fixed by fit; ids beyond them (items
+        # another user of a shared vocabulary added later) are not features
+        columns = np.full(matrix.shape[1], -1, dtype=np.int64)
+        known = min(matrix.shape[1], len(self._columns))
+        columns[:known] = self._columns[:known]
+        mapped = columns[matrix.indices]
+        keep = mapped >= 0
+        kept = np.zeros(len(keep) + 1, dtype=np.int64)
+        np.cumsum(keep, out=kept[1:])
+        indptr = kept[matrix.indptr]
+        return sparse.csr_matrix(
+            (matrix.data[keep], mapped[keep], indptr), shape=(matrix.shape[0], len(self.features))
+        )
+
+    def _embed(self, matrix: sparse.csr_matrix) -> np.ndarray:
+        embedding = self.svd.transform(tfidf(matrix, self.idf))
+        norms = np.linalg.norm(embedding, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return embedding / norms
+
+    def fit(self, workflows: Iterable[N8nWorkflow]) -> 'WorkflowClusterer':
+        """
+        Build the features and embedding from a corpus and cluster it.
+
+        Raises:
+            ValueError: If there are fewer workflows than clusters or fewer than two features
+        """
+        matrix, keys = self._encode(workflows, grow=True)
+        n_workflows = matrix.shape[0]
+        if n_workflows < self.n_clusters:
+            raise ValueError(f"Need at least n_clusters={self.n_clusters} workflows, got {n_workflows}")
+
+        document_frequency = np.bincount(matrix.indices, minlength=matrix.shape[1])
+        self.features = np.flatnonzero(document_frequency >= self.min_df)
+        if len(self.features) < 2:
+            raise ValueError(f"Only {len(self.features)} items occur in at least min_df={self.min_df} workflows")
+        self._columns = np.full(matrix.shape[1], -1, dtype=np.int64)
+        self._columns[self.features] = np.arange(len(self.features))
+        self.idf = inverse_document_frequency(document_frequency[self.features], n_workflows)
+
+        features = self._feature_matrix(matrix)
+        n_components = min(self.n_components, len(self.features) - 1)
+        self.svd = TruncatedSVD(n_components=n_components, random_state=self.random_state)
+        self.svd.fit(tfidf(features, self.idf))
+        embedding = self._embed(features)
+
+        self.kmeans = MiniBatchKMeans(
+            n_clusters=self.n_clusters, batch_size=self.batch_size, random_state=self.random_state, n_init=3
+        )
+        self.kmeans.fit(embedding)
+        self.keys = keys
+        self.labels = self.kmeans.labels_
+        logger.info(
+            f"Clustered {n_workflows} workflows on {len(self.features)} items "
+            f"({n_components} SVD components, {self.svd.explained_variance_ratio_.sum():.0%} of variance)"
+        )
+        return self
+
+    def partial_fit(self, workflows: Iterable[N8nWorkflow]) -> 'WorkflowClusterer':
+        """
+        Update the clusters with newly arrived workflows.
+
+        The first call on an unfitted clusterer fits it on the given
+        workflows; later calls keep the features and embedding and take one
+        mini-batch k-means step per batch_size workflows.
+        """
+        if not self.is_fitted:
+            return self.fit(workflows)
+        embedding = self.transform(workflows)
+        for start in range(0, len(embedding), self.batch_size):
+            self.kmeans.partial_fit(embedding[start:start + self.batch_size])
+        return self
+
+    def transform(self, workflows: Iterable[N8nWorkflow]) -> np.ndarray:
+        """
+        Embed workflows with the fitted features.
+
+        Returns:
+            Array of shape (n_workflows, n_components) with unit-length rows
+
+        Raises:
+            ValueError: If the clusterer is not fitted
+        """
+        if not self.is_fitted:
+            raise ValueError("WorkflowClusterer is not fitted")
+        matrix, _ = self._encode(workflows, grow=False)
+        return self._embed(self._feature_matrix(matrix))
+
+    def predict(self, workflows: Iterable[N8nWorkflow]) -> np.ndarray:
+        """Cluster label of every workflow."""
+        return self.kmeans.predict(self.transform(workflows))
+
+    def top_items(self, n: int = 10) -> List[List[Tuple[str, float]]]:
+        """
+        Characteristic items of every cluster.
+
+        Cluster centers are mapped back from the embedding to item weights
+        through the SVD components.
+
+        Returns:
+            One list per cluster of (item, weight), highest weight first
+        """
+        if not self.is_fitted:
+            raise ValueError("WorkflowClusterer is not fitted")
+        weights = self.kmeans.cluster_centers_ @ self.svd.components_
+        items = self.encoder.vocabulary.items
+        result = []
+        for row in weights:
+            top = np.argsort(-row, kind='stable')[:n]
+            result.append([(items[self.features[column]], float(row[column])) for column in top])
+        return result
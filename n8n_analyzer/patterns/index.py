@@ -0,0 +1,218 @@
+import os
+import zlib
+import json
+import struct
+import logging
+from typing import List, Dict, Iterable, Callable, Optional, Sequence
+
+from ..core.models import N8nWorkflow
+from .mining import ItemVocabulary, extract_node_type_items, transaction_bitsets
+
+
+# Configure logging for the transaction index
+logger = logging.getLogger(__name__)
+
+# File layout:
+#   header   INDEX_MAGIC [u64 metadata length]
+#   metadata JSON {version, n_transactions, items, keys, lengths}
+#   bitmaps  zlib-compressed little-endian bitmap of each item, in items order
+INDEX_MAGIC = b"N8NBIDX1"
+INDEX_VERSION = 1
+_HEADER = struct.Struct('<8sQ')
+
+
+class TransactionIndex:
+    """
+    Inverted index from item to the bitset of transactions (workflows) containing it.
+
+    Bitsets are Python ints (bit i set if transaction i contains the item),
+    so the support of an itemset is an AND over its items followed by a
+    popcount, without touching the corpus. On disk each bitset is stored
+    zlib-compressed and decompressed lazily on first use.
+    """
+
+    def __init__(
+        self,
+        vocabulary: ItemVocabulary,
+        n_transactions: int,
+        keys: Optional[List[Optional[str]]] = None
+    ):
+        """
+        Args:
+            vocabulary: Item vocabulary; bitsets are keyed by its ids
+            n_transactions: Number of indexed transactions
+            keys: Optional identifier (e.g. file path) of each transaction
+        """
+        self.vocabulary = vocabulary
+        self.n_transactions = n_transactions
+        self.keys = keys if keys is not None else [None] * n_transactions
+        self._bitsets: Dict[int, int] = {}
+        self._compressed: Dict[int, bytes] = {}
+
+    @classmethod
+    def from_transactions(
+        cls,
+        transactions: Sequence[Sequence[int]],
+        vocabulary: ItemVocabulary,
+        keys: Optional[List[Optional[str]]] = None
+    ) -> 'TransactionIndex':
+        """
+        Index integer-encoded transactions.
+
+        Args:
+            transactions: Item-id sequences (e.g. from ItemVocabulary.encode)
+            vocabulary: Vocabulary the ids belong to
+            keys: Optional identifier of each transaction
+        """
+        if keys is not None and len(keys) != len(transactions):
+            raise ValueError(f"Got {len(keys)} keys for {len(transactions)} transactions")
+        index = cls(vocabulary, len(transactions), keys)
+        index._bitsets = transaction_bitsets(transactions)
+        return index
+
+    @classmethod
+    def from_workflows(
+        cls,
+        workflows: Iterable[N8nWorkflow],
+        item_extractor: Callable[[N8nWorkflow], Iterable[str]] = extract_node_type_items,
+        vocabulary: Optional[ItemVocabulary] = None
+    ) -> 'TransactionIndex':
+        """
+        Build the index from a stream of workflows, keyed by file path.
+
+        Args:
+            workflows: Iterable of workflows (e.g. parse_workflows_batch output)
+            item_extractor: Function turning a workflow into its transaction items
+            vocabulary: Optional shared vocabulary (a new one is created if None)
+        """
+        vocabulary = vocabulary if vocabulary is not None else ItemVocabulary()
+        transactions = []
+        keys = []
+        for workflow in workflows:
+            transactions.append(vocabulary.encode(item_extractor(workflow)))
+            keys.append(workflow.file_path)
+        return cls.from_transactions(transactions, vocabulary, keys)
+
+    def __len__(self) -> int:
+        return self.n_transactions
+
+    def _bitset(self, item_id: int) -> int:
+        bits = self._bitsets.get(item_id)
+        if bits is None:
+            compressed = self._compressed.pop(item_id, None)
+            bits = 0 if compressed is None else int.from_bytes(zlib.decompress(compressed), 'little')
+            self._bitsets[item_id] = bits
+        return bits
+
+    def bitset(self, items: Iterable[str]) -> int:
+        """
+        Return the bitset of transactions containing all the given items.
+
+        An empty itemset matches every transaction; unknown items match none.
+        """
+        item_ids = []
+        for item in items:
+            item_id = self.vocabulary.ids.get(item)
+            if item_id is None:
+                return 0
+            item_ids.append(item_id)
+        if not item_ids:
+            return (1 << self.n_transactions) - 1
+
+        bitsets = sorted((self._bitset(item_id) for item_id in item_ids), key=int.bit_count)
+        bits = bitsets[0]
+        for other in bitsets[1:]:
+            if not bits:
+                break
+            bits &= other
+        return bits
+
+    def count(self, items: Iterable[str]) -> int:
+        """Return the number of transactions containing all the given items."""
+        return self.bitset(items).bit_count()
+
+    def support(self, items: Iterable[str]) -> float:
+        """Return the fraction of transactions containing all the given items."""
+        if not self.n_transactions:
+            return 0.0
+        return self.count(items) / self.n_transactions
+
+    def transactions(self, items: Iterable[str]) -> List[int]:
+        """Return the positions of the transactions containing all the given items."""
+        bits = self.bitset(items)
+        positions = []
+        while bits:
+            low = bits & -bits
+            positions.append(low.bit_length() - 1)
+            bits ^= low
+        return positions
+
+    def matching_keys(self, items: Iterable[str]) -> List[Optional[str]]:
+        """Return the keys (e.g. file paths) of the transactions containing all the given items."""
+        return [self.keys[position] for position in self.transactions(items)]
+
+    def save(self, index_path: str, compression_level: int = 6) -> None:
+        """
+        Write the index to a file atomically.
+
+        Args:
+            index_path: Destination path
+            compression_level: zlib compression level of the bitmaps
+        """
+        n_bytes = (self.n_transactions + 7) // 8
+        blobs = []
+        for item_id in range(len(self.vocabulary)):
+            if item_id in self._compressed and item_id not in self._bitsets:
+                blobs.append(self._compressed[item_id])
+            else:
+                bitmap = self._bitset(item_id).to_bytes(n_bytes, 'little')
+                blobs.append(zlib.compress(bitmap, compression_level))
+
+        metadata = json.dumps({
+            'version': INDEX_VERSION,
+            'n_transactions': self.n_transactions,
+            'items': self.vocabulary.items,
+            'keys': self.keys,
+            'lengths': [len(blob) for blob in blobs]
+        }, separators=(',', ':')).encode('utf-8')
+
+        directory = os.path.dirname(os.path.abspath(index_path))
+        os.makedirs(directory, exist_ok=True)
+        temp_path = f"{index_path}.tmp"
+        with open(temp_path, 'wb') as f:
+            f.write(_HEADER.pack(INDEX_MAGIC, len(metadata)))
+            f.write(metadata)
+            for blob in blobs:
+                f.write(blob)
+        os.replace(temp_path, index_path)
+        logger.debug(f"Saved index of {self.n_transactions} transactions, {len(blobs)} items to {index_path}")
+
+    @classmethod
+    def load(cls, index_path: str) -> 'TransactionIndex':
+        """
+        Load an index written by save(); bitmaps are decompressed on first use.
+
+        Args:
+            index_path: Path of the index file
+
+        Raises:
+            ValueError: If the file is not an index or has an unsupported version
+        """
+        with open(index_path, 'rb') as f:
+            data = f.read()
+
+        if len(data) < _HEADER.size:
+            raise ValueError(f"Not a transaction index: {index_path}")
+        magic, metadata_length = _HEADER.unpack_from(data)
+        if magic != INDEX_MAGIC:
+            raise ValueError(f"Not a transaction index: {index_path}")
+        metadata = json.loads(data[_HEADER.size:_HEADER.size + metadata_length])
+        if metadata.get('version') != INDEX_VERSION:
+            raise ValueError(f"Unsupported index version: {metadata.get('version')}")
+
+        index = cls(ItemVocabulary(metadata['items']), metadata['n_transactions'], metadata['keys'])
+        offset = _HEADER.size + metadata_length
+        for item_id, length in enumerate(metadata['lengths']):
+            index._compressed[item_id] = data[offset:offset + length]
+            offset += length
+        return index
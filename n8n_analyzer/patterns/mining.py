@@ -0,0 +1,325 @@
+import math
+import logging
+from collections import Counter
+from dataclasses import dataclass
+from itertools import combinations
+from typing import List, Dict, Iterable, Callable, Optional, Sequence, Set, Tuple, FrozenSet
+
+from ..core.models import N8nWorkflow
+
+
+# Configure logging for pattern mining
+logger = logging.getLogger(__name__)
+
+
+def extract_node_type_items(workflow: N8nWorkflow) -> Set[str]:
+    """
+    Default transaction for a workflow: the set of node types it uses.
+
+    Args:
+        workflow: Parsed workflow
+
+    Returns:
+        Set of node type names
+    """
+    return {node.type for node in workflow.nodes}
+
+
+class ItemVocabulary:
+    """
+    Growing bidirectional mapping between item names and dense integer ids.
+
+    Ids are assigned in first-seen order, so a vocabulary can be shared
+    across batches of a stream and extended as new items appear.
+    """
+
+    def __init__(self, items: Iterable[str] = ()):
+        self.items: List[str] = []
+        self.ids: Dict[str, int] = {}
+        for item in items:
+            self.add(item)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __contains__(self, item: str) -> bool:
+        return item in self.ids
+
+    def add(self, item: str) -> int:
+        """Return the id of an item, assigning a new one if needed."""
+        item_id = self.ids.get(item)
+        if item_id is None:
+            item_id = self.ids[item] = len(self.items)
+            self.items.append(item)
+        return item_id
+
+    def encode(self, items: Iterable[str], grow: bool = True) -> Tuple[int, ...]:
+        """
+        Encode a transaction as a sorted tuple of unique item ids.
+
+        Args:
+            items: Item names
+            grow: If False, unknown items are dropped instead of added
+        """
+        if grow:
+            return tuple(sorted({self.add(item) for item in items}))
+        return tuple(sorted({self.ids[item] for item in items if item in self.ids}))
+
+    def decode(self, item_ids: Iterable[int]) -> FrozenSet[str]:
+        """Return the item names of a set of ids."""
+        return frozenset(self.items[item_id] for item_id in item_ids)
+
+
+@dataclass(frozen=True)
+class FrequentItemset:
+    """An itemset with its absolute and relative support."""
+    items: FrozenSet[str]
+    count: int
+    support: float
+
+
+class _FPNode:
+    """Node of an FP-tree; children are keyed by integer item id."""
+    __slots__ = ('item', 'count', 'parent', 'children')
+
+    def __init__(self, item: Optional[int], parent: Optional['_FPNode']):
+        self.item = item
+        self.count = 0
+        self.parent = parent
+        self.children: Dict[int, '_FPNode'] = {}
+
+
+def min_count_for(min_support: float, n_transactions: int) -> int:
+    """
+    Convert a relative minimum support into an absolute transaction count.
+
+    Args:
+        min_support: Minimum support as a fraction in (0, 1]
+        n_transactions: Number of transactions
+
+    Raises:
+        ValueError: If min_support is outside (0, 1]
+    """
+    if not 0 < min_support <= 1:
+        raise ValueError(f"min_support must be in (0, 1], got {min_support}")
+    # Small tolerance so that e.g. 0.3 * 10 is not rounded up to 4
+    return max(1, math.ceil(min_support * n_transactions - 1e-9))
+
+
+def fpgrowth(
+    transactions: Iterable[Sequence[int]],
+    min_support: float = 0.1,
+    max_len: Optional[int] = None,
+    min_count: Optional[int] = None
+) -> Tuple[Dict[FrozenSet[int], int], int]:
+    """
+    Mine frequent itemsets from integer-encoded transactions with FP-Growth.
+
+    Transactions are kept as sparse item-id tuples throughout: identical
+    transactions are merged with a counter and the FP-tree only holds
+    frequent items, so no dense one-hot matrix is ever built.
+
+    Args:
+        transactions: Iterable of item-id sequences (e.g. from ItemVocabulary.encode)
+        min_support: Minimum support as a fraction of transactions
+        max_len: Maximum itemset size (None for no limit)
+        min_count: Absolute minimum count; overrides min_support if given
+
+    Returns:
+        Tuple of (mapping of itemset -> absolute count, number of transactions)
+    """
+    weighted: Counter = Counter()
+    n_transactions = 0
+    for transaction in transactions:
+        n_transactions += 1
+        weighted[tuple(sorted(set(transaction)))] += 1
+
+    if min_count is None:
+        min_count = min_count_for(min_support, n_transactions) if n_transactions else 1
+
+    results: Dict[FrozenSet[int], int] = {}
+    _mine(list(weighted.items()), min_count, (), max_len, results)
+    logger.debug(
+        f"FP-Growth found {len(results)} itemsets in {n_transactions} transactions "
+        f"({len(weighted)} distinct, min_count={min_count})"
+    )
+    return results, n_transactions
+
+
+def transaction_bitsets(transactions: Sequence[Sequence[int]]) -> Dict[int, int]:
+    """
+    Build a vertical representation: item id -> bitset of the transactions containing it.
+
+    Bitsets are Python ints where bit i is set if transaction i contains the
+    item, so the support of an itemset is the popcount of the AND of its bitsets.
+
+    Args:
+        transactions: Item-id sequences, indexed by position
+
+    Returns:
+        Mapping of item id to bitset
+    """
+    n_bytes = (len(transactions) + 7) // 8
+    bitmaps: Dict[int, bytearray] = {}
+    for tid, transaction in enumerate(transactions):
+        byte, bit = tid >> 3, 1 << (tid & 7)
+        for item in transaction:
+            bitmap = bitmaps.get(item)
+            if bitmap is None:
+                bitmap = bitmaps[item] = bytearray(n_bytes)
+            bitmap[byte] |= bit
+    return {item: int.from_bytes(bitmap, 'little') for item, bitmap in bitmaps.items()}
+
+
+def count_itemsets(
+    bitsets: Dict[int, int],
+    itemsets: Iterable[FrozenSet[int]]
+) -> List[int]:
+    """
+    Count the transactions containing each itemset using vertical bitsets.
+
+    Args:
+        bitsets: Output of transaction_bitsets
+        itemsets: Itemsets to count
+
+    Returns:
+        Counts in the order of itemsets
+    """
+    counts = []
+    for itemset in itemsets:
+        if not itemset:
+            raise ValueError("Cannot count the empty itemset")
+        # Intersect the rarest items first so the running bitset shrinks quickly
+        items = sorted(itemset, key=lambda item: bitsets.get(item, 0).bit_count())
+        bits = bitsets.get(items[0], 0)
+        for item in items[1:]:
+            if not bits:
+                break
+            bits &= bitsets.get(item, 0)
+        counts.append(bits.bit_count())
+    return counts
+
+
+def _build_tree(
+    weighted: List[Tuple[Sequence[int], int]],
+    min_count: int
+) -> Tuple[_FPNode, Dict[int, List[_FPNode]], Dict[int, int]]:
+    counts: Dict[int, int] = {}
+    for items, weight in weighted:
+        for item in items:
+            counts[item] = counts.get(item, 0) + weight
+    frequent = {item: count for item, count in counts.items() if count >= min_count}
+
+    # Most frequent items closest to the root maximize prefix sharing
+    rank = {item: r for r, item in enumerate(sorted(frequent, key=lambda i: (-frequent[i], i)))}
+
+    root = _FPNode(None, None)
+    header: Dict[int, List[_FPNode]] = {item: [] for item in frequent}
+    for items, weight in weighted:
+        node = root
+        for item in sorted((i for i in items if i in rank), key=rank.__getitem__):
+            child = node.children.get(item)
+            if child is None:
+                child = node.children[item] = _FPNode(item, node)
+                header[item].append(child)
+            child.count += weight
+            node = child
+    return root, header, frequent
+
+
+def _single_path(root: _FPNode) -> Optional[List[_FPNode]]:
+    path = []
+    node = root
+    while node.children:
+        if len(node.children) > 1:
+            return None
+        node = next(iter(node.children.values()))
+        path.append(node)
+    return path
+
+
+def _mine(
+    weighted: List[Tuple[Sequence[int], int]],
+    min_count: int,
+    suffix: Tuple[int, ...],
+    max_len: Optional[int],
+    results: Dict[FrozenSet[int], int]
+) -> None:
+    root, header, frequent = _build_tree(weighted, min_count)
+    if not frequent:
+        return
+
+    remaining = None if max_len is None else max_len - len(suffix)
+
+    path = _single_path(root)
+    if path is not None:
+        # Every combination of a single path is frequent; its count is that of its deepest node
+        limit = len(path) if remaining is None else min(len(path), remaining)
+        for size in range(1, limit + 1):
+            for combo in combinations(path, size):
+                results[frozenset(suffix + tuple(node.item for node in combo))] = combo[-1].count
+        return
+
+    # Least frequent first, so conditional pattern bases only contain more frequent items
+    for item in sorted(frequent, key=lambda i: (frequent[i], -i)):
+        itemset = suffix + (item,)
+        results[frozenset(itemset)] = frequent[item]
+        if remaining is not None and remaining <= 1:
+            continue
+
+        conditional = []
+        for node in header[item]:
+            prefix = []
+            parent = node.parent
+            while parent.item is not None:
+                prefix.append(parent.item)
+                parent = parent.parent
+            if prefix:
+                conditional.append((prefix, node.count))
+        if conditional:
+            _mine(conditional, min_count, itemset, max_len, results)
+
+
+def mine_frequent_itemsets(
+    workflows: Iterable[N8nWorkflow],
+    min_support: float = 0.1,
+    max_len: Optional[int] = None,
+    item_extractor: Callable[[N8nWorkflow], Iterable[str]] = extract_node_type_items,
+    vocabulary: Optional[ItemVocabulary] = None
+) -> List[FrequentItemset]:
+    """
+    Mine frequent itemsets directly from a stream of workflows.
+
+    Args:
+        workflows: Iterable of workflows (e.g. parse_workflows_batch output)
+        min_support: Minimum support as a fraction of workflows
+        max_len: Maximum itemset size (None for no limit)
+        item_extractor: Function turning a workflow into its transaction items
+        vocabulary: Optional shared vocabulary (a new one is created if None)
+
+    Returns:
+        List of FrequentItemset sorted by descending support, then by size
+    """
+    vocabulary = vocabulary if vocabulary is not None else ItemVocabulary()
+    transactions = (vocabulary.encode(item_extractor(workflow)) for workflow in workflows)
+    counts, n_transactions = fpgrowth(transactions, min_support=min_support, max_len=max_len)
+    return decode_itemsets(counts, n_transactions, vocabulary)
+
+
+def decode_itemsets(
+    counts: Dict[FrozenSet[int], int],
+    n_transactions: int,
+    vocabulary: ItemVocabulary
+) -> List[FrequentItemset]:
+    """
+    Turn integer itemset counts into FrequentItemset objects.
+
+    Returns:
+        List of FrequentItemset sorted by descending support, then by size
+    """
+    itemsets = [
+        FrequentItemset(vocabulary.decode(items), count, count / n_transactions)
+        for items, count in counts.items()
+    ]
+    itemsets.sort(key=lambda itemset: (-itemset.count, len(itemset.items), sorted(itemset.items)))
+    return itemsets
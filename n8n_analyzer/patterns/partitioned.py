@@ -0,0 +1,149 @@
+import logging
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import List, Dict, Iterable, Callable, Optional, Sequence, Set, Tuple, FrozenSet
+
+from ..core.models import N8nWorkflow
+from .mining import (
+    FrequentItemset,
+    ItemVocabulary,
+    count_itemsets,
+    decode_itemsets,
+    extract_node_type_items,
+    fpgrowth,
+    min_count_for,
+    transaction_bitsets
+)
+
+
+# Configure logging for partitioned mining
+logger = logging.getLogger(__name__)
+
+
+def _mine_partition(
+    transactions: Sequence[Tuple[int, ...]],
+    min_count: int,
+    max_len: Optional[int]
+) -> Set[FrozenSet[int]]:
+    """Phase 1: itemsets that are frequent within a single partition."""
+    counts, _ = fpgrowth(transactions, max_len=max_len, min_count=min_count)
+    return set(counts)
+
+
+def _count_partition(
+    transactions: Sequence[Tuple[int, ...]],
+    candidates: List[FrozenSet[int]]
+) -> List[int]:
+    """Phase 2: exact counts of every candidate within a single partition."""
+    return count_itemsets(transaction_bitsets(transactions), candidates)
+
+
+def partitioned_fpgrowth(
+    transactions: Sequence[Tuple[int, ...]],
+    min_support: float = 0.1,
+    max_len: Optional[int] = None,
+    n_partitions: Optional[int] = None,
+    workers: Optional[int] = None,
+    executor: Optional[Executor] = None
+) -> Tuple[Dict[FrozenSet[int], int], int]:
+    """
+    Mine frequent itemsets with the two-pass SON partitioning scheme.
+
+    The transactions are split into partitions and each partition is mined
+    with FP-Growth using a proportionally scaled threshold; every globally
+    frequent itemset is locally frequent in at least one partition, so the
+    union of local results is a complete candidate set. A second pass counts
+    the candidates exactly in every partition, so the result is identical to
+    fpgrowth() on the whole data. Both passes run in a process pool when
+    workers (or an executor) is given.
+
+    Small partitions lower the local thresholds and inflate the candidate
+    set, so keep partitions to a few thousand transactions or more.
+
+    Args:
+        transactions: Integer-encoded transactions
+        min_support: Minimum support as a fraction of all transactions
+        max_len: Maximum itemset size (None for no limit)
+        n_partitions: Number of partitions (defaults to the number of workers)
+        workers: Number of worker processes; None or 1 runs in the calling process.
+            With an executor it only sets the default n_partitions (os.cpu_count() if None)
+        executor: Optional existing executor (not shut down by this function)
+
+    Returns:
+        Tuple of (mapping of itemset -> absolute count, number of transactions)
+    """
+    transactions = list(transactions)
+    n_transactions = len(transactions)
+    if n_transactions == 0:
+        return {}, 0
+
+    if workers is None and executor is not None:
+        workers = os.cpu_count()
+    max_workers = workers or 1
+    if n_partitions is None:
+        n_partitions = max_workers
+    n_partitions = max(1, min(n_partitions, n_transactions))
+
+    # Striped partitions spread any ordering in the input (e.g. by category) evenly
+    partitions = [transactions[p::n_partitions] for p in range(n_partitions)]
+
+    global_min_count = min_count_for(min_support, n_transactions)
+    # ceil(G * n_p / N): if an itemset misses this in every partition, its global count is below G
+    local_min_counts = [max(1, -(-global_min_count * len(part) // n_transactions)) for part in partitions]
+
+    owns_executor = executor is None and max_workers > 1
+    if owns_executor:
+        executor = ProcessPoolExecutor(max_workers=max_workers)
+    run = executor.map if executor is not None else map
+
+    try:
+        candidates: Set[FrozenSet[int]] = set()
+        for local in run(_mine_partition, partitions, local_min_counts, [max_len] * n_partitions):
+            candidates |= local
+        candidate_list = list(candidates)
+
+        totals = [0] * len(candidate_list)
+        for partial in run(_count_partition, partitions, [candidate_list] * n_partitions):
+            for i, count in enumerate(partial):
+                totals[i] += count
+    finally:
+        if owns_executor:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    results = {
+        itemset: count for itemset, count in zip(candidate_list, totals) if count >= global_min_count
+    }
+    logger.debug(
+        f"SON mining over {n_partitions} partitions: {len(candidate_list)} candidates, "
+        f"{len(results)} globally frequent"
+    )
+    return results, n_transactions
+
+
+def mine_frequent_itemsets_partitioned(
+    workflows: Iterable[N8nWorkflow],
+    min_support: float = 0.1,
+    max_len: Optional[int] = None,
+    item_extractor: Callable[[N8nWorkflow], Iterable[str]] = extract_node_type_items,
+    vocabulary: Optional[ItemVocabulary] = None,
+    n_partitions: Optional[int] = None,
+    workers: Optional[int] = None,
+    executor: Optional[Executor] = None
+) -> List[FrequentItemset]:
+    """
+    Partitioned counterpart of mine_frequent_itemsets.
+
+    Transactions are extracted from the workflow stream (e.g. a parallel
+    parse_workflows_batch) in the calling process, then mined with
+    partitioned_fpgrowth.
+
+    Returns:
+        List of FrequentItemset sorted by descending support, then by size
+    """
+    vocabulary = vocabulary if vocabulary is not None else ItemVocabulary()
+    transactions = [vocabulary.encode(item_extractor(workflow)) for workflow in workflows]
+    counts, n_transactions = partitioned_fpgrowth(
+        transactions, min_support=min_support, max_len=max_len,
+        n_partitions=n_partitions, workers=workers, executor=executor
+    )
+    return decode_itemsets(counts, n_transactions, vocabulary)
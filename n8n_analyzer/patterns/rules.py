@@ -0,0 +1,272 @@
+import logging
+from array import array
+from dataclasses import dataclass
+from itertools import combinations
+from typing import List, Dict, Hashable, Generator, Optional, FrozenSet
+
+import numpy as np
+
+from .mining import ItemVocabulary
+
+
+# Configure logging for association rules
+logger = logging.getLogger(__name__)
+
+# Metrics computed for every rule; any of them can rank top_rules
+RULE_METRICS = ('support', 'confidence', 'lift', 'leverage', 'conviction')
+
+
+@dataclass(frozen=True)
+class AssociationRule:
+    """An association rule antecedent -> consequent with its metrics."""
+    antecedent: FrozenSet[Hashable]
+    consequent: FrozenSet[Hashable]
+    count: int
+    support: float
+    confidence: float
+    lift: float
+    leverage: float
+    conviction: float  # inf for rules with confidence 1
+
+
+@dataclass
+class RuleBatch:
+    """
+    A batch of rules with their metrics as parallel NumPy columns.
+
+    antecedents and consequents hold the item keys of the support index
+    (e.g. integer ids from fpgrowth); decode them with an ItemVocabulary.
+    """
+    antecedents: List[FrozenSet[Hashable]]
+    consequents: List[FrozenSet[Hashable]]
+    count: np.ndarray
+    support: np.ndarray
+    confidence: np.ndarray
+    lift: np.ndarray
+    leverage: np.ndarray
+    conviction: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.antecedents)
+
+    def take(self, indices: np.ndarray) -> 'RuleBatch':
+        """Return the rules at the given positions as a new batch."""
+        return RuleBatch(
+            antecedents=[self.antecedents[i] for i in indices],
+            consequents=[self.consequents[i] for i in indices],
+            **{column: getattr(self, column)[indices] for column in ('count',) + RULE_METRICS}
+        )
+
+    def rules(self, vocabulary: Optional[ItemVocabulary] = None) -> List[AssociationRule]:
+        """Materialize the batch as AssociationRule objects, decoding ids if a vocabulary is given."""
+        decode = vocabulary.decode if vocabulary is not None else frozenset
+        return [
+            AssociationRule(decode(antecedent), decode(consequent), *values)
+            for antecedent, consequent, values in zip(
+                self.antecedents, self.consequents,
+                zip(self.count.tolist(), *(getattr(self, metric).tolist() for metric in RULE_METRICS))
+            )
+        ]
+
+
+def _concat(batches: List[RuleBatch]) -> RuleBatch:
+    return RuleBatch(
+        antecedents=[a for batch in batches for a in batch.antecedents],
+        consequents=[c for batch in batches for c in batch.consequents],
+        **{column: np.concatenate([getattr(batch, column) for batch in batches])
+           for column in ('count',) + RULE_METRICS}
+    )
+
+
+def _score(
+    antecedents: List[FrozenSet[Hashable]],
+    consequents: List[FrozenSet[Hashable]],
+    union_counts: array,
+    antecedent_counts: array,
+    consequent_counts: array,
+    n_transactions: int,
+    min_confidence: float,
+    min_lift: Optional[float]
+) -> RuleBatch:
+    """Compute all metrics of a batch at once and drop rules below the thresholds."""
+    count = np.frombuffer(union_counts, dtype=np.int64)
+    support = count / n_transactions
+    antecedent_support = np.frombuffer(antecedent_counts, dtype=np.int64) / n_transactions
+    consequent_support = np.frombuffer(consequent_counts, dtype=np.int64) / n_transactions
+
+    confidence = support / antecedent_support
+    lift = confidence / consequent_support
+    leverage = support - antecedent_support * consequent_support
+    conviction = np.full(len(count), np.inf)
+    uncertain = confidence < 1.0
+    conviction[uncertain] = (1.0 - consequent_support[uncertain]) / (1.0 - confidence[uncertain])
+
+    keep = confidence >= min_confidence
+    if min_lift is not None:
+        keep &= lift >= min_lift
+    batch = RuleBatch(antecedents, consequents, count, support, confidence, lift, leverage, conviction)
+    return batch if keep.all() else batch.take(np.flatnonzero(keep))
+
+
+def iter_rule_batches(
+    counts: Dict[FrozenSet[Hashable], int],
+    n_transactions: int,
+    min_confidence: float = 0.0,
+    min_lift: Optional[float] = None,
+    max_consequent_len: Optional[int] = None,
+    batch_size: int = 65536
+) -> Generator[RuleBatch, None, None]:
+    """
+    Stream association rules derived from frequent itemset counts.
+
+    The itemset counts act as the support index: every frequent itemset of
+    size >= 2 is split into each antecedent/consequent partition and the
+    three supports involved are looked up by frozenset. Lookups happen in
+    Python, but the metrics of a whole batch are computed in NumPy, and
+    at most batch_size candidate rules are held at a time.
+
+    Args:
+        counts: Mapping of itemset -> absolute count (e.g. from fpgrowth); must be
+            downward closed, i.e. contain every subset of every itemset
+        n_transactions: Number of transactions the counts were taken over
+        min_confidence: Minimum confidence of returned rules
+        min_lift: Optional minimum lift of returned rules
+        max_consequent_len: Maximum number of items in the consequent (None for no limit)
+        batch_size: Number of candidate rules scored per batch
+
+    Yields:
+        RuleBatch: Rules passing the thresholds (batches may be empty)
+
+    Raises:
+        ValueError: If n_transactions is not positive, batch_size is not positive
+            or a subset is missing from counts
+    """
+    if n_transactions <= 0:
+        raise ValueError(f"n_transactions must be positive, got {n_transactions}")
+    if batch_size <= 0:
+        raise ValueError(f"batch_size must be positive, got {batch_size}")
+
+    def new_buffers():
+        return [], [], array('q'), array('q'), array('q')
+
+    antecedents, consequents, union_counts, antecedent_counts, consequent_counts = new_buffers()
+    for itemset, count in counts.items():
+        size = len(itemset)
+        if size < 2:
+            continue
+        items = tuple(itemset)
+        largest = size - 1 if max_consequent_len is None else min(size - 1, max_consequent_len)
+        for consequent_size in range(1, largest + 1):
+            for consequent_items in combinations(items, consequent_size):
+                consequent = frozenset(consequent_items)
+                antecedent = itemset - consequent
+                try:
+                    antecedent_count = counts[antecedent]
+                    consequent_count = counts[consequent]
+                except KeyError as e:
+                    raise ValueError(f"Itemset counts are not downward closed: missing {set(e.args[0])}")
+
+                antecedents.append(antecedent)
+                consequents.append(consequent)
+                union_counts.append(count)
+                antecedent_counts.append(antecedent_count)
+                consequent_counts.append(consequent_count)
+
+                # Flush inside the partition loop: one k-itemset alone has 2^k - 2 candidates
+                if len(union_counts) >= batch_size:
+                    yield _score(antecedents, consequents, union_counts, antecedent_counts, consequent_counts,
+                                 n_transactions, min_confidence, min_lift)
+                    antecedents, consequents, union_counts, antecedent_counts, consequent_counts = new_buffers()
+
+    if union_counts:
+        yield _score(antecedents, consequents, union_counts, antecedent_counts, consequent_counts,
+                     n_transactions, min_confidence, min_lift)
+
+
+def generate_rules(
+    counts: Dict[FrozenSet[Hashable], int],
+    n_transactions: int,
+    vocabulary: Optional[ItemVocabulary] = None,
+    min_confidence: float = 0.5,
+    min_lift: Optional[float] = None,
+    max_consequent_len: Optional[int] = None
+) -> List[AssociationRule]:
+    """
+    Generate every association rule passing the thresholds.
+
+    Materializes the full rule set; prefer top_rules when only the best
+    rules are needed.
+
+    Args:
+        counts: Mapping of itemset -> absolute count (e.g. from fpgrowth)
+        n_transactions: Number of transactions the counts were taken over
+        vocabulary: Vocabulary to decode integer item ids with (None keeps the keys as-is)
+        min_confidence: Minimum confidence
+        min_lift: Optional minimum lift
+        max_consequent_len: Maximum number of items in the consequent
+
+    Returns:
+        List of AssociationRule sorted by descending lift, then confidence
+    """
+    rules = []
+    for batch in iter_rule_batches(counts, n_transactions, min_confidence, min_lift, max_consequent_len):
+        rules.extend(batch.rules(vocabulary))
+    rules.sort(key=lambda rule: (-rule.lift, -rule.confidence, -rule.count))
+    return rules
+
+
+def top_rules(
+    counts: Dict[FrozenSet[Hashable], int],
+    n_transactions: int,
+    k: int = 100,
+    vocabulary: Optional[ItemVocabulary] = None,
+    metric: str = 'lift',
+    min_confidence: float = 0.0,
+    min_lift: Optional[float] = None,
+    max_consequent_len: Optional[int] = None,
+    batch_size: int = 65536
+) -> List[AssociationRule]:
+    """
+    Return the k best rules by a metric without materializing the full rule set.
+
+    Each scored batch is merged with the current top k and cut back to k
+    with np.argpartition, so memory stays at O(k + batch_size).
+
+    Args:
+        counts: Mapping of itemset -> absolute count (e.g. from fpgrowth)
+        n_transactions: Number of transactions the counts were taken over
+        k: Number of rules to return
+        vocabulary: Vocabulary to decode integer item ids with (None keeps the keys as-is)
+        metric: One of RULE_METRICS
+        min_confidence: Minimum confidence
+        min_lift: Optional minimum lift
+        max_consequent_len: Maximum number of items in the consequent
+        batch_size: Number of candidate rules scored per batch
+
+    Returns:
+        Up to k AssociationRule sorted by descending metric
+
+    Raises:
+        ValueError: If metric is unknown or k is not positive
+    """
+    if metric not in RULE_METRICS:
+        raise ValueError(f"Unknown rule metric '{metric}' (expected one of {RULE_METRICS})")
+    if k <= 0:
+        raise ValueError(f"k must be positive, got {k}")
+
+    best: Optional[RuleBatch] = None
+    for batch in iter_rule_batches(
+        counts, n_transactions, min_confidence, min_lift, max_consequent_len, batch_size
+    ):
+        if not len(batch):
+            continue
+        merged = batch if best is None else _concat([best, batch])
+        if len(merged) > k:
+            merged = merged.take(np.argpartition(-getattr(merged, metric), k - 1)[:k])
+        best = merged
+
+    if best is None:
+        return []
+    # Stable sort keeps ties in a deterministic (count-descending) order
+    order = np.lexsort((-best.count, -getattr(best, metric)))
+    return best.take(order).rules(vocabulary)
@@ -0,0 +1,299 @@
+import os
+import random
+import logging
+from dataclasses import dataclass, replace
+from statistics import NormalDist
+from typing import List, Dict, Iterable, Callable, Optional, Sequence, Union, FrozenSet
+
+import numpy as np
+
+from ..core.models import N8nWorkflow
+from ..core.parser import parse_workflows_batch
+from .mining import ItemVocabulary, count_itemsets, extract_node_type_items, fpgrowth, transaction_bitsets
+
+
+# Configure logging for sampled mining
+logger = logging.getLogger(__name__)
+
+
+def category_from_filename(file_path: str) -> str:
+    """
+    Return the category suffix of a workflow file name.
+
+    Sample corpora are named workflow_<number>_<category>.json; files without
+    a suffix fall into the '' stratum.
+    """
+    stem = os.path.splitext(os.path.basename(file_path))[0]
+    parts = stem.rsplit('_', 1)
+    return parts[1] if len(parts) == 2 and not parts[1].isdigit() else ''
+
+
+def _single_stratum(file_path: str) -> str:
+    """Put every file into the '' stratum (unstratified sampling)."""
+    return ''
+
+
+@dataclass
+class WorkflowSample:
+    """A (possibly stratified) random sample of workflow files."""
+    files: List[str]
+    strata: Dict[str, str]  # sampled file -> stratum
+    population: Dict[str, int]  # stratum -> number of files in the corpus
+
+    @property
+    def population_size(self) -> int:
+        return sum(self.population.values())
+
+
+@dataclass(frozen=True)
+class ApproximateItemset:
+    """
+    An itemset with its support estimated from a sample.
+
+    lower and upper bound the confidence interval of the support;
+    exact_count and exact_support are set for verified itemsets only.
+    """
+    items: FrozenSet[str]
+    support: float
+    lower: float
+    upper: float
+    sample_count: int
+    exact_count: Optional[int] = None
+    exact_support: Optional[float] = None
+
+
+def sample_workflow_files(
+    file_paths: Sequence[str],
+    fraction: Optional[float] = None,
+    size: Optional[int] = None,
+    stratify: Union[bool, Callable[[str], str]] = False,
+    seed: Optional[int] = None
+) -> WorkflowSample:
+    """
+    Draw a simple or stratified random sample of workflow files without replacement.
+
+    Stratified samples use proportional allocation with at least one file
+    per non-empty stratum.
+
+    Args:
+        file_paths: All workflow files of the corpus
+        fraction: Fraction of files to sample
+        size: Number of files to sample (alternative to fraction)
+        stratify: False for a uniform sample, True to stratify by
+            category_from_filename, or a function mapping a path to its stratum
+        seed: Random seed for reproducible samples
+
+    Returns:
+        WorkflowSample: The sampled files with their strata
+
+    Raises:
+        ValueError: If neither or both of fraction and size are given, or they are out of range
+    """
+    if (fraction is None) == (size is None):
+        raise ValueError("Specify exactly one of fraction and size")
+    n_files = len(file_paths)
+    if fraction is not None:
+        if not 0 < fraction <= 1:
+            raise ValueError(f"fraction must be in (0, 1], got {fraction}")
+    elif size < 0:
+        raise ValueError(f"size must be non-negative, got {size}")
+    else:
+        fraction = min(1.0, size / n_files) if n_files else 1.0
+
+    if stratify is True:
+        stratum_of = category_from_filename
+    elif stratify:
+        stratum_of = stratify
+    else:
+        stratum_of = _single_stratum
+
+    groups: Dict[str, List[str]] = {}
+    for file_path in file_paths:
+        groups.setdefault(stratum_of(file_path), []).append(file_path)
+
+    rng = random.Random(seed)
+    files: List[str] = []
+    strata: Dict[str, str] = {}
+    for stratum in sorted(groups):
+        members = groups[stratum]
+        take = min(len(members), max(1, round(fraction * len(members))))
+        for file_path in rng.sample(members, take):
+            files.append(file_path)
+            strata[file_path] = stratum
+    return WorkflowSample(files, strata, {stratum: len(members) for stratum, members in groups.items()})
+
+
+def estimate_support(
+    stratum_counts: np.ndarray,
+    stratum_sizes: np.ndarray,
+    population_sizes: np.ndarray,
+    confidence: float = 0.95
+) -> Dict[str, np.ndarray]:
+    """
+    Stratified estimate of support with a normal-approximation confidence interval.
+
+    The estimate weights each stratum's sample proportion by its population
+    share; the variance includes the finite population correction, so a
+    fully sampled stratum contributes no uncertainty.
+
+    Args:
+        stratum_counts: Sample counts, shape (n_itemsets, n_strata)
+        stratum_sizes: Sample size of each stratum, shape (n_strata,)
+        population_sizes: Population size of each stratum, shape (n_strata,)
+        confidence: Confidence level of the interval
+
+    Returns:
+        Dict with 'support', 'lower' and 'upper' arrays of shape (n_itemsets,)
+    """
+    counts = np.atleast_2d(np.asarray(stratum_counts, dtype=np.float64))
+    n = np.asarray(stratum_sizes, dtype=np.float64)
+    population = np.asarray(population_sizes, dtype=np.float64)
+    weights = population / population.sum()
+
+    sampled = n > 0
+    proportions = np.zeros_like(counts)
+    proportions[:, sampled] = counts[:, sampled] / n[sampled]
+    support = proportions @ weights
+
+    correction = np.zeros_like(n)
+    correction[sampled] = (1 - n[sampled] / population[sampled]) / np.maximum(n[sampled] - 1, 1)
+    variance = (proportions * (1 - proportions)) @ (weights ** 2 * correction)
+
+    z = NormalDist().inv_cdf((1 + confidence) / 2)
+    margin = z * np.sqrt(variance)
+    return {
+        'support': support,
+        'lower': np.clip(support - margin, 0.0, 1.0),
+        'upper': np.clip(support + margin, 0.0, 1.0)
+    }
+
+
+def mine_sampled_itemsets(
+    file_paths: Sequence[str],
+    min_support: float = 0.1,
+    fraction: Optional[float] = 0.1,
+    size: Optional[int] = None,
+    stratify: Union[bool, Callable[[str], str]] = False,
+    confidence: float = 0.95,
+    max_len: Optional[int] = None,
+    item_extractor: Callable[[N8nWorkflow], Iterable[str]] = extract_node_type_items,
+    verify_top_k: int = 0,
+    seed: Optional[int] = None,
+    workers: Optional[int] = None,
+    fields: Optional[Iterable[str]] = None
+) -> List[ApproximateItemset]:
+    """
+    Mine frequent itemsets approximately from a random sample of the corpus.
+
+    The sample is mined at a threshold lowered by the sampling margin, so
+    that itemsets whose true support reaches min_support are unlikely to be
+    missed; every itemset whose confidence interval reaches min_support is
+    returned. Optionally the top verify_top_k itemsets (by estimated
+    support) are counted exactly in one pass over the full corpus.
+
+    Args:
+        file_paths: All workflow files of the corpus
+        min_support: Minimum support as a fraction of workflows
+        fraction: Fraction of files to sample (ignored if size is given)
+        size: Number of files to sample
+        stratify: False, True (by filename category) or a path -> stratum function
+        confidence: Confidence level of the support intervals
+        max_len: Maximum itemset size (None for no limit)
+        item_extractor: Function turning a workflow into its transaction items
+        verify_top_k: Number of itemsets to verify exactly over all files (0 to skip)
+        seed: Random seed for the sample
+        workers: Parser processes for the sample and verification passes
+        fields: Optional field projection for parsing (e.g. () for node types only)
+
+    Returns:
+        List of ApproximateItemset sorted by descending estimated support
+    """
+    if size is not None:
+        fraction = None
+    sample = sample_workflow_files(file_paths, fraction=fraction, size=size, stratify=stratify, seed=seed)
+
+    vocabulary = ItemVocabulary()
+    strata_names = sorted(sample.population)
+    stratum_index = {stratum: i for i, stratum in enumerate(strata_names)}
+    transactions = []
+    transaction_strata = []
+    for workflow in parse_workflows_batch(sample.files, skip_errors=True, workers=workers, fields=fields):
+        transactions.append(vocabulary.encode(item_extractor(workflow)))
+        transaction_strata.append(stratum_index[sample.strata[workflow.file_path]])
+    if not transactions:
+        return []
+
+    # Mine the sample below min_support by the worst-case sampling margin
+    z = NormalDist().inv_cdf((1 + confidence) / 2)
+    margin = z * np.sqrt(min_support * (1 - min_support) / len(transactions))
+    sample_min_support = max(min_support - margin, 1 / len(transactions))
+    counts, _ = fpgrowth(transactions, min_support=sample_min_support, max_len=max_len)
+    itemsets = list(counts)
+    if not itemsets:
+        return []
+
+    stratum_counts = np.zeros((len(itemsets), len(strata_names)), dtype=np.int64)
+    strata_array = np.asarray(transaction_strata)
+    for s in range(len(strata_names)):
+        members = [transactions[i] for i in np.flatnonzero(strata_array == s)]
+        if members:
+            stratum_counts[:, s] = count_itemsets(transaction_bitsets(members), itemsets)
+    stratum_sizes = np.bincount(strata_array, minlength=len(strata_names))
+    population_sizes = np.array([sample.population[stratum] for stratum in strata_names])
+    estimates = estimate_support(stratum_counts, stratum_sizes, population_sizes, confidence)
+
+    results = [
+        ApproximateItemset(
+            items=vocabulary.decode(itemset),
+            support=float(estimates['support'][i]),
+            lower=float(estimates['lower'][i]),
+            upper=float(estimates['upper'][i]),
+            sample_count=counts[itemset]
+        )
+        for i, itemset in enumerate(itemsets) if estimates['upper'][i] >= min_support
+    ]
+    results.sort(key=lambda itemset: (-itemset.support, len(itemset.items), sorted(itemset.items)))
+    logger.info(
+        f"Mined {len(results)} itemsets from a sample of {len(transactions)} of "
+        f"{sample.population_size} workflows"
+    )
+
+    if verify_top_k > 0 and results:
+        results[:verify_top_k] = verify_itemsets(
+            results[:verify_top_k], file_paths, item_extractor, workers=workers, fields=fields
+        )
+    return results
+
+
+def verify_itemsets(
+    itemsets: List[ApproximateItemset],
+    file_paths: Sequence[str],
+    item_extractor: Callable[[N8nWorkflow], Iterable[str]] = extract_node_type_items,
+    workers: Optional[int] = None,
+    fields: Optional[Iterable[str]] = None
+) -> List[ApproximateItemset]:
+    """
+    Count a few itemsets exactly in one pass over the full corpus.
+
+    Args:
+        itemsets: Itemsets to verify
+        file_paths: All workflow files of the corpus
+        item_extractor: Function turning a workflow into its transaction items
+        workers: Parser processes
+        fields: Optional field projection for parsing
+
+    Returns:
+        The itemsets with exact_count and exact_support filled in
+    """
+    exact = [0] * len(itemsets)
+    n_workflows = 0
+    for workflow in parse_workflows_batch(file_paths, skip_errors=True, workers=workers, fields=fields):
+        n_workflows += 1
+        items = set(item_extractor(workflow))
+        for i, itemset in enumerate(itemsets):
+            if itemset.items <= items:
+                exact[i] += 1
+    return [
+        replace(itemset, exact_count=count, exact_support=count / n_workflows if n_workflows else 0.0)
+        for itemset, count in zip(itemsets, exact)
+    ]
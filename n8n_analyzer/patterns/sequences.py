@@ -0,0 +1,208 @@
+import logging
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import List, Dict, Iterable, Iterator, Callable, Optional, Sequence, Tuple
+
+from ..core.models import N8nWorkflow
+from .mining import ItemVocabulary, min_count_for
+
+
+# Configure logging for sequential pattern mining
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class SequentialPattern:
+    """An ordered node type sequence with its workflow support."""
+    items: Tuple[str, ...]
+    count: int
+    support: float
+
+
+def extract_paths(
+    workflow: N8nWorkflow,
+    max_path_length: int = 6,
+    max_paths: int = 64
+) -> List[Tuple[str, ...]]:
+    """
+    Enumerate node type sequences along the connections of a workflow.
+
+    Simple paths are followed depth-first from every node and cut at
+    max_path_length nodes, so long chains are covered by overlapping
+    windows. Enumeration stops after max_paths paths, which bounds the work
+    on heavily branched workflows. The budget is shared round-robin, one
+    path at a time, first among the trigger nodes (no incoming connections)
+    and then, with what is left, among the other nodes, so a capped
+    workflow still gets paths from every entry point.
+
+    Args:
+        workflow: Parsed workflow
+        max_path_length: Maximum number of nodes per path
+        max_paths: Maximum number of paths per workflow
+
+    Returns:
+        List of node type tuples
+    """
+    index = workflow.index
+    nodes = index.nodes_by_id
+    successors: Dict[str, List[str]] = {node_id: [] for node_id in nodes}
+    has_incoming = set()
+    for node_id, connections in index.outgoing.items():
+        if node_id not in nodes:
+            continue
+        seen = set()
+        for connection in connections:
+            target = index.resolve(connection.target_node_id)
+            if target in nodes and target not in seen:
+                seen.add(target)
+                successors[node_id].append(target)
+                has_incoming.add(target)
+
+    def walk(start: str) -> Iterator[Tuple[str, ...]]:
+        stack = [(start,)]
+        while stack:
+            path = stack.pop()
+            extensions = []
+            if len(path) < max_path_length:
+                extensions = [target for target in successors[path[-1]] if target not in path]
+            if not extensions:
+                yield tuple(nodes[node_id].type for node_id in path)
+                continue
+            stack.extend(path + (target,) for target in reversed(extensions))
+
+    paths: List[Tuple[str, ...]] = []
+    triggers = [node_id for node_id in nodes if node_id not in has_incoming]
+    others = [node_id for node_id in nodes if node_id in has_incoming]
+    for starts in (triggers, others):
+        walks = [walk(start) for start in starts]
+        while walks and len(paths) < max_paths:
+            active = []
+            for paths_from_start in walks:
+                path = next(paths_from_start, None)
+                if path is None:
+                    continue
+                paths.append(path)
+                active.append(paths_from_start)
+                if len(paths) >= max_paths:
+                    return paths
+            walks = active
+    return paths
+
+
+def prefixspan(
+    path_sets: Iterable[Sequence[Sequence[int]]],
+    min_support: float = 0.1,
+    max_pattern_length: Optional[int] = 4,
+    min_count: Optional[int] = None
+) -> Tuple[Dict[Tuple[int, ...], int], int]:
+    """
+    Mine frequent (gapped) subsequences from per-workflow path sets.
+
+    Each workflow contributes a set of integer-coded paths; a pattern is
+    supported by a workflow if it is a subsequence of at least one of its
+    paths, and support counts workflows, not paths. Mining is SPADE-style
+    depth-first pattern growth over vertical id-lists: every pattern keeps,
+    per path, the earliest position where it ends, and is extended by
+    binary-searching the next occurrence of an item after that position.
+    Support is anti-monotone, so extensions of infrequent patterns are
+    never generated.
+
+    Args:
+        path_sets: One sequence of item-id paths per workflow
+        min_support: Minimum support as a fraction of workflows
+        max_pattern_length: Maximum pattern length (None for no limit)
+        min_count: Absolute minimum workflow count; overrides min_support if given
+
+    Returns:
+        Tuple of (mapping of pattern -> workflow count, number of workflows)
+    """
+    # Vertical layout: item -> path id -> sorted positions
+    occurrences: Dict[int, Dict[int, List[int]]] = {}
+    path_workflow: List[int] = []
+    n_workflows = 0
+    for workflow_id, paths in enumerate(path_sets):
+        n_workflows += 1
+        for path in paths:
+            path_id = len(path_workflow)
+            path_workflow.append(workflow_id)
+            for position, item in enumerate(path):
+                occurrences.setdefault(item, {}).setdefault(path_id, []).append(position)
+
+    if min_count is None:
+        min_count = min_count_for(min_support, n_workflows) if n_workflows else 1
+
+    def support(id_list: Dict[int, int]) -> int:
+        return len({path_workflow[path_id] for path_id in id_list})
+
+    results: Dict[Tuple[int, ...], int] = {}
+    frequent_items = []
+    for item, paths in occurrences.items():
+        id_list = {path_id: positions[0] for path_id, positions in paths.items()}
+        count = support(id_list)
+        if count >= min_count:
+            frequent_items.append((item, id_list))
+            results[(item,)] = count
+    frequent_items.sort()
+
+    stack = [((item,), id_list) for item, id_list in frequent_items]
+    while stack:
+        pattern, id_list = stack.pop()
+        if max_pattern_length is not None and len(pattern) >= max_pattern_length:
+            continue
+        for item, _ in frequent_items:
+            item_paths = occurrences[item]
+            extended = {}
+            for path_id, end in id_list.items():
+                positions = item_paths.get(path_id)
+                if positions is None:
+                    continue
+                i = bisect_right(positions, end)
+                if i < len(positions):
+                    extended[path_id] = positions[i]
+            if len(extended) < min_count:
+                continue
+            count = support(extended)
+            if count >= min_count:
+                results[pattern + (item,)] = count
+                stack.append((pattern + (item,), extended))
+
+    logger.debug(
+        f"PrefixSpan found {len(results)} patterns in {n_workflows} workflows "
+        f"({len(path_workflow)} paths, min_count={min_count})"
+    )
+    return results, n_workflows
+
+
+def mine_sequential_patterns(
+    workflows: Iterable[N8nWorkflow],
+    min_support: float = 0.1,
+    max_pattern_length: Optional[int] = 4,
+    path_extractor: Callable[[N8nWorkflow], List[Tuple[str, ...]]] = extract_paths,
+    vocabulary: Optional[ItemVocabulary] = None
+) -> List[SequentialPattern]:
+    """
+    Mine frequent node type sequences directly from a stream of workflows.
+
+    Args:
+        workflows: Iterable of workflows (e.g. parse_workflows_batch output)
+        min_support: Minimum support as a fraction of workflows
+        max_pattern_length: Maximum pattern length (None for no limit)
+        path_extractor: Function turning a workflow into its paths (e.g. extract_paths
+            with other caps via functools.partial)
+        vocabulary: Optional shared vocabulary (a new one is created if None)
+
+    Returns:
+        List of SequentialPattern sorted by descending support, then by length
+    """
+    vocabulary = vocabulary if vocabulary is not None else ItemVocabulary()
+    path_sets = (
+        [tuple(vocabulary.add(item) for item in path) for path in path_extractor(workflow)]
+        for workflow in workflows
+    )
+    counts, n_workflows = prefixspan(path_sets, min_support=min_support, max_pattern_length=max_pattern_length)
+    patterns = [
+        SequentialPattern(tuple(vocabulary.items[item] for item in pattern), count, count / n_workflows)
+        for pattern, count in counts.items()
+    ]
+    patterns.sort(key=lambda pattern: (-pattern.count, len(pattern.items), pattern.items))
+    return patterns
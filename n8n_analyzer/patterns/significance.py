@@ -0,0 +1,291 @@
+import math
+import logging
+from collections import Counter
+from dataclasses import dataclass
+from typing import List, Dict, Hashable, Optional, Sequence, Tuple, FrozenSet
+
+import numpy as np
+from scipy import sparse
+from scipy import stats as scipy_stats
+
+from .mining import ItemVocabulary, transaction_bitsets
+from .rules import AssociationRule
+
+
+# Configure logging for significance testing
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RuleSignificance:
+    """Significance and bootstrap intervals of an association rule."""
+    rule: AssociationRule
+    chi2: float
+    p_value: float  # chi-square test of independence (1 degree of freedom)
+    p_bonferroni: float
+    q_value: float  # Benjamini-Hochberg adjusted p-value
+    permutation_p: float  # exact one-sided permutation p-value
+    support_interval: Tuple[float, float]
+    confidence_interval: Tuple[float, float]
+    lift_interval: Tuple[float, float]
+
+
+@dataclass
+class ItemsetIncidence:
+    """
+    Which itemsets occur in which workflows, with identical workflows collapsed.
+
+    Row g of membership stands for multiplicities[g] workflows whose
+    transactions agree on all items of the itemsets under test.
+    """
+    itemsets: List[FrozenSet[int]]
+    membership: sparse.csr_matrix  # (n_groups, n_itemsets), 1.0 where the itemset occurs
+    multiplicities: np.ndarray  # (n_groups,) int64
+
+    @property
+    def n_transactions(self) -> int:
+        return int(self.multiplicities.sum())
+
+    def counts(self) -> np.ndarray:
+        """Exact count of every itemset."""
+        return self.membership.T @ self.multiplicities
+
+
+def itemset_incidence(
+    transactions: Sequence[Sequence[int]],
+    itemsets: Sequence[FrozenSet[int]]
+) -> ItemsetIncidence:
+    """
+    Build the workflow x itemset incidence for a set of itemsets.
+
+    Transactions are first restricted to the items of the itemsets and
+    deduplicated, so the matrix has one row per distinct restricted
+    transaction rather than one per workflow.
+
+    Args:
+        transactions: Integer-encoded transactions
+        itemsets: Itemsets (of item ids) to track
+    """
+    relevant = set().union(*itemsets) if itemsets else set()
+    groups = Counter(tuple(sorted(relevant.intersection(transaction))) for transaction in transactions)
+    rows = list(groups)
+    multiplicities = np.fromiter((groups[row] for row in rows), dtype=np.int64, count=len(rows))
+
+    bitsets = transaction_bitsets(rows)
+    n_bytes = (len(rows) + 7) // 8
+    all_rows = (1 << len(rows)) - 1
+    indptr = [0]
+    indices = []
+    for itemset in itemsets:
+        bits = all_rows
+        for item in itemset:
+            bits &= bitsets.get(item, 0)
+        packed = np.frombuffer(bits.to_bytes(n_bytes, 'little'), dtype=np.uint8)
+        column = np.flatnonzero(np.unpackbits(packed, bitorder='little'))
+        indices.append(column)
+        indptr.append(indptr[-1] + len(column))
+    indices = np.concatenate(indices) if indices else np.empty(0, dtype=np.int64)
+    membership = sparse.csc_matrix(
+        (np.ones(len(indices), dtype=np.float32), indices, indptr), shape=(len(rows), len(itemsets))
+    ).tocsr()
+    return ItemsetIncidence(list(itemsets), membership, multiplicities)
+
+
+def bootstrap_counts(
+    incidence: ItemsetIncidence,
+    n_bootstrap: int = 1000,
+    seed: Optional[int] = None,
+    chunk_size: int = 4096
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Bootstrap replicates of the itemset counts without re-mining.
+
+    Uses the Poisson bootstrap: every workflow gets an independent
+    Poisson(1) weight, so a group of m identical workflows gets a single
+    Poisson(m) weight and all replicates of all itemsets are one matrix
+    product, computed in chunks of groups to bound memory.
+
+    Args:
+        incidence: Output of itemset_incidence
+        n_bootstrap: Number of replicates
+        seed: Random seed
+        chunk_size: Groups per chunk
+
+    Returns:
+        Tuple of (weighted counts, shape (n_bootstrap, n_itemsets), replicate
+        sizes, shape (n_bootstrap,))
+    """
+    rng = np.random.default_rng(seed)
+    n_groups, n_itemsets = incidence.membership.shape
+    counts = np.zeros((n_itemsets, n_bootstrap))
+    totals = np.zeros(n_bootstrap)
+    for start in range(0, n_groups, chunk_size):
+        end = min(start + chunk_size, n_groups)
+        # float32 holds integer counts exactly up to 2**24 per chunk
+        weights = rng.poisson(incidence.multiplicities[start:end], size=(n_bootstrap, end - start)).astype(np.float32)
+        counts += incidence.membership[start:end].T @ weights.T
+        totals += weights.sum(axis=1, dtype=np.float64)
+    return counts.T, totals
+
+
+def chi_square_test(
+    n_union: np.ndarray,
+    n_antecedent: np.ndarray,
+    n_consequent: np.ndarray,
+    n_transactions: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Pearson chi-square test of independence of antecedent and consequent.
+
+    Args:
+        n_union: Counts of antecedent and consequent together
+        n_antecedent: Antecedent counts
+        n_consequent: Consequent counts
+        n_transactions: Number of transactions
+
+    Returns:
+        Tuple of (chi-square statistics, p-values) with one degree of freedom
+    """
+    n = float(n_transactions)
+    a = np.asarray(n_union, dtype=np.float64)
+    row = np.asarray(n_antecedent, dtype=np.float64)
+    col = np.asarray(n_consequent, dtype=np.float64)
+    numerator = n * (a * (n - row - col + a) - (row - a) * (col - a)) ** 2
+    denominator = row * (n - row) * col * (n - col)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        statistic = np.where(denominator > 0, numerator / denominator, 0.0)
+    return statistic, scipy_stats.chi2.sf(statistic, 1)
+
+
+def permutation_p_values(
+    n_union: np.ndarray,
+    n_antecedent: np.ndarray,
+    n_consequent: np.ndarray,
+    n_transactions: int
+) -> np.ndarray:
+    """
+    Exact one-sided permutation p-values for positive association.
+
+    Under random permutation of the consequent column the joint count is
+    hypergeometric, so the p-value P(X >= n_union) is computed exactly
+    instead of by simulation (equivalent to Fisher's exact test).
+    """
+    return scipy_stats.hypergeom.sf(
+        np.asarray(n_union) - 1, n_transactions, np.asarray(n_consequent), np.asarray(n_antecedent)
+    )
+
+
+def bonferroni(p_values: np.ndarray) -> np.ndarray:
+    """Bonferroni-adjusted p-values (family-wise error rate)."""
+    p_values = np.asarray(p_values, dtype=np.float64)
+    return np.minimum(p_values * len(p_values), 1.0)
+
+
+def benjamini_hochberg(p_values: np.ndarray) -> np.ndarray:
+    """Benjamini-Hochberg adjusted p-values (q-values controlling the false discovery rate)."""
+    p_values = np.asarray(p_values, dtype=np.float64)
+    m = len(p_values)
+    if not m:
+        return p_values
+    order = np.argsort(p_values)
+    scaled = p_values[order] * m / np.arange(1, m + 1)
+    adjusted = np.minimum.accumulate(scaled[::-1])[::-1]
+    result = np.empty(m)
+    result[order] = np.minimum(adjusted, 1.0)
+    return result
+
+
+def assess_rules(
+    rules: Sequence[AssociationRule],
+    transactions: Sequence[Sequence[int]],
+    vocabulary: Optional[ItemVocabulary] = None,
+    n_bootstrap: int = 1000,
+    confidence: float = 0.95,
+    seed: Optional[int] = None
+) -> List[RuleSignificance]:
+    """
+    Test association rules for significance and bootstrap their metrics.
+
+    Args:
+        rules: Rules to assess (e.g. from generate_rules or top_rules)
+        transactions: The integer-encoded transactions the rules were mined from
+        vocabulary: Vocabulary to encode item names with, if the rules were decoded
+        n_bootstrap: Number of bootstrap replicates (0 to skip the intervals)
+        confidence: Confidence level of the bootstrap percentile intervals
+        seed: Random seed
+
+    Returns:
+        List of RuleSignificance in the order of rules
+
+    Raises:
+        ValueError: If a rule refers to an item missing from the vocabulary
+    """
+    if not rules:
+        return []
+
+    def encode(items: FrozenSet[Hashable]) -> FrozenSet[int]:
+        if vocabulary is None:
+            return frozenset(items)
+        missing = [item for item in items if item not in vocabulary]
+        if missing:
+            raise ValueError(f"Items not in the vocabulary: {missing}")
+        return frozenset(vocabulary.ids[item] for item in items)
+
+    # Columns: antecedent, consequent and union of each rule (shared when repeated)
+    columns: Dict[FrozenSet[int], int] = {}
+    rule_columns = []
+    for rule in rules:
+        antecedent, consequent = encode(rule.antecedent), encode(rule.consequent)
+        keys = (antecedent, consequent, antecedent | consequent)
+        rule_columns.append([columns.setdefault(key, len(columns)) for key in keys])
+    rule_columns = np.array(rule_columns)
+
+    incidence = itemset_incidence(transactions, list(columns))
+    n = incidence.n_transactions
+    exact = incidence.counts()
+    n_antecedent, n_consequent, n_union = (exact[rule_columns[:, i]] for i in range(3))
+
+    chi2, p_values = chi_square_test(n_union, n_antecedent, n_consequent, n)
+    p_bonferroni = bonferroni(p_values)
+    q_values = benjamini_hochberg(p_values)
+    permutation = permutation_p_values(n_union, n_antecedent, n_consequent, n)
+
+    intervals = {}
+    if n_bootstrap > 0:
+        counts, totals = bootstrap_counts(incidence, n_bootstrap, seed)
+        boot_antecedent, boot_consequent, boot_union = (counts[:, rule_columns[:, i]] for i in range(3))
+        totals = totals[:, None]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            metrics = {
+                'support': boot_union / totals,
+                'confidence': boot_union / boot_antecedent,
+                'lift': boot_union * totals / (boot_antecedent * boot_consequent)
+            }
+        tail = (1 - confidence) / 2 * 100
+        for name, values in metrics.items():
+            finite = np.isfinite(values)
+            if finite.all():
+                intervals[name] = np.percentile(values, [tail, 100 - tail], axis=0)
+            else:
+                # Replicates where the antecedent never occurs have no defined metric
+                intervals[name] = np.nanpercentile(np.where(finite, values, np.nan), [tail, 100 - tail], axis=0)
+
+    def interval(name: str, i: int) -> Tuple[float, float]:
+        if name not in intervals:
+            return (math.nan, math.nan)
+        return (float(intervals[name][0, i]), float(intervals[name][1, i]))
+
+    return [
+        RuleSignificance(
+            rule=rule,
+            chi2=float(chi2[i]),
+            p_value=float(p_values[i]),
+            p_bonferroni=float(p_bonferroni[i]),
+            q_value=float(q_values[i]),
+            permutation_p=float(permutation[i]),
+            support_interval=interval('support', i),
+            confidence_interval=interval('confidence', i),
+            lift_interval=interval('lift', i)
+        )
+        for i, rule in enumerate(rules)
+    ]
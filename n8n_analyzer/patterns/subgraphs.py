@@ -0,0 +1,321 @@
+import logging
+from collections import Counter
+from dataclasses import dataclass
+from typing import List, Dict, Iterable, Optional, Sequence, Set, Tuple, FrozenSet
+
+from ..core.models import N8nWorkflow
+from .mining import ItemVocabulary, min_count_for
+
+
+# Configure logging for subgraph mining
+logger = logging.getLogger(__name__)
+
+# Edge labels of the undirected view of a directed graph, relative to the
+# traversal direction: the edge goes forward, backward, or both ways.
+_FORWARD = 0
+_BACKWARD = 1
+_BOTH = 2
+_FLIP = {_FORWARD: _BACKWARD, _BACKWARD: _FORWARD, _BOTH: _BOTH}
+
+# A DFS code edge: (from vertex, to vertex, from label, edge label, to label)
+DFSEdge = Tuple[int, int, int, int, int]
+
+
+@dataclass(frozen=True)
+class FrequentSubgraph:
+    """
+    A connected node type subgraph with its workflow support.
+
+    nodes holds the node type of each pattern vertex; edges are directed
+    (source, target) pairs of vertex indices. dfs_code is the canonical
+    (minimum) DFS code, which is identical for isomorphic patterns.
+    """
+    nodes: Tuple[str, ...]
+    edges: Tuple[Tuple[int, int], ...]
+    count: int
+    support: float
+    dfs_code: Tuple[DFSEdge, ...]
+
+
+class _Graph:
+    """Undirected view of a labeled directed graph with direction-encoding edge labels."""
+    __slots__ = ('labels', 'adjacency', 'weight')
+
+    def __init__(self, labels: Sequence[int], edges: Iterable[Tuple[int, int]], weight: int = 1):
+        self.labels = list(labels)
+        self.weight = weight
+        directions: Dict[Tuple[int, int], int] = {}
+        for source, target in edges:
+            if source == target:
+                continue
+            pair, direction = ((source, target), _FORWARD) if source < target else ((target, source), _BACKWARD)
+            previous = directions.get(pair)
+            directions[pair] = direction if previous in (None, direction) else _BOTH
+
+        # adjacency[v] maps neighbor -> (edge label seen from v, edge id)
+        self.adjacency: List[Dict[int, Tuple[int, int]]] = [{} for _ in self.labels]
+        for edge_id, ((low, high), direction) in enumerate(sorted(directions.items())):
+            self.adjacency[low][high] = (direction, edge_id)
+            self.adjacency[high][low] = (_FLIP[direction], edge_id)
+
+
+# An embedding of a pattern: (graph id, pattern vertex -> graph vertex, used edge ids)
+_Embedding = Tuple[int, Tuple[int, ...], FrozenSet[int]]
+
+
+def _rightmost_path(code: Sequence[DFSEdge]) -> List[int]:
+    """Vertices of the rightmost path, from the rightmost vertex back to the root."""
+    path: List[int] = []
+    for frm, to, _, _, _ in reversed(code):
+        if frm < to and (not path or to == path[-1]):
+            if not path:
+                path.append(to)
+            path.append(frm)
+    return path
+
+
+def _vertex_labels(code: Sequence[DFSEdge]) -> List[int]:
+    labels: Dict[int, int] = {}
+    for frm, to, from_label, _, to_label in code:
+        labels.setdefault(frm, from_label)
+        labels.setdefault(to, to_label)
+    return [labels[v] for v in range(len(labels))]
+
+
+def _extensions(
+    graphs: List[_Graph],
+    code: Sequence[DFSEdge],
+    embeddings: List[_Embedding],
+    allowed_labels: Optional[Set[int]] = None
+) -> Tuple[Dict[Tuple[int, int], List[_Embedding]], Dict[Tuple[int, int, int], List[_Embedding]]]:
+    """
+    Rightmost extensions of a pattern with their embeddings.
+
+    Returns:
+        Tuple of (backward extensions keyed by (to, edge label), forward
+        extensions keyed by (from, edge label, new vertex label))
+    """
+    path = _rightmost_path(code)
+    rightmost = path[0]
+    backward: Dict[Tuple[int, int], List[_Embedding]] = {}
+    forward: Dict[Tuple[int, int, int], List[_Embedding]] = {}
+
+    for graph_id, vertex_map, used in embeddings:
+        graph = graphs[graph_id]
+        rightmost_vertex = vertex_map[rightmost]
+        neighbors = graph.adjacency[rightmost_vertex]
+        for to in path[1:]:
+            edge = neighbors.get(vertex_map[to])
+            if edge is not None and edge[1] not in used:
+                backward.setdefault((to, edge[0]), []).append((graph_id, vertex_map, used | {edge[1]}))
+
+        mapped = set(vertex_map)
+        for frm in path:
+            for neighbor, (label, edge_id) in graph.adjacency[vertex_map[frm]].items():
+                if neighbor in mapped:
+                    continue
+                neighbor_label = graph.labels[neighbor]
+                if allowed_labels is not None and neighbor_label not in allowed_labels:
+                    continue
+                forward.setdefault((frm, label, neighbor_label), []).append(
+                    (graph_id, vertex_map + (neighbor,), used | {edge_id})
+                )
+
+    return backward, forward
+
+
+def _is_canonical(code: Sequence[DFSEdge]) -> bool:
+    """
+    Check whether a DFS code is the minimum DFS code of the graph it describes.
+
+    The minimum code is rebuilt greedily on the pattern graph itself: at each
+    step the smallest rightmost extension is taken (backward edges before
+    forward edges, backward to the earliest vertex, forward from the deepest
+    vertex, then by labels) and compared to the given code.
+    """
+    labels = _vertex_labels(code)
+    graph = _Graph(labels, ())
+    for edge_id, (frm, to, _, label, _) in enumerate(code):
+        graph.adjacency[frm][to] = (label, edge_id)
+        graph.adjacency[to][frm] = (_FLIP[label], edge_id)
+    graphs = [graph]
+
+    first = min(
+        (labels[v], label, labels[u])
+        for v in range(len(labels)) for u, (label, _) in graph.adjacency[v].items()
+    )
+    if first != code[0][2:]:
+        return False
+    embeddings: List[_Embedding] = [
+        (0, (v, u), frozenset({edge_id}))
+        for v in range(len(labels)) for u, (label, edge_id) in graph.adjacency[v].items()
+        if (labels[v], label, labels[u]) == first
+    ]
+
+    for k in range(1, len(code)):
+        prefix = code[:k]
+        backward, forward = _extensions(graphs, prefix, embeddings)
+        if backward:
+            to, label = min(backward)
+            rightmost = _rightmost_path(prefix)[0]
+            smallest = (rightmost, to, labels[rightmost], label, labels[to])
+            embeddings = backward[(to, label)]
+        else:
+            frm, label, new_label = min(forward, key=lambda key: (-key[0], key[1], key[2]))
+            n_vertices = _rightmost_path(prefix)[0] + 1
+            smallest = (frm, n_vertices, labels[frm], label, new_label)
+            embeddings = forward[(frm, label, new_label)]
+        if smallest != code[k]:
+            return False
+    return True
+
+
+def gspan(
+    graphs: Iterable[Tuple[Sequence[int], Iterable[Tuple[int, int]]]],
+    min_support: float = 0.1,
+    max_edges: int = 4,
+    min_count: Optional[int] = None
+) -> Tuple[Dict[Tuple[DFSEdge, ...], int], int]:
+    """
+    Mine frequent connected subgraphs of labeled directed graphs with gSpan.
+
+    Directed graphs are mined as undirected graphs whose edge labels record
+    the direction relative to the DFS traversal. Patterns are grown by
+    rightmost extension only and a pattern is expanded only if its DFS code
+    is canonical (minimal), so each isomorphism class is visited once and
+    non-canonical duplicates are cut off with their whole subtree. Vertices
+    whose label is infrequent on its own are never added to a pattern, and
+    identical input graphs are merged into one weighted graph.
+
+    Args:
+        graphs: One (vertex labels, directed (source, target) edges) pair per graph
+        min_support: Minimum support as a fraction of graphs
+        max_edges: Maximum number of edges per pattern
+        min_count: Absolute minimum graph count; overrides min_support if given
+
+    Returns:
+        Tuple of (mapping of canonical DFS code -> graph count, number of graphs)
+    """
+    merged: Counter = Counter()
+    n_graphs = 0
+    for labels, edges in graphs:
+        n_graphs += 1
+        merged[(tuple(labels), tuple(sorted(set(edges))))] += 1
+
+    if min_count is None:
+        min_count = min_count_for(min_support, n_graphs) if n_graphs else 1
+    results: Dict[Tuple[DFSEdge, ...], int] = {}
+    if max_edges < 1:
+        return results, n_graphs
+
+    graph_list = [_Graph(labels, edges, weight) for (labels, edges), weight in merged.items()]
+
+    def support(embeddings: List[_Embedding]) -> int:
+        return sum(graph_list[graph_id].weight for graph_id in {embedding[0] for embedding in embeddings})
+
+    # Single edges: (from label, edge label, to label) -> embeddings
+    label_counts: Counter = Counter()
+    for graph in graph_list:
+        for label in set(graph.labels):
+            label_counts[label] += graph.weight
+    frequent_labels = {label for label, count in label_counts.items() if count >= min_count}
+
+    seeds: Dict[Tuple[int, int, int], List[_Embedding]] = {}
+    for graph_id, graph in enumerate(graph_list):
+        for v, neighbors in enumerate(graph.adjacency):
+            if graph.labels[v] not in frequent_labels:
+                continue
+            for u, (label, edge_id) in neighbors.items():
+                if graph.labels[u] in frequent_labels:
+                    key = (graph.labels[v], label, graph.labels[u])
+                    seeds.setdefault(key, []).append((graph_id, (v, u), frozenset({edge_id})))
+
+    def grow(code: List[DFSEdge], embeddings: List[_Embedding]) -> None:
+        count = support(embeddings)
+        if count < min_count or not _is_canonical(code):
+            return
+        results[tuple(code)] = count
+        if len(code) >= max_edges:
+            return
+
+        backward, forward = _extensions(graph_list, code, embeddings, frequent_labels)
+        labels = _vertex_labels(code)
+        rightmost = _rightmost_path(code)[0]
+        for to, label in sorted(backward):
+            grow(code + [(rightmost, to, labels[rightmost], label, labels[to])], backward[(to, label)])
+        for frm, label, new_label in sorted(forward, key=lambda key: (-key[0], key[1], key[2])):
+            grow(code + [(frm, rightmost + 1, labels[frm], label, new_label)], forward[(frm, label, new_label)])
+
+    for (from_label, label, to_label), embeddings in sorted(seeds.items()):
+        grow([(0, 1, from_label, label, to_label)], embeddings)
+
+    logger.debug(
+        f"gSpan found {len(results)} subgraphs in {n_graphs} graphs "
+        f"({len(graph_list)} distinct, min_count={min_count}, max_edges={max_edges})"
+    )
+    return results, n_graphs
+
+
+def workflow_graph(workflow: N8nWorkflow, vocabulary: ItemVocabulary) -> Tuple[List[int], List[Tuple[int, int]]]:
+    """
+    Convert a workflow into (node type label ids, directed edges between node positions).
+
+    Connections whose endpoints do not resolve to a node are dropped.
+    """
+    index = workflow.index
+    positions = {node.id: i for i, node in enumerate(index.nodes_by_id.values())}
+    labels = [vocabulary.add(node.type) for node in index.nodes_by_id.values()]
+    edges = []
+    for connection in workflow.connections:
+        source = positions.get(index.resolve(connection.source_node_id))
+        target = positions.get(index.resolve(connection.target_node_id))
+        if source is not None and target is not None:
+            edges.append((source, target))
+    return labels, edges
+
+
+def decode_subgraph(code: Sequence[DFSEdge]) -> Tuple[List[int], List[Tuple[int, int]]]:
+    """Return the vertex labels and directed edges described by a DFS code."""
+    edges = []
+    for frm, to, _, label, _ in code:
+        if label in (_FORWARD, _BOTH):
+            edges.append((frm, to))
+        if label in (_BACKWARD, _BOTH):
+            edges.append((to, frm))
+    return _vertex_labels(code), edges
+
+
+def mine_frequent_subgraphs(
+    workflows: Iterable[N8nWorkflow],
+    min_support: float = 0.1,
+    max_edges: int = 4,
+    vocabulary: Optional[ItemVocabulary] = None
+) -> List[FrequentSubgraph]:
+    """
+    Mine frequent node type subgraphs (fan-out, fan-in, chains) from workflows.
+
+    Args:
+        workflows: Iterable of workflows (e.g. parse_workflows_batch output)
+        min_support: Minimum support as a fraction of workflows
+        max_edges: Maximum number of edges per pattern; keeps the search tractable
+        vocabulary: Optional shared vocabulary for node type labels
+
+    Returns:
+        List of FrequentSubgraph sorted by descending support, then by size
+    """
+    vocabulary = vocabulary if vocabulary is not None else ItemVocabulary()
+    graphs = (workflow_graph(workflow, vocabulary) for workflow in workflows)
+    counts, n_graphs = gspan(graphs, min_support=min_support, max_edges=max_edges)
+
+    subgraphs = []
+    for code, count in counts.items():
+        labels, edges = decode_subgraph(code)
+        subgraphs.append(FrequentSubgraph(
+            nodes=tuple(vocabulary.items[label] for label in labels),
+            edges=tuple(edges),
+            count=count,
+            support=count / n_graphs,
+            dfs_code=code
+        ))
+    subgraphs.sort(key=lambda subgraph: (-subgraph.count, len(subgraph.dfs_code), subgraph.dfs_code))
+    return subgraphs
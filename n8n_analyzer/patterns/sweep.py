@@ -0,0 +1,184 @@
+import logging
+from typing import List, Dict, Iterable, Callable, Optional, Sequence, Tuple, FrozenSet
+
+import numpy as np
+
+from ..core.models import N8nWorkflow
+from .mining import (
+    FrequentItemset,
+    ItemVocabulary,
+    decode_itemsets,
+    extract_node_type_items,
+    fpgrowth
+)
+from .rules import AssociationRule, generate_rules, iter_rule_batches
+
+
+# Configure logging for support sweeps
+logger = logging.getLogger(__name__)
+
+
+class SupportSweep:
+    """
+    Frequent itemsets mined once at a low threshold, queried at any higher one.
+
+    Itemsets are kept sorted by descending count, so the itemsets frequent
+    at a threshold are a prefix of that order and counting them is a binary
+    search. Rule counts are derived the same way: a rule is valid at a
+    threshold exactly when the union of its sides is frequent there.
+    """
+
+    def __init__(
+        self,
+        counts: Dict[FrozenSet[int], int],
+        n_transactions: int,
+        min_support: float,
+        vocabulary: Optional[ItemVocabulary] = None
+    ):
+        """
+        Args:
+            counts: Itemset counts mined at min_support (e.g. from fpgrowth)
+            n_transactions: Number of transactions the counts were taken over
+            min_support: Threshold the counts were mined at (the lowest queryable one)
+            vocabulary: Vocabulary to decode item ids with
+        """
+        self.n_transactions = n_transactions
+        self.min_support = min_support
+        self.vocabulary = vocabulary
+        self.itemsets: List[FrozenSet[int]] = sorted(counts, key=lambda itemset: (-counts[itemset], len(itemset)))
+        self.counts = np.fromiter((counts[itemset] for itemset in self.itemsets), dtype=np.int64, count=len(counts))
+        self.sizes = np.fromiter((len(itemset) for itemset in self.itemsets), dtype=np.int64, count=len(counts))
+        # Ascending copy for searchsorted
+        self._ascending = self.counts[::-1].copy()
+        self._rule_counts: Dict[Tuple[float, Optional[int]], np.ndarray] = {}
+
+    @classmethod
+    def mine(
+        cls,
+        transactions: Iterable[Sequence[int]],
+        min_support: float = 0.01,
+        max_len: Optional[int] = None,
+        vocabulary: Optional[ItemVocabulary] = None
+    ) -> 'SupportSweep':
+        """Mine integer-encoded transactions once at the lowest threshold of interest."""
+        counts, n_transactions = fpgrowth(transactions, min_support=min_support, max_len=max_len)
+        return cls(counts, n_transactions, min_support, vocabulary)
+
+    @classmethod
+    def from_workflows(
+        cls,
+        workflows: Iterable[N8nWorkflow],
+        min_support: float = 0.01,
+        max_len: Optional[int] = None,
+        item_extractor: Callable[[N8nWorkflow], Iterable[str]] = extract_node_type_items,
+        vocabulary: Optional[ItemVocabulary] = None
+    ) -> 'SupportSweep':
+        """Mine a stream of workflows once at the lowest threshold of interest."""
+        vocabulary = vocabulary if vocabulary is not None else ItemVocabulary()
+        transactions = (vocabulary.encode(item_extractor(workflow)) for workflow in workflows)
+        return cls.mine(transactions, min_support=min_support, max_len=max_len, vocabulary=vocabulary)
+
+    def __len__(self) -> int:
+        return len(self.itemsets)
+
+    def _min_counts(self, thresholds: np.ndarray) -> np.ndarray:
+        thresholds = np.atleast_1d(np.asarray(thresholds, dtype=np.float64))
+        if np.any(thresholds < self.min_support - 1e-12) or np.any(thresholds > 1):
+            raise ValueError(
+                f"Thresholds must be in [{self.min_support}, 1] (the sweep was mined at {self.min_support})"
+            )
+        return np.maximum(1, np.ceil(thresholds * self.n_transactions - 1e-9)).astype(np.int64)
+
+    def _n_frequent(self, min_support: float) -> int:
+        min_count = int(self._min_counts(np.array([min_support]))[0])
+        return len(self._ascending) - int(np.searchsorted(self._ascending, min_count, side='left'))
+
+    def itemset_counts(self, min_support: float) -> Dict[FrozenSet[int], int]:
+        """Itemset counts at a threshold, in the fpgrowth output format."""
+        n = self._n_frequent(min_support)
+        return dict(zip(self.itemsets[:n], self.counts[:n].tolist()))
+
+    def frequent_itemsets(self, min_support: float) -> List[FrequentItemset]:
+        """
+        Frequent itemsets at a threshold, as mine_frequent_itemsets would return them.
+
+        Raises:
+            ValueError: If no vocabulary was given or the threshold is below the mined one
+        """
+        if self.vocabulary is None:
+            raise ValueError("A vocabulary is required to decode itemsets")
+        return decode_itemsets(self.itemset_counts(min_support), self.n_transactions, self.vocabulary)
+
+    def itemset_curve(self, thresholds: Sequence[float], size: Optional[int] = None) -> np.ndarray:
+        """
+        Number of frequent itemsets at each threshold.
+
+        Args:
+            thresholds: min_support values (each at least the mined threshold)
+            size: Only count itemsets with this many items
+
+        Returns:
+            Array of counts, one per threshold
+        """
+        min_counts = self._min_counts(thresholds)
+        counts = self._ascending if size is None else np.sort(self.counts[self.sizes == size])
+        return len(counts) - np.searchsorted(counts, min_counts, side='left')
+
+    def _rule_union_counts(self, min_confidence: float, max_consequent_len: Optional[int]) -> np.ndarray:
+        key = (min_confidence, max_consequent_len)
+        if key not in self._rule_counts:
+            counts = dict(zip(self.itemsets, self.counts.tolist()))
+            batches = iter_rule_batches(
+                counts, self.n_transactions, min_confidence=min_confidence, max_consequent_len=max_consequent_len
+            )
+            union_counts = [batch.count for batch in batches]
+            self._rule_counts[key] = np.sort(np.concatenate(union_counts)) if union_counts else np.empty(0, np.int64)
+        return self._rule_counts[key]
+
+    def rule_curve(
+        self,
+        thresholds: Sequence[float],
+        min_confidence: float = 0.5,
+        max_consequent_len: Optional[int] = None
+    ) -> np.ndarray:
+        """
+        Number of association rules at each threshold.
+
+        Rules are generated once per min_confidence and only their support
+        counts are kept, so the full rule set is never materialized.
+
+        Returns:
+            Array of counts, one per threshold
+        """
+        min_counts = self._min_counts(thresholds)
+        union_counts = self._rule_union_counts(min_confidence, max_consequent_len)
+        return len(union_counts) - np.searchsorted(union_counts, min_counts, side='left')
+
+    def rules(
+        self,
+        min_support: float,
+        min_confidence: float = 0.5,
+        min_lift: Optional[float] = None,
+        max_consequent_len: Optional[int] = None
+    ) -> List[AssociationRule]:
+        """Association rules at a threshold, as generate_rules would return them."""
+        return generate_rules(
+            self.itemset_counts(min_support), self.n_transactions, self.vocabulary,
+            min_confidence=min_confidence, min_lift=min_lift, max_consequent_len=max_consequent_len
+        )
+
+    def suggest_min_support(self, max_itemsets: int) -> float:
+        """
+        Lowest threshold yielding at most max_itemsets frequent itemsets.
+
+        Args:
+            max_itemsets: Largest acceptable number of itemsets
+
+        Returns:
+            The threshold (never below the mined one; capped at 1.0)
+        """
+        if max_itemsets >= len(self.counts):
+            return self.min_support
+        # Every itemset at position >= max_itemsets must drop out
+        min_count = int(self.counts[max_itemsets]) + 1
+        return min(1.0, max(self.min_support, min_count / self.n_transactions))
@@ -0,0 +1,211 @@
+import logging
+from array import array
+from dataclasses import dataclass
+from typing import List, Dict, Iterable, Iterator, Generator, Optional, Set, Tuple, Collection
+
+import numpy as np
+
+from ..core.models import N8nWorkflow, N8nNode
+from .mining import ItemVocabulary
+
+try:
+    from scipy import sparse
+except ImportError:  # Optional dependency, only needed for TransactionBatch.to_csr
+    sparse = None
+
+
+# Configure logging for transaction encoding
+logger = logging.getLogger(__name__)
+
+# Categorical parameters whose values make useful "type_key_value" items.
+# Free-form parameters (URLs, code, messages) would flood the vocabulary.
+DEFAULT_PARAMETER_KEYS = frozenset({
+    'method', 'requestMethod', 'httpMethod', 'operation', 'resource', 'mode',
+    'authentication', 'responseMode', 'event'
+})
+
+
+def short_type(node_type: str) -> str:
+    """Return the node type without its package prefix (n8n-nodes-base.set -> set)."""
+    return node_type.rsplit('.', 1)[-1]
+
+
+@dataclass
+class TransactionBatch:
+    """
+    A batch of integer-coded transactions in CSR layout.
+
+    Transaction i holds the item ids indices[indptr[i]:indptr[i + 1]]
+    (sorted and unique). n_items is the vocabulary size when the batch was
+    emitted; later batches may use higher ids.
+    """
+    indptr: np.ndarray
+    indices: np.ndarray
+    keys: List[Optional[str]]
+    n_items: int
+
+    def __len__(self) -> int:
+        return len(self.indptr) - 1
+
+    def __iter__(self) -> Iterator[Tuple[int, ...]]:
+        """Iterate transactions as item-id tuples (the input format of fpgrowth)."""
+        indices = self.indices.tolist()
+        bounds = self.indptr.tolist()
+        for start, end in zip(bounds, bounds[1:]):
+            yield tuple(indices[start:end])
+
+    def to_csr(self, n_items: Optional[int] = None):
+        """
+        Return the batch as a boolean scipy.sparse CSR matrix.
+
+        Args:
+            n_items: Number of columns (defaults to n_items of the batch); pass the
+                final vocabulary size to stack batches of a stream
+
+        Raises:
+            ImportError: If scipy is not installed
+        """
+        if sparse is None:
+            raise ImportError("TransactionBatch.to_csr requires scipy")
+        data = np.ones(len(self.indices), dtype=bool)
+        return sparse.csr_matrix(
+            (data, self.indices, self.indptr), shape=(len(self), n_items or self.n_items)
+        )
+
+
+class TransactionEncoder:
+    """
+    Turns workflows into transactions of feature items.
+
+    Items are node types (n8n-nodes-base.httpRequest), node type plus
+    categorical parameter value (httpRequest_method_POST) and chains of
+    connected node types (webhook->set->slack). Ids come from a shared,
+    growing ItemVocabulary, so an encoder can be fed from a stream and its
+    vocabulary reused by the miners and the transaction index.
+    """
+
+    def __init__(
+        self,
+        vocabulary: Optional[ItemVocabulary] = None,
+        node_types: bool = True,
+        parameter_keys: Optional[Collection[str]] = DEFAULT_PARAMETER_KEYS,
+        max_value_length: int = 40,
+        chain_length: int = 2
+    ):
+        """
+        Args:
+            vocabulary: Shared vocabulary (a new one is created if None)
+            node_types: Include node type items
+            parameter_keys: Top-level parameters turned into type+value items
+                (None for every scalar parameter, empty to disable)
+            max_value_length: Longer string values (and n8n expressions) are skipped
+            chain_length: Longest node chain, in nodes; values below 2 disable chains
+        """
+        self.vocabulary = vocabulary if vocabulary is not None else ItemVocabulary()
+        self.node_types = node_types
+        self.parameter_keys = None if parameter_keys is None else frozenset(parameter_keys)
+        self.max_value_length = max_value_length
+        self.chain_length = chain_length
+
+    def _parameter_items(self, node: N8nNode, items: Set[str]) -> None:
+        if not node.parameters:
+            return
+        prefix = short_type(node.type)
+        for key, value in node.parameters.items():
+            if self.parameter_keys is not None and key not in self.parameter_keys:
+                continue
+            if isinstance(value, str):
+                if not value or len(value) > self.max_value_length or value.startswith('='):
+                    continue
+            elif not isinstance(value, (bool, int, float)):
+                continue
+            items.add(f"{prefix}_{key}_{value}")
+
+    def _chain_items(self, workflow: N8nWorkflow, items: Set[str]) -> None:
+        index = workflow.index
+        successors: Dict[str, List[str]] = {}
+        for node_id, connections in index.outgoing.items():
+            if node_id not in index.nodes_by_id:
+                continue
+            targets = {index.resolve(c.target_node_id) for c in connections}
+            successors[node_id] = [target for target in targets if target in index.nodes_by_id]
+
+        names = {node_id: short_type(node.type) for node_id, node in index.nodes_by_id.items()}
+        # Depth-first over simple paths of up to chain_length nodes
+        stack = [(node_id, (node_id,)) for node_id in successors]
+        while stack:
+            node_id, path = stack.pop()
+            for target in successors.get(node_id, ()):
+                if target in path:
+                    continue
+                extended = path + (target,)
+                items.add('->'.join(names[n] for n in extended))
+                if len(extended) < self.chain_length:
+                    stack.append((target, extended))
+
+    def items(self, workflow: N8nWorkflow) -> Set[str]:
+        """
+        Return the feature items of a workflow.
+
+        Usable as item_extractor for mine_frequent_itemsets and TransactionIndex.
+        """
+        items: Set[str] = set()
+        for node in workflow.nodes:
+            if self.node_types:
+                items.add(node.type)
+            if self.parameter_keys is None or self.parameter_keys:
+                self._parameter_items(node, items)
+        if self.chain_length >= 2 and workflow.connections:
+            self._chain_items(workflow, items)
+        return items
+
+    def encode(self, workflow: N8nWorkflow) -> Tuple[int, ...]:
+        """Encode a workflow as a sorted tuple of item ids, growing the vocabulary."""
+        return self.vocabulary.encode(self.items(workflow))
+
+    def iter_transactions(self, workflows: Iterable[N8nWorkflow]) -> Generator[Tuple[int, ...], None, None]:
+        """Lazily encode a stream of workflows."""
+        for workflow in workflows:
+            yield self.encode(workflow)
+
+    def iter_batches(
+        self,
+        workflows: Iterable[N8nWorkflow],
+        batch_size: int = 10000
+    ) -> Generator[TransactionBatch, None, None]:
+        """
+        Encode a stream of workflows into fixed-size CSR batches.
+
+        Only the current batch (and the vocabulary) is held in memory, so
+        peak memory does not grow with the corpus.
+
+        Args:
+            workflows: Iterable of workflows (e.g. parse_workflows_batch output)
+            batch_size: Transactions per batch (the last batch may be smaller)
+
+        Yields:
+            TransactionBatch: Encoded transactions keyed by workflow file path
+        """
+        if batch_size <= 0:
+            raise ValueError(f"batch_size must be positive, got {batch_size}")
+
+        indptr = array('q', [0])
+        indices = array('i')
+        keys: List[Optional[str]] = []
+        for workflow in workflows:
+            indices.extend(self.encode(workflow))
+            indptr.append(len(indices))
+            keys.append(workflow.file_path)
+            if len(keys) == batch_size:
+                yield self._batch(indptr, indices, keys)
+                indptr, indices, keys = array('q', [0]), array('i'), []
+        if keys:
+            yield self._batch(indptr, indices, keys)
+
+    def _batch(self, indptr: array, indices: array, keys: List[Optional[str]]) -> TransactionBatch:
+        return TransactionBatch(
+            indptr=np.frombuffer(indptr, dtype=np.int64),
+            indices=np.frombuffer(indices, dtype=np.int32),
+            keys=keys,
+            n_items=len(self.vocabulary)
+        )
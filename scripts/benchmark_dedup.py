@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Benchmark streaming near-duplicate removal against batched MinHash signatures.
+
+Synthetic corpora of random workflow graphs over a few hundred node types,
+with a share of renamed copies planted in them. deduplicate_workflows hashes
+one workflow at a time, so its cost per workflow should stay flat as the
+corpus grows and close to that of workflow_signatures on the whole corpus.
+"""
+
+import sys
+import time
+import random
+
+from n8n_analyzer.core.models import N8nWorkflow, N8nNode, N8nConnection
+from n8n_analyzer.graph.fingerprint import MinHasher, deduplicate_workflows
+
+
+def synthetic_workflows(n_workflows: int, n_types: int = 400, copy_fraction: float = 0.1, seed: int = 0):
+    """Random tree-shaped workflows; copy_fraction of them are renamed copies of earlier ones."""
+    rng = random.Random(seed)
+    types = [f'n8n-nodes-base.type{i}' for i in range(n_types)]
+    structures = []
+    workflows = []
+    for i in range(n_workflows):
+        if structures and rng.random() < copy_fraction:
+            node_types, edges = rng.choice(structures)
+        else:
+            n_nodes = rng.randint(5, 25)
+            node_types = [rng.choice(types) for _ in range(n_nodes)]
+            edges = [(rng.randrange(j), j) for j in range(1, n_nodes)]
+            structures.append((node_types, edges))
+        nodes = [N8nNode(id=f'{i}_{j}', name=f'Node {j}', type=node_type, typeVersion=1, position=(0, 0))
+                 for j, node_type in enumerate(node_types)]
+        connections = [N8nConnection(nodes[s].name, 'main', nodes[t].name, 'main') for s, t in edges]
+        workflows.append(N8nWorkflow(name=f'w{i}', nodes=nodes, connections=connections, file_path=f'w{i}.json'))
+    return workflows, len(structures)
+
+
+def benchmark_dedup(sizes=(5_000, 20_000, 50_000)) -> bool:
+    """Deduplicate each corpus as a stream and sign it in one batch."""
+
+    print("🧬 Benchmarking near-duplicate removal")
+    print("=" * 70)
+
+    ok = True
+    for size in sizes:
+        workflows, distinct = synthetic_workflows(size)
+        print(f"\n📦 {size} workflows, {distinct} distinct structures")
+
+        start_time = time.perf_counter()
+        kept = sum(1 for _ in deduplicate_workflows(workflows))
+        stream_time = time.perf_counter() - start_time
+        match = kept == distinct
+        ok = ok and match
+        print(f"   deduplicate_workflows: {stream_time:.3f}s ({1000 * stream_time / size:.3f} ms per workflow), "
+              f"kept {kept} {'✅' if match else '❌ mismatch'}")
+
+        start_time = time.perf_counter()
+        MinHasher().workflow_signatures(workflows)
+        batch_time = time.perf_counter() - start_time
+        print(f"   workflow_signatures:   {batch_time:.3f}s ({1000 * batch_time / size:.3f} ms per workflow)")
+
+    return ok
+
+
+if __name__ == "__main__":
+    sys.exit(0 if benchmark_dedup() else 1)
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Benchmark corpus-wide graph metrics: CSR WorkflowGraph versus networkx.DiGraph.
+
+All engines compute the same metrics (degrees, sources/sinks, weak
+components, DAG check and longest path) for every workflow of the sample
+corpus, replicated to a larger size: per workflow with networkx and with
+WorkflowGraph, and for the whole corpus at once with corpus_graph_metrics
+(a CorpusGraph).
+"""
+
+import sys
+import glob
+import math
+import time
+
+import networkx as nx
+
+from n8n_analyzer.core.parser import parse_workflows_batch
+from n8n_analyzer.graph.batch import corpus_graph_metrics
+from n8n_analyzer.graph.csr import WorkflowGraph, graph_metrics
+
+
+def networkx_metrics(workflow) -> dict:
+    """The metrics of graph_metrics, via a per-workflow networkx.DiGraph."""
+    graph = nx.DiGraph()
+    for node in workflow.nodes:
+        graph.add_node(node.id, type=node.type)
+    index = workflow.index
+    for connection in workflow.connections:
+        source = index.resolve(connection.source_node_id)
+        target = index.resolve(connection.target_node_id)
+        if source in graph and target in graph:
+            graph.add_edge(source, target)
+    n = graph.number_of_nodes()
+    is_dag = nx.is_directed_acyclic_graph(graph)
+    return {
+        'nodes': n,
+        'edges': graph.number_of_edges(),
+        'density': nx.density(graph),
+        'max_in_degree': max((d for _, d in graph.in_degree()), default=0),
+        'max_out_degree': max((d for _, d in graph.out_degree()), default=0),
+        'sources': sum(1 for _, d in graph.in_degree() if d == 0),
+        'sinks': sum(1 for _, d in graph.out_degree() if d == 0),
+        'components': nx.number_weakly_connected_components(graph),
+        'is_dag': is_dag,
+        'longest_path': nx.dag_longest_path_length(graph) if is_dag else None
+    }
+
+
+def benchmark_graphs(pattern: str = "data/raw_workflows/*.json", replicas: int = 100) -> bool:
+    """Compute metrics for the replicated corpus with both engines."""
+
+    print("🕸️  Benchmarking workflow graph metrics")
+    print("=" * 70)
+
+    # Parse every replica separately so no per-workflow state is shared between copies
+    workflows = list(parse_workflows_batch(sorted(glob.glob(pattern)) * replicas, skip_errors=True))
+    if not workflows:
+        print(f"❌ No workflows found at {pattern}")
+        return False
+    print(f"📦 {len(workflows)} workflows")
+
+    start_time = time.perf_counter()
+    csr = [graph_metrics(WorkflowGraph.from_workflow(workflow)) for workflow in workflows]
+    csr_time = time.perf_counter() - start_time
+    print(f"   CSR graphs:   {csr_time:.3f}s")
+
+    start_time = time.perf_counter()
+    reference = [networkx_metrics(workflow) for workflow in workflows]
+    nx_time = time.perf_counter() - start_time
+    print(f"   networkx:     {nx_time:.3f}s")
+
+    start_time = time.perf_counter()
+    batched = corpus_graph_metrics(workflows)
+    batch_time = time.perf_counter() - start_time
+    print(f"   CorpusGraph:  {batch_time:.3f}s")
+
+    match = csr == reference and all(
+        all(math.isclose(metrics[key], value) if key == 'density' else metrics[key] == value
+            for key, value in expected.items())
+        for metrics, expected in zip(batched, reference)
+    )
+    print(f"   speedup {nx_time / csr_time:.1f}x per workflow, {nx_time / batch_time:.1f}x batched "
+          f"{'✅' if match else '❌ mismatch'}")
+    return match
+
+
+if __name__ == "__main__":
+    sys.exit(0 if benchmark_graphs() else 1)
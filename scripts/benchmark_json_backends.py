@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Benchmark the available JSON backends on a directory of workflow files.
+"""
+
+import sys
+import time
+
+from n8n_analyzer.core.json_backend import available_backends, get_json_backend
+from n8n_analyzer.core.parser import find_workflow_files
+
+
+def benchmark_json_backends(directory: str = 'data/raw_workflows', repeat: int = 20) -> bool:
+    """Decode every workflow file `repeat` times with each installed backend."""
+    
+    print("⚡ Benchmarking JSON backends")
+    print("=" * 60)
+    
+    files = find_workflow_files(directory)
+    if not files:
+        print(f"❌ No workflow files found in {directory}")
+        return False
+    
+    print(f"   Files: {len(files)} x {repeat} passes")
+    print(f"   Installed backends: {', '.join(available_backends())}")
+    
+    results = {}
+    for name in available_backends():
+        backend = get_json_backend(name)
+        # Warm the page cache so every backend sees the same I/O conditions
+        for file_path in files:
+            backend.load_file(file_path)
+        
+        start_time = time.perf_counter()
+        for _ in range(repeat):
+            for file_path in files:
+                backend.load_file(file_path)
+        results[name] = time.perf_counter() - start_time
+    
+    baseline = results.get('json')
+    for name, elapsed in sorted(results.items(), key=lambda item: item[1]):
+        rate = len(files) * repeat / elapsed
+        speedup = f", {baseline / elapsed:.2f}x vs json" if baseline else ""
+        print(f"   {name:<9} {elapsed:.3f}s ({rate:.0f} files/sec{speedup})")
+    
+    return True
+
+
+if __name__ == "__main__":
+    sys.exit(0 if benchmark_json_backends(*sys.argv[1:2]) else 1)
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Benchmark the sparse FP-Growth engine against mlxtend's dense FP-Growth.
+
+Synthetic corpora mimic workflow transactions: a long-tailed vocabulary of
+node types (plus type+parameter items) with a handful of items per workflow.
+"""
+
+import os
+import sys
+import time
+import random
+import tracemalloc
+
+from n8n_analyzer.patterns.mining import fpgrowth
+from n8n_analyzer.patterns.partitioned import partitioned_fpgrowth
+
+
+def synthetic_transactions(n_workflows: int, n_items: int = 2000, seed: int = 0):
+    """Generate transactions with Zipf-like item popularity."""
+    rng = random.Random(seed)
+    weights = [1 / (i + 1) for i in range(n_items)]
+    return [
+        tuple(set(rng.choices(range(n_items), weights=weights, k=rng.randint(3, 15))))
+        for _ in range(n_workflows)
+    ]
+
+
+def _run(mine):
+    tracemalloc.start()
+    start_time = time.perf_counter()
+    result = mine()
+    elapsed = time.perf_counter() - start_time
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def benchmark_mining(sizes=(1_000, 10_000, 100_000), min_support: float = 0.02) -> bool:
+    """Mine each synthetic corpus with both engines and compare time and peak memory."""
+    
+    print("⛏️  Benchmarking frequent itemset mining")
+    print("=" * 70)
+    
+    try:
+        import pandas as pd
+        from mlxtend.frequent_patterns import fpgrowth as mlxtend_fpgrowth
+        from mlxtend.preprocessing import TransactionEncoder
+    except ImportError:
+        mlxtend_fpgrowth = None
+        print("   mlxtend not installed, benchmarking the sparse engine only")
+    
+    for size in sizes:
+        transactions = synthetic_transactions(size)
+        print(f"\n📦 {size} workflows, min_support={min_support}")
+        
+        (counts, _), elapsed, peak = _run(lambda: fpgrowth(transactions, min_support=min_support))
+        print(f"   sparse FP-Growth: {elapsed:.3f}s, peak {peak / 1024 / 1024:.1f} MB, {len(counts)} itemsets")
+        
+        workers = os.cpu_count() or 1
+        start_time = time.perf_counter()
+        partitioned, _ = partitioned_fpgrowth(transactions, min_support=min_support, workers=workers)
+        elapsed = time.perf_counter() - start_time
+        print(f"   SON, {workers} workers: {elapsed:.3f}s {'✅' if partitioned == counts else '❌ mismatch'}")
+        
+        if mlxtend_fpgrowth is None:
+            continue
+        
+        def run_mlxtend():
+            encoder = TransactionEncoder()
+            frame = pd.DataFrame(encoder.fit(transactions).transform(transactions), columns=encoder.columns_)
+            return mlxtend_fpgrowth(frame, min_support=min_support)
+        
+        expected, elapsed, peak = _run(run_mlxtend)
+        match = len(expected) == len(counts)
+        print(f"   mlxtend (dense):  {elapsed:.3f}s, peak {peak / 1024 / 1024:.1f} MB, {len(expected)} itemsets"
+              f" {'✅' if match else '❌ mismatch'}")
+    
+    return True
+
+
+if __name__ == "__main__":
+    sys.exit(0 if benchmark_mining() else 1)
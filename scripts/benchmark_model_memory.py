@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Benchmark memory used by the workflow model objects.
+
+Compares the slotted, string-interning models produced by the parser against
+equivalent plain (__dict__-based) dataclasses built from the same data.
+"""
+
+import sys
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Optional, Tuple
+
+from n8n_analyzer.core.models import N8nWorkflow, N8nNode, N8nConnection
+from n8n_analyzer.core.parser import find_workflow_files, parse_workflows_batch
+
+
+@dataclass
+class DictNode:
+    id: str
+    name: str
+    type: str
+    typeVersion: int
+    position: Tuple[int, int]
+    parameters: Dict[str, Any] = field(default_factory=dict)
+    notes: Optional[str] = None
+
+
+@dataclass
+class DictConnection:
+    source_node_id: str
+    source_node_output_port: str
+    target_node_id: str
+    target_node_input_port: str
+
+
+@dataclass
+class DictWorkflow:
+    name: str
+    nodes: List[DictNode]
+    connections: List[DictConnection]
+    id: Optional[str] = None
+    active: Optional[bool] = None
+    tags: Optional[Dict[str, Any]] = field(default_factory=dict)
+    settings: Optional[Dict[str, Any]] = field(default_factory=dict)
+    meta: Optional[Dict[str, Any]] = field(default_factory=dict)
+    staticData: Optional[Dict[str, Any]] = field(default_factory=dict)
+    file_path: Optional[str] = None
+
+
+def _fresh(value: str) -> str:
+    """Return an equal but distinct (non-interned) string, as a plain JSON decode would."""
+    return (value + '.')[:-1]
+
+
+def _to_dict_models(workflow) -> DictWorkflow:
+    nodes = [
+        DictNode(_fresh(n.id), n.name, _fresh(n.type), n.typeVersion, n.position, n.parameters, n.notes)
+        for n in workflow.nodes
+    ]
+    connections = [
+        DictConnection(_fresh(c.source_node_id), _fresh(c.source_node_output_port),
+                       _fresh(c.target_node_id), _fresh(c.target_node_input_port))
+        for c in workflow.connections
+    ]
+    return DictWorkflow(workflow.name, nodes, connections, workflow.id, workflow.active, workflow.tags,
+                        workflow.settings, workflow.meta, workflow.staticData, workflow.file_path)
+
+
+def _to_slotted_models(workflow) -> N8nWorkflow:
+    # Mirror the parser: fresh strings from the decoder, interned on construction
+    nodes = [
+        N8nNode(sys.intern(_fresh(n.id)), n.name, sys.intern(_fresh(n.type)), n.typeVersion, n.position,
+                n.parameters, n.notes)
+        for n in workflow.nodes
+    ]
+    connections = [
+        N8nConnection(sys.intern(_fresh(c.source_node_id)), sys.intern(_fresh(c.source_node_output_port)),
+                      sys.intern(_fresh(c.target_node_id)), sys.intern(_fresh(c.target_node_input_port)))
+        for c in workflow.connections
+    ]
+    return N8nWorkflow(workflow.name, nodes, connections, workflow.id, workflow.active, workflow.tags,
+                       workflow.settings, workflow.meta, workflow.staticData, workflow.file_path)
+
+
+def _measure(build) -> int:
+    tracemalloc.start()
+    objects = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return current
+
+
+def benchmark_model_memory(directory: str = 'data/raw_workflows', repeat: int = 10) -> bool:
+    """Measure model memory per workflow for slotted vs. dict-based models."""
+    
+    print("🧠 Benchmarking workflow model memory")
+    print("=" * 60)
+    
+    files = find_workflow_files(directory)
+    if not files:
+        print(f"❌ No workflow files found in {directory}")
+        return False
+    
+    # Parameters, tags etc. are shared between both variants, so the
+    # measurement isolates the model objects and their strings.
+    source = list(parse_workflows_batch(files, skip_errors=True))
+    count = len(source) * repeat
+    
+    slotted = _measure(lambda: [_to_slotted_models(w) for _ in range(repeat) for w in source])
+    plain = _measure(lambda: [_to_dict_models(w) for _ in range(repeat) for w in source])
+    
+    print(f"   Workflows measured: {count}")
+    print(f"   Dict-based models:  {plain / count / 1024:.2f} KB per workflow")
+    print(f"   Slotted models:     {slotted / count / 1024:.2f} KB per workflow")
+    print(f"   Saved:              {(plain - slotted) / count / 1024:.2f} KB per workflow "
+          f"({(1 - slotted / plain) * 100:.1f}%)")
+    return True
+
+
+if __name__ == "__main__":
+    sys.exit(0 if benchmark_model_memory(*sys.argv[1:2]) else 1)
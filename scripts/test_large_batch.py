@@ -3,6 +3,7 @@
 Test script for large batch processing with memory efficiency monitoring.
 """
 
+import os
 import time
 import sys
 import tracemalloc
@@ -156,6 +157,23 @@ def test_large_batch_processing():
         print(f"❌ Error testing generator behavior: {e}")
         return False
     
+    # Test 5: Process-pool scaling
+    print("\n🚀 Testing process-pool parallel parsing...")
+    try:
+        baseline_rate = None
+        for workers in (1, 2, 4, os.cpu_count() or 1):
+            start_time = time.time()
+            count = sum(1 for _ in parse_workflows_batch(files, skip_errors=True, workers=workers))
+            elapsed = time.time() - start_time
+            rate = count / elapsed if elapsed > 0 else 0
+            baseline_rate = baseline_rate or rate
+            print(f"   workers={workers}: {count} workflows in {elapsed:.3f}s "
+                  f"({rate:.1f} workflows/sec, {rate / baseline_rate:.2f}x)")
+        
+    except Exception as e:
+        print(f"❌ Error in parallel processing: {e}")
+        return False
+    
     print("\n" + "=" * 70)
     print("🎉 Large batch processing tests completed successfully!")
     print("✅ Memory-efficient parser handles 1000+ workflows effectively")
@@ -0,0 +1,123 @@
+import unittest
+import tempfile
+import os
+import shutil
+import ujson
+
+from n8n_analyzer.core.cache import WorkflowCache, file_fingerprint
+from n8n_analyzer.core.parser import parse_single_workflow, parse_workflows_batch
+
+
+class TestWorkflowCache(unittest.TestCase):
+    
+    def setUp(self):
+        """Create a temporary directory with a few workflow files and a cache."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache_path = os.path.join(self.temp_dir, "cache", "workflows.sqlite3")
+        self.files = []
+        for i in range(3):
+            path = os.path.join(self.temp_dir, f"workflow_{i}.json")
+            self._write_workflow(path, f"Workflow {i}")
+            self.files.append(path)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _write_workflow(self, path: str, name: str):
+        with open(path, 'w') as f:
+            ujson.dump({
+                "name": name,
+                "nodes": [{"id": "start", "name": "Start", "type": "n8n-nodes-base.start",
+                           "typeVersion": 1, "position": [100, 100]}],
+                "connections": {}
+            }, f)
+
+    def test_warm_parse_hits_cache(self):
+        """Test that a second parse of an unchanged file is served from the cache."""
+        with WorkflowCache(self.cache_path) as cache:
+            first = list(parse_workflows_batch(self.files, cache=cache))
+        
+        with WorkflowCache(self.cache_path) as cache:
+            second = list(parse_workflows_batch(self.files, cache=cache))
+            self.assertEqual(cache.hits, 3)
+            self.assertEqual(cache.misses, 0)
+        
+        self.assertEqual(first, second)
+
+    def test_modified_file_invalidates_entry(self):
+        """Test that a changed mtime/size makes the cached entry stale."""
+        with WorkflowCache(self.cache_path) as cache:
+            parse_single_workflow(self.files[0], cache=cache)
+            cache.flush()
+            
+            self._write_workflow(self.files[0], "Renamed Workflow")
+            stat = os.stat(self.files[0])
+            os.utime(self.files[0], ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+            
+            workflow = parse_single_workflow(self.files[0], cache=cache)
+            self.assertEqual(workflow.name, "Renamed Workflow")
+            self.assertEqual(cache.hits, 0)
+
+    def test_verify_hash_detects_same_size_edit(self):
+        """Test that content hashing catches edits that preserve mtime and size."""
+        with WorkflowCache(self.cache_path, verify_hash=True) as cache:
+            parse_single_workflow(self.files[0], cache=cache)
+            cache.flush()
+            
+            stat = os.stat(self.files[0])
+            self._write_workflow(self.files[0], "Workflow 9")
+            os.utime(self.files[0], ns=(stat.st_atime_ns, stat.st_mtime_ns))
+            
+            self.assertIsNone(cache.get(self.files[0]))
+            self.assertIsNotNone(file_fingerprint(self.files[0], with_hash=True).digest)
+
+    def test_eviction_bounds_size(self):
+        """Test that least recently used entries are evicted beyond max_bytes."""
+        with WorkflowCache(self.cache_path, commit_interval=1) as cache:
+            parse_single_workflow(self.files[0], cache=cache)
+            entry_size = cache.size_bytes()
+        
+        with WorkflowCache(self.cache_path, max_bytes=entry_size * 2, commit_interval=1) as cache:
+            for path in self.files:
+                parse_single_workflow(path, cache=cache)
+            
+            self.assertEqual(len(cache), 2)
+            self.assertLessEqual(cache.size_bytes(), entry_size * 2)
+            # The oldest entry is the one evicted
+            self.assertIsNone(cache.get(self.files[0]))
+
+
+    def test_warm_cache_applies_projection(self):
+        """Test that a projected parse returns the same workflow from a cold and a warm cache."""
+        path = os.path.join(self.temp_dir, "rich.json")
+        with open(path, 'w') as f:
+            ujson.dump({
+                "name": "Rich",
+                "nodes": [
+                    {"id": "a", "name": "A", "type": "n8n-nodes-base.set", "typeVersion": 3,
+                     "position": [10, 20], "parameters": {"value": 1}, "notes": "note"},
+                    {"id": "b", "name": "B", "type": "n8n-nodes-base.if", "typeVersion": 1, "position": [30, 40]}
+                ],
+                "connections": {"A": {"main": [[{"node": "B", "type": "main", "index": 0}]]}},
+                "settings": {"timezone": "UTC"},
+                "tags": {"team": "ops"}
+            }, f)
+        fields = ['connections', 'position']
+        cold = parse_single_workflow(path, fields=fields)
+        
+        with WorkflowCache(self.cache_path) as cache:
+            full = parse_single_workflow(path, cache=cache)
+            cache.flush()
+            warm = parse_single_workflow(path, cache=cache, fields=fields)
+            self.assertEqual(cache.hits, 1)
+        
+        self.assertEqual(warm, cold)
+        self.assertEqual(warm.settings, {})
+        self.assertEqual(warm.nodes[0].parameters, {})
+        self.assertEqual(warm.nodes[0].position, (10, 20))
+        self.assertEqual(len(warm.connections), 1)
+        self.assertEqual(full.settings, {"timezone": "UTC"})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+import unittest
+
+import numpy as np
+
+from n8n_analyzer.core.corpus import WorkflowCorpus
+from n8n_analyzer.core.models import N8nWorkflow, N8nNode, N8nConnection
+
+
+def _workflow(name, node_types, edges):
+    nodes = [
+        N8nNode(id=f"{name}_{i}", name=f"Node {i}", type=node_type, typeVersion=1, position=(i * 100, 0))
+        for i, node_type in enumerate(node_types)
+    ]
+    connections = [
+        N8nConnection(source_node_id=nodes[s].id, source_node_output_port="main",
+                      target_node_id=nodes[t].id, target_node_input_port="main")
+        for s, t in edges
+    ]
+    return N8nWorkflow(name=name, nodes=nodes, connections=connections)
+
+
+class TestWorkflowCorpus(unittest.TestCase):
+    
+    def setUp(self):
+        """Build a small corpus of three workflows."""
+        self.workflows = [
+            _workflow("a", ["start", "set", "slack"], [(0, 1), (1, 2)]),
+            _workflow("b", ["webhook", "if", "set", "slack"], [(0, 1), (1, 2), (1, 3)]),
+            _workflow("c", ["start", "set"], [(0, 1)]),
+        ]
+        self.corpus = WorkflowCorpus.from_workflows(self.workflows)
+
+    def test_columns(self):
+        """Test node/edge columns and offsets."""
+        self.assertEqual(self.corpus.n_workflows, 3)
+        self.assertEqual(self.corpus.n_nodes, 9)
+        self.assertEqual(self.corpus.n_edges, 6)
+        np.testing.assert_array_equal(self.corpus.nodes_per_workflow(), [3, 4, 2])
+        np.testing.assert_array_equal(self.corpus.edges_per_workflow(), [2, 3, 1])
+        np.testing.assert_array_equal(self.corpus.node_workflow, [0, 0, 0, 1, 1, 1, 1, 2, 2])
+        # Edge endpoints are global node indices
+        np.testing.assert_array_equal(self.corpus.edge_source, [0, 1, 3, 4, 4, 7])
+        np.testing.assert_array_equal(self.corpus.edge_target, [1, 2, 4, 5, 6, 8])
+        self.assertEqual(self.corpus.type_names[self.corpus.node_type[3]], "webhook")
+
+    def test_aggregations(self):
+        """Test vectorized histograms, degrees and type filters."""
+        self.assertEqual(self.corpus.type_histogram(),
+                         {"start": 2, "set": 3, "slack": 2, "webhook": 1, "if": 1})
+        self.assertEqual(self.corpus.workflow_type_support()["set"], 3)
+        self.assertEqual(int(self.corpus.out_degree()[4]), 2)
+        self.assertEqual(int(self.corpus.in_degree()[0]), 0)
+        np.testing.assert_array_equal(self.corpus.workflows_with_types(["set", "slack"]), [0, 1])
+        self.assertEqual(len(self.corpus.workflows_with_types(["unknown"])), 0)
+
+    def test_select(self):
+        """Test that selecting workflows renumbers nodes and edges consistently."""
+        subset = self.corpus.select([2, 1])
+        
+        self.assertEqual(subset.workflow_names, ["c", "b"])
+        np.testing.assert_array_equal(subset.nodes_per_workflow(), [2, 4])
+        np.testing.assert_array_equal(subset.edge_source, [0, 2, 3, 3])
+        np.testing.assert_array_equal(subset.edge_target, [1, 3, 4, 5])
+        self.assertEqual(subset.type_histogram()["webhook"], 1)
+
+    def test_unresolved_connections_are_dropped(self):
+        """Test that connections to unknown nodes are counted, and names resolve as a fallback."""
+        workflow = _workflow("d", ["start", "set"], [])
+        workflow.connections = [
+            N8nConnection("d_0", "main", "missing", "main"),
+            N8nConnection("Node 0", "main", "Node 1", "main"),
+        ]
+        corpus = WorkflowCorpus.from_workflows([_workflow("e", ["set"], []), workflow])
+        
+        self.assertEqual(corpus.unresolved_edges, 1)
+        np.testing.assert_array_equal(corpus.unresolved_counts, [0, 1])
+        np.testing.assert_array_equal(corpus.edge_source, [1])
+        np.testing.assert_array_equal(corpus.edge_target, [2])
+        self.assertEqual(corpus.select([1]).unresolved_edges, 1)
+        self.assertEqual(corpus.select([0]).unresolved_edges, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+import tempfile
+import os
+from unittest.mock import patch
+
+from n8n_analyzer.core import json_backend
+from n8n_analyzer.core.json_backend import (
+    available_backends,
+    get_json_backend,
+    set_json_backend,
+    load_json_file
+)
+
+
+class TestJsonBackend(unittest.TestCase):
+    
+    def setUp(self):
+        """Write a valid and an invalid JSON file."""
+        self.document = {"name": "Workflow", "nodes": [{"id": "a", "position": [1, 2]}], "connections": {}}
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            f.write('{"name": "Workflow", "nodes": [{"id": "a", "position": [1, 2]}], "connections": {}}')
+            self.valid_path = f.name
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            f.write("{ invalid json")
+            self.invalid_path = f.name
+
+    def tearDown(self):
+        set_json_backend(None)
+        os.unlink(self.valid_path)
+        os.unlink(self.invalid_path)
+
+    def test_all_available_backends_agree(self):
+        """Test that every installed backend decodes the same document and rejects bad JSON."""
+        self.assertIn('json', available_backends())
+        for name in available_backends():
+            backend = get_json_backend(name)
+            self.assertEqual(backend.load_file(self.valid_path), self.document, name)
+            with self.assertRaises(ValueError, msg=name):
+                backend.load_file(self.invalid_path)
+
+    def test_memory_mapped_decode(self):
+        """Test decoding from a memory map for backends that accept buffers."""
+        with patch.object(json_backend, 'MMAP_THRESHOLD', 0):
+            for name in available_backends():
+                self.assertEqual(get_json_backend(name).load_file(self.valid_path), self.document, name)
+
+    def test_selection(self):
+        """Test explicit, environment-based and invalid backend selection."""
+        self.assertEqual(set_json_backend('json').name, 'json')
+        self.assertEqual(load_json_file(self.valid_path), self.document)
+        
+        set_json_backend(None)
+        with patch.dict(os.environ, {'N8N_JSON_BACKEND': 'json'}):
+            self.assertEqual(get_json_backend().name, 'json')
+        with patch.dict(os.environ, {'N8N_JSON_BACKEND': 'auto'}):
+            self.assertEqual(get_json_backend().name, available_backends()[0])
+        
+        with self.assertRaises(ValueError):
+            get_json_backend('yaml')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+import unittest
+import tempfile
+import os
+import shutil
+import ujson
+
+from n8n_analyzer.core.manifest import CorpusManifest
+from n8n_analyzer.core.parser import find_workflow_files, get_workflow_stats
+
+
+class TestCorpusManifest(unittest.TestCase):
+    
+    def setUp(self):
+        """Create a temporary corpus of workflow files."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.manifest_path = os.path.join(self.temp_dir, "manifest", "manifest.json")
+        for i in range(3):
+            self._write_workflow(f"workflow_{i}.json", f"Workflow {i}", ["n8n-nodes-base.start", "n8n-nodes-base.set"])
+        with open(os.path.join(self.temp_dir, "broken.json"), 'w') as f:
+            f.write("{ invalid json")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _write_workflow(self, file_name: str, name: str, node_types):
+        nodes = [
+            {"id": f"node_{i}", "name": f"Node {i}", "type": node_type, "typeVersion": 1, "position": [0, 0]}
+            for i, node_type in enumerate(node_types)
+        ]
+        connections = {
+            f"node_{i}": {"main": [[{"node": f"node_{i + 1}", "type": "main", "index": 0}]]}
+            for i in range(len(nodes) - 1)
+        }
+        path = os.path.join(self.temp_dir, file_name)
+        with open(path, 'w') as f:
+            ujson.dump({"name": name, "nodes": nodes, "connections": connections}, f)
+        # Bump mtime explicitly so rewrites within the same clock tick are detected
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        return path
+
+    def _files(self):
+        return find_workflow_files(self.temp_dir, recursive=False)
+
+    def _assert_matches_full_stats(self, manifest: CorpusManifest):
+        expected = get_workflow_stats(self._files())
+        stats = manifest.stats()
+        for key, value in expected.items():
+            if key == 'file_timing':
+                continue
+            if key == 'workflow_names':
+                self.assertEqual(sorted(stats[key]), sorted(value))
+            else:
+                self.assertEqual(stats[key], value, key)
+
+    def test_initial_update_matches_full_stats(self):
+        """Test that a fresh manifest reports the same totals as get_workflow_stats."""
+        manifest = CorpusManifest()
+        diff = manifest.update(self._files())
+        
+        self.assertEqual(len(diff.added), 4)
+        self._assert_matches_full_stats(manifest)
+        self.assertEqual(manifest.stats()['node_type_counts'],
+                         {"n8n-nodes-base.start": 3, "n8n-nodes-base.set": 3})
+
+    def test_incremental_update(self):
+        """Test that only changed files are re-summarized and totals stay correct."""
+        manifest = CorpusManifest()
+        manifest.update(self._files())
+        
+        self._write_workflow("workflow_0.json", "Workflow 0", ["n8n-nodes-base.webhook"])
+        self._write_workflow("workflow_3.json", "Workflow 3", ["n8n-nodes-base.if", "n8n-nodes-base.set"])
+        os.unlink(os.path.join(self.temp_dir, "workflow_1.json"))
+        
+        diff = manifest.update(self._files())
+        
+        self.assertEqual([os.path.basename(p) for p in diff.added], ["workflow_3.json"])
+        self.assertEqual([os.path.basename(p) for p in diff.modified], ["workflow_0.json"])
+        self.assertEqual([os.path.basename(p) for p in diff.removed], ["workflow_1.json"])
+        self.assertEqual(diff.unchanged, 2)
+        self._assert_matches_full_stats(manifest)
+        self.assertEqual(manifest.stats()['node_type_counts'], {
+            "n8n-nodes-base.start": 1, "n8n-nodes-base.set": 2,
+            "n8n-nodes-base.webhook": 1, "n8n-nodes-base.if": 1
+        })
+
+    def test_save_and_load_roundtrip(self):
+        """Test that a reloaded manifest detects no changes on an unchanged corpus."""
+        manifest = CorpusManifest()
+        manifest.update(self._files())
+        manifest.save(self.manifest_path)
+        
+        reloaded = CorpusManifest.load_or_create(self.manifest_path)
+        self.assertEqual(reloaded.stats(), manifest.stats())
+        
+        diff = reloaded.update(self._files())
+        self.assertEqual(diff.changed, 0)
+        self.assertEqual(diff.unchanged, 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
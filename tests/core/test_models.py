@@ -0,0 +1,85 @@
+import unittest
+import pickle
+import dataclasses
+
+from n8n_analyzer.core.models import N8nWorkflow, N8nNode, N8nConnection
+
+
+class TestWorkflowIndex(unittest.TestCase):
+    
+    def setUp(self):
+        """Build a small branching workflow: start -> if -> (a, b)."""
+        self.nodes = [
+            N8nNode(id="start", name="Start", type="n8n-nodes-base.start", typeVersion=1, position=(0, 0)),
+            N8nNode(id="if", name="Check", type="n8n-nodes-base.if", typeVersion=1, position=(100, 0)),
+            N8nNode(id="a", name="Branch A", type="n8n-nodes-base.set", typeVersion=1, position=(200, 0)),
+            N8nNode(id="b", name="Branch B", type="n8n-nodes-base.set", typeVersion=1, position=(200, 100)),
+        ]
+        self.workflow = N8nWorkflow(
+            name="Branching",
+            nodes=self.nodes,
+            connections=[
+                N8nConnection("start", "main", "if", "main"),
+                N8nConnection("if", "main", "a", "main"),
+                # Endpoint referenced by node name, as in n8n exports
+                N8nConnection("Check", "1", "Branch B", "main"),
+            ]
+        )
+
+    def test_lookup_by_id_and_name(self):
+        """Test O(1) node lookups by id and by name."""
+        self.assertIs(self.workflow.get_node_by_id("if"), self.nodes[1])
+        self.assertIs(self.workflow.get_node_by_name("Branch B"), self.nodes[3])
+        self.assertIsNone(self.workflow.get_node_by_id("missing"))
+
+    def test_adjacency(self):
+        """Test outgoing/incoming connections with name-based endpoints resolved to ids."""
+        outgoing = self.workflow.get_outgoing_connections("if")
+        self.assertEqual([c.target_node_id for c in outgoing], ["a", "Branch B"])
+        self.assertEqual(len(self.workflow.get_incoming_connections("b")), 1)
+        self.assertEqual(self.workflow.get_incoming_connections("start"), [])
+
+    def test_index_invalidation(self):
+        """Test that the index follows list changes and in-place edits."""
+        self.workflow.get_node_by_id("start")
+        
+        new_node = N8nNode(id="c", name="C", type="n8n-nodes-base.set", typeVersion=1, position=(0, 0))
+        self.workflow.nodes.append(new_node)
+        self.assertIs(self.workflow.get_node_by_id("c"), new_node)
+        
+        self.workflow.nodes[0].id = "renamed"
+        self.assertIs(self.workflow.get_node_by_id("renamed"), self.nodes[0])
+        self.assertIsNone(self.workflow.get_node_by_id("start"))
+        
+        self.workflow.nodes[2].name = "z"
+        self.assertIs(self.workflow.get_node_by_name("z"), self.nodes[2])
+        self.assertIsNone(self.workflow.get_node_by_name("Branch A"))
+        
+        replacement = N8nNode(id="if", name="Check", type="n8n-nodes-base.if", typeVersion=2, position=(0, 0))
+        self.workflow.nodes[1] = replacement
+        self.assertIs(self.workflow.get_node_by_id("if"), replacement)
+        
+        self.workflow.connections[1].target_node_id = "c"
+        self.assertEqual(len(self.workflow.get_incoming_connections("c")), 1)
+        self.assertEqual(self.workflow.get_incoming_connections("a"), [])
+
+    def test_index_not_a_field(self):
+        """Test that the cached index stays out of dataclass fields, asdict and repr."""
+        self.workflow.get_node_by_id("start")
+        
+        self.assertNotIn("_index", [f.name for f in dataclasses.fields(self.workflow)])
+        self.assertNotIn("_index", dataclasses.asdict(self.workflow))
+        self.assertNotIn("_index", repr(self.workflow))
+
+    def test_pickle_excludes_index(self):
+        """Test that pickled workflows drop the derived index and compare equal."""
+        self.workflow.get_node_by_id("start")
+        restored = pickle.loads(pickle.dumps(self.workflow, protocol=5))
+        
+        self.assertEqual(restored, self.workflow)
+        self.assertIsNone(restored._index)
+        self.assertEqual(restored.get_node_by_name("Check").id, "if")
+
+
+if __name__ == '__main__':
+    unittest.main()
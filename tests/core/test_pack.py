@@ -0,0 +1,128 @@
+import unittest
+import tempfile
+import os
+import shutil
+import ujson
+
+from n8n_analyzer.core.pack import (
+    PackedCorpusReader,
+    PackedCorpusError,
+    pack_workflows,
+    unpack_workflows,
+    parse_packed_workflows,
+    _FOOTER,
+    zstandard
+)
+from n8n_analyzer.core.parser import WorkflowParseError, parse_workflows_batch
+
+
+class TestPackedCorpus(unittest.TestCase):
+    
+    def setUp(self):
+        """Create a directory of workflow files (one of them invalid)."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.source_dir = os.path.join(self.temp_dir, "workflows")
+        os.makedirs(os.path.join(self.source_dir, "nested"))
+        self.files = []
+        for i in range(5):
+            sub_dir = "nested" if i == 4 else ""
+            path = os.path.join(self.source_dir, sub_dir, f"workflow_{i}.json")
+            with open(path, 'w') as f:
+                ujson.dump({
+                    "name": f"Workflow {i}",
+                    "nodes": [{"id": "start", "name": "Start", "type": "n8n-nodes-base.start",
+                               "typeVersion": 1, "position": [0, 0], "parameters": {"i": i}}],
+                    "connections": {}
+                }, f)
+            self.files.append(path)
+        self.archive = os.path.join(self.temp_dir, "corpus.pack")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_roundtrip_matches_file_parsing(self):
+        """Test that workflows read from an archive match the ones parsed from files."""
+        self.assertEqual(pack_workflows(self.files, self.archive, base_dir=self.source_dir), 5)
+        
+        expected = list(parse_workflows_batch(self.files))
+        with PackedCorpusReader(self.archive) as reader:
+            self.assertEqual(len(reader), 5)
+            self.assertIn(os.path.join("nested", "workflow_4.json"), reader)
+            
+            workflows = list(reader.iter_workflows())
+            self.assertEqual([w.name for w in workflows], [w.name for w in expected])
+            self.assertEqual([w.nodes for w in workflows], [w.nodes for w in expected])
+            self.assertTrue(workflows[0].file_path.endswith("::workflow_0.json"))
+            
+            # Random access by name and by position
+            self.assertEqual(reader.parse("workflow_2.json").name, "Workflow 2")
+            self.assertEqual(reader.parse(-1).name, "Workflow 4")
+
+    @unittest.skipIf(zstandard is None, "zstandard is not installed")
+    def test_zstd_compressed_records(self):
+        """Test reading zstd-compressed records."""
+        pack_workflows(self.files, self.archive, compress=True)
+        
+        with PackedCorpusReader(self.archive) as reader:
+            self.assertEqual([w.name for w in reader.iter_workflows()], [f"Workflow {i}" for i in range(5)])
+            with open(self.files[0], 'rb') as f:
+                self.assertEqual(reader.read_bytes(0), f.read())
+
+    def test_append_and_unpack(self):
+        """Test appending to an archive and extracting it again."""
+        pack_workflows(self.files[:3], self.archive, base_dir=self.source_dir)
+        pack_workflows(self.files[3:], self.archive, base_dir=self.source_dir, append=True)
+        
+        output_dir = os.path.join(self.temp_dir, "unpacked")
+        self.assertEqual(unpack_workflows(self.archive, output_dir), 5)
+        
+        for path in self.files:
+            relative = os.path.relpath(path, self.source_dir)
+            with open(path, 'rb') as original, open(os.path.join(output_dir, relative), 'rb') as extracted:
+                self.assertEqual(original.read(), extracted.read())
+
+    def test_missing_index_is_rebuilt(self):
+        """Test that an archive whose index was lost can still be read by scanning records."""
+        pack_workflows(self.files, self.archive)
+        with open(self.archive, 'r+b') as f:
+            f.seek(-_FOOTER.size, os.SEEK_END)
+            index_offset = _FOOTER.unpack(f.read(_FOOTER.size))[0]
+            f.truncate(index_offset)
+        
+        names = [w.name for w in parse_packed_workflows(self.archive)]
+        self.assertEqual(names, [f"Workflow {i}" for i in range(5)])
+
+    def test_corrupt_index(self):
+        """Test that a valid footer pointing at a garbled or truncated index raises PackedCorpusError."""
+        pack_workflows(self.files, self.archive)
+        with open(self.archive, 'rb') as f:
+            data = f.read()
+        index_offset = _FOOTER.unpack(data[-_FOOTER.size:])[0]
+        
+        for index in (b'\xff\xfe garbled', data[index_offset:-_FOOTER.size][:10], b'{"not": "a list"}'):
+            with open(self.archive, 'wb') as f:
+                f.write(data[:index_offset] + index + _FOOTER.pack(index_offset, data[-8:]))
+            with self.assertRaises(PackedCorpusError) as context:
+                PackedCorpusReader(self.archive)
+            self.assertIn("Corrupt index", str(context.exception))
+            with self.assertRaises(PackedCorpusError):
+                pack_workflows(self.files[:1], self.archive, append=True)
+
+    def test_invalid_records(self):
+        """Test error handling for invalid archives and invalid records."""
+        broken = os.path.join(self.source_dir, "broken.json")
+        with open(broken, 'w') as f:
+            f.write("{ invalid json")
+        pack_workflows(self.files + [broken], self.archive)
+        
+        self.assertEqual(len(list(parse_packed_workflows(self.archive, skip_errors=True))), 5)
+        with self.assertRaises(WorkflowParseError) as context:
+            list(parse_packed_workflows(self.archive))
+        self.assertIn("Invalid JSON", str(context.exception))
+        
+        with self.assertRaises(PackedCorpusError):
+            PackedCorpusReader(self.files[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,11 +4,13 @@ import os
 import ujson
 from typing import List
 from unittest.mock import patch, mock_open
+from concurrent.futures import ProcessPoolExecutor
 
 from n8n_analyzer.core.parser import (
     parse_single_workflow, 
     parse_workflows_batch,
     WorkflowParseError,
+    HEADER_FIELDS,
     _parse_nodes,
     _parse_connections
 )
@@ -232,6 +234,96 @@ class TestWorkflowParser(unittest.TestCase):
                 if os.path.exists(temp_file):
                     os.unlink(temp_file)
 
+    def _write_temp_workflows(self, count: int) -> List[str]:
+        """Write `count` minimal workflow files and return their paths."""
+        temp_files = []
+        for i in range(count):
+            with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+                ujson.dump({"name": f"Workflow {i}", "nodes": [], "connections": {}}, f)
+                temp_files.append(f.name)
+        return temp_files
+
+    def test_parse_workflows_batch_parallel_ordered(self):
+        """Test process-pool parsing yields the same workflows in input order."""
+        temp_files = self._write_temp_workflows(10)
+        try:
+            workflows = list(parse_workflows_batch(temp_files, workers=2, chunksize=3))
+            
+            self.assertEqual([w.name for w in workflows], [f"Workflow {i}" for i in range(10)])
+            self.assertEqual([w.file_path for w in workflows], temp_files)
+            
+        finally:
+            for temp_file in temp_files:
+                os.unlink(temp_file)
+
+    def test_parse_workflows_batch_parallel_unordered(self):
+        """Test unordered process-pool parsing yields every workflow exactly once."""
+        temp_files = self._write_temp_workflows(10)
+        try:
+            with ProcessPoolExecutor(max_workers=2) as executor:
+                workflows = list(parse_workflows_batch(temp_files, executor=executor, ordered=False, chunksize=2))
+            
+            self.assertEqual(sorted(w.file_path for w in workflows), sorted(temp_files))
+            
+        finally:
+            for temp_file in temp_files:
+                os.unlink(temp_file)
+
+    def test_parse_workflows_batch_parallel_errors(self):
+        """Test process-pool parsing keeps the skip_errors semantics."""
+        temp_files = self._write_temp_workflows(4)
+        batch = temp_files[:2] + ["non_existent.json"] + temp_files[2:]
+        try:
+            workflows = list(parse_workflows_batch(batch, skip_errors=True, workers=2, chunksize=1))
+            self.assertEqual([w.file_path for w in workflows], temp_files)
+            
+            parsed = []
+            with self.assertRaises(WorkflowParseError) as context:
+                for workflow in parse_workflows_batch(batch, workers=2, chunksize=1):
+                    parsed.append(workflow)
+            
+            # Errors raised in a worker keep their details across the process boundary
+            self.assertEqual(context.exception.file_path, "non_existent.json")
+            self.assertIn("File not found", str(context.exception))
+            self.assertEqual(len(parsed), 2)
+            
+        finally:
+            for temp_file in temp_files:
+                os.unlink(temp_file)
+
+    def test_parse_single_workflow_header_projection(self):
+        """Test that a header-only projection skips parameters and workflow metadata."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            ujson.dump(self.sample_workflow_data, f)
+            temp_path = f.name
+        
+        try:
+            workflow = parse_single_workflow(temp_path, fields=HEADER_FIELDS)
+            
+            self.assertEqual([n.type for n in workflow.nodes], ["n8n-nodes-base.start", "n8n-nodes-base.set"])
+            self.assertEqual(workflow.get_node_by_id("set_node").parameters, {})
+            self.assertEqual(len(workflow.connections), 1)
+            self.assertEqual(workflow.meta, {})
+            self.assertEqual(workflow.staticData, {})
+            
+            types_only = list(parse_workflows_batch([temp_path], fields={"type"}))[0]
+            self.assertEqual(types_only.connections, [])
+            self.assertEqual(types_only.nodes[1].position, (0, 0))
+            
+            with self.assertRaises(ValueError):
+                parse_single_workflow(temp_path, fields={"functionCode"})
+            
+        finally:
+            os.unlink(temp_path)
+
+    def test_projection_skips_validation_of_unselected_fields(self):
+        """Test that nodes missing unselected fields still parse under a projection."""
+        nodes = _parse_nodes([{"id": "a", "name": "A", "type": "n8n-nodes-base.set"}], frozenset({'parameters'}))
+        
+        self.assertEqual(nodes[0].typeVersion, 0)
+        with self.assertRaises(ValueError):
+            _parse_nodes([{"id": "a", "name": "A", "type": "n8n-nodes-base.set"}])
+
     def test_parse_nodes_success(self):
         """Test node parsing helper function."""
         nodes_data = self.sample_workflow_data["nodes"]
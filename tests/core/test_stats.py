@@ -0,0 +1,88 @@
+import unittest
+import tempfile
+import os
+import shutil
+import ujson
+
+from n8n_analyzer.core.parser import get_workflow_stats
+from n8n_analyzer.core.stats import WorkflowStatsAccumulator, accumulate_stats
+
+
+class TestWorkflowStats(unittest.TestCase):
+    
+    def setUp(self):
+        """Create a corpus of valid and broken workflow files."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.files = []
+        for i in range(20):
+            path = os.path.join(self.temp_dir, f"workflow_{i}.json")
+            with open(path, 'w') as f:
+                ujson.dump({
+                    "name": f"Workflow {i}",
+                    "nodes": [{"id": f"n{j}", "type": "n8n-nodes-base.set"} for j in range(i % 4 + 1)],
+                    "connections": {"n0": {"main": [[{"node": "n1", "type": "main", "index": 0}]]}}
+                }, f)
+            self.files.append(path)
+        broken = os.path.join(self.temp_dir, "broken.json")
+        with open(broken, 'w') as f:
+            f.write("{ invalid json")
+        self.files += [broken, os.path.join(self.temp_dir, "missing.json")]
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_sequential_stats(self):
+        """Test the single-pass statistics and timing section."""
+        stats = get_workflow_stats(self.files)
+        
+        self.assertEqual(stats['total_files'], 22)
+        self.assertEqual(stats['readable_files'], 20)
+        self.assertEqual(stats['invalid_json'], 1)
+        self.assertEqual(stats['missing_files'], 1)
+        self.assertEqual(stats['total_nodes'], sum(i % 4 + 1 for i in range(20)))
+        self.assertEqual(stats['total_connections'], 20)
+        self.assertEqual(len(stats['workflow_names']), 20)
+        
+        timing = stats['file_timing']
+        self.assertLessEqual(timing['p50'], timing['p90'])
+        self.assertLessEqual(timing['p99'], timing['max'])
+        self.assertEqual(len(timing['slowest_files']), 10)
+
+    def test_parallel_shards_match_sequential(self):
+        """Test that merged worker shards give the same totals as a single pass."""
+        sequential = get_workflow_stats(self.files)
+        parallel = get_workflow_stats(self.files, workers=2, chunksize=5)
+        
+        for key in ('total_files', 'readable_files', 'invalid_json', 'missing_files',
+                    'total_nodes', 'total_connections', 'workflow_names'):
+            self.assertEqual(parallel[key], sequential[key], key)
+
+    def test_bounded_names(self):
+        """Test that workflow names can be dropped or reservoir sampled."""
+        self.assertEqual(get_workflow_stats(self.files, max_names=0)['workflow_names'], [])
+        
+        sample = get_workflow_stats(self.files, max_names=5, seed=1)['workflow_names']
+        self.assertEqual(len(sample), 5)
+        self.assertEqual(len(set(sample)), 5)
+        
+        merged = accumulate_stats(self.files[:7], max_names=5, seed=1)
+        merged.merge(accumulate_stats(self.files[7:], max_names=5, seed=2))
+        self.assertEqual(merged.names_seen, 20)
+        self.assertEqual(len(merged.names), 5)
+        self.assertTrue(set(merged.names) <= {f"Workflow {i}" for i in range(20)})
+
+    def test_percentiles(self):
+        """Test histogram percentiles against known timings."""
+        accumulator = WorkflowStatsAccumulator()
+        for i in range(1, 101):
+            accumulator.add('parse_errors', None, i / 1000, f"file_{i}")
+        
+        # Buckets are ~9% wide, so percentiles are accurate to within one bucket
+        self.assertAlmostEqual(accumulator.percentile(50), 0.050, delta=0.005)
+        self.assertAlmostEqual(accumulator.percentile(90), 0.090, delta=0.009)
+        self.assertEqual(accumulator.percentile(100), 0.1)
+        self.assertEqual(accumulator.result()['file_timing']['slowest_files'][0], ("file_100", 0.1))
+
+
+if __name__ == '__main__':
+    unittest.main()
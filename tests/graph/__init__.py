@@ -0,0 +1,3 @@
+"""
+Graph analysis tests for n8n-workflow-analyzer.
+"""
@@ -0,0 +1,129 @@
+import unittest
+
+import numpy as np
+
+from n8n_analyzer.core.models import N8nConnection, N8nNode
+from n8n_analyzer.graph.batch import FEATURE_COLUMNS, CorpusGraph, corpus_graph_metrics
+from n8n_analyzer.graph.csr import WorkflowGraph, graph_metrics
+from tests.helpers import make_workflow, random_graph
+
+
+class TestCorpusGraph(unittest.TestCase):
+    
+    def setUp(self):
+        self.graphs = [random_graph(n, edges, seed, acyclic=seed % 3 != 0)
+                       for seed, (n, edges) in enumerate([(8, 10), (1, 0), (0, 0), (12, 20), (5, 2), (15, 30)] * 4)]
+        self.corpus = CorpusGraph.from_graphs(self.graphs)
+
+    def test_block_diagonal(self):
+        """Test that every workflow owns its own diagonal block."""
+        self.assertEqual(self.corpus.n_workflows, len(self.graphs))
+        self.assertEqual(self.corpus.n_nodes, sum(graph.n_nodes for graph in self.graphs))
+        self.assertEqual(self.corpus.n_edges, sum(graph.n_edges for graph in self.graphs))
+        for i, graph in enumerate(self.graphs):
+            block = self.corpus.workflow_adjacency(i)
+            self.assertEqual(block.nnz, graph.n_edges)
+            self.assertTrue(np.array_equal(block.indptr, graph.indptr))
+            self.assertTrue(np.array_equal(block.indices, graph.indices))
+
+    def test_features_match_graph_metrics(self):
+        """Test the batched features against per-workflow graph_metrics."""
+        features = self.corpus.features()
+        
+        self.assertEqual(set(features), set(FEATURE_COLUMNS))
+        for i, graph in enumerate(self.graphs):
+            expected = graph_metrics(graph)
+            for column in expected:
+                value = features[column][i]
+                if column == 'longest_path' and expected[column] is None:
+                    self.assertEqual(value, -1)
+                elif column == 'density':
+                    self.assertAlmostEqual(value, expected[column])
+                else:
+                    self.assertEqual(value, expected[column], f"{column} of workflow {i}")
+
+    def test_branching_factor(self):
+        """Test the mean out-degree of non-terminal nodes."""
+        corpus = CorpusGraph.from_graphs([WorkflowGraph.from_edges(4, [(0, 1), (0, 2), (1, 3)])])
+        
+        self.assertAlmostEqual(corpus.features()['branching_factor'][0], 1.5)
+
+    def test_levels(self):
+        """Test the longest path into every node, with -1 behind cycles."""
+        corpus = CorpusGraph.from_graphs([
+            WorkflowGraph.from_edges(4, [(0, 1), (1, 2), (0, 2), (2, 3)]),
+            WorkflowGraph.from_edges(3, [(0, 1), (1, 0), (1, 2)])
+        ])
+        
+        self.assertEqual(corpus.levels().tolist(), [0, 1, 2, 3, -1, -1, -1])
+
+    def test_from_workflows_and_table(self):
+        """Test stacking workflows into a feature table keyed by file path."""
+        workflows = [
+            make_workflow([('A', 'n8n-nodes-base.set', {}), ('B', 'n8n-nodes-base.if', {})], [('A', 'B')],
+                          file_path='a.json'),
+            make_workflow([('C', 'n8n-nodes-base.set', {})], [], file_path='b.json')
+        ]
+        table = CorpusGraph.from_workflows(workflows).feature_table()
+        
+        self.assertEqual(list(table.index), ['a.json', 'b.json'])
+        self.assertEqual(list(table.columns), list(FEATURE_COLUMNS))
+        self.assertEqual(table.loc['a.json', 'longest_path'], 1)
+        self.assertEqual(table.loc['b.json', 'edges'], 0)
+
+    def test_from_workflows_matches_graphs(self):
+        """Test that direct stacking resolves endpoints like WorkflowGraph.from_workflow."""
+        by_id = make_workflow(
+            [('A', 'set', {}), ('B', 'if', {}), ('C', 'noOp', {})],
+            [('id_A', 'id_B'), ('id_A', 'id_B'), ('id_B', 'id_C'), ('id_C', 'id_A'), ('id_B', 'Ghost')]
+        )
+        by_name = make_workflow([('A', 'set', {}), ('B', 'if', {})], [('A', 'B'), ('id_B', 'A')])
+        duplicate_ids = make_workflow([('A', 'set', {}), ('B', 'if', {})], [('id_A', 'id_B'), ('A', 'X')])
+        duplicate_ids.nodes.append(N8nNode(id='id_A', name='X', type='code', typeVersion=1, position=(0, 0)))
+        duplicate_ids.connections.append(N8nConnection('X', 'main', 'id_B', 'main'))
+        workflows = [by_id, make_workflow([], []), by_name, duplicate_ids]
+        
+        direct = CorpusGraph.from_workflows(workflows)
+        stacked = CorpusGraph.from_graphs(WorkflowGraph.from_workflow(workflow) for workflow in workflows)
+        np.testing.assert_array_equal(direct.offsets, stacked.offsets)
+        np.testing.assert_array_equal(direct.adjacency.indptr, stacked.adjacency.indptr)
+        np.testing.assert_array_equal(direct.adjacency.indices, stacked.adjacency.indices)
+
+    def test_corpus_graph_metrics(self):
+        """Test per-workflow metric dicts from the batched path."""
+        workflows = [
+            make_workflow([('A', 'set', {}), ('B', 'if', {})], [('A', 'B')], file_path='a.json'),
+            make_workflow([('A', 'set', {}), ('B', 'if', {})], [('A', 'B'), ('B', 'A')], file_path='b.json')
+        ]
+        results = corpus_graph_metrics(workflows)
+        
+        self.assertEqual([metrics['file_path'] for metrics in results], ['a.json', 'b.json'])
+        self.assertEqual(results[0]['name'], 'w')
+        for workflow, metrics in zip(workflows, results):
+            expected = graph_metrics(WorkflowGraph.from_workflow(workflow))
+            self.assertEqual({key: metrics[key] for key in expected}, expected)
+        self.assertIsNone(results[1]['longest_path'])
+        self.assertIs(results[0]['is_dag'], True)
+
+    def test_summary(self):
+        """Test the corpus-level summary."""
+        summary = self.corpus.summary()
+        features = self.corpus.features()
+        
+        self.assertEqual(summary['workflows'], len(self.graphs))
+        self.assertEqual(summary['edges'], self.corpus.n_edges)
+        self.assertAlmostEqual(summary['dag_fraction'], features['is_dag'].mean())
+        self.assertEqual(sum(summary['in_degree_distribution']), self.corpus.n_nodes)
+        self.assertEqual(summary['max_longest_path'], features['longest_path'].max())
+
+    def test_empty_corpus(self):
+        """Test a corpus without workflows."""
+        corpus = CorpusGraph.from_graphs([])
+        
+        self.assertEqual(corpus.n_workflows, 0)
+        self.assertEqual(len(corpus.features()['nodes']), 0)
+        self.assertEqual(corpus.summary()['dag_fraction'], 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
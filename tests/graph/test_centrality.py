@@ -0,0 +1,175 @@
+import unittest
+
+import networkx as nx
+import numpy as np
+
+from n8n_analyzer.graph.centrality import (
+    CentralityService,
+    betweenness_centrality,
+    hoeffding_error,
+    pivots_for_error
+)
+from n8n_analyzer.graph.csr import WorkflowGraph
+from tests.helpers import make_workflow, random_graph
+
+
+def networkx_betweenness(graph, normalized=True):
+    reference = nx.DiGraph()
+    reference.add_nodes_from(range(graph.n_nodes))
+    reference.add_edges_from(zip(*(array.tolist() for array in graph.edges())))
+    values = nx.betweenness_centrality(reference, normalized=normalized)
+    return np.array([values[v] for v in range(graph.n_nodes)])
+
+
+def chain_workflow(names, file_path=None):
+    return make_workflow(
+        [(name, 'n8n-nodes-base.set', {}) for name in names],
+        list(zip(names, names[1:])),
+        file_path=file_path
+    )
+
+
+class TestBetweenness(unittest.TestCase):
+    
+    def test_exact_matches_networkx(self):
+        """Test exact betweenness against networkx on random graphs, cyclic and acyclic."""
+        for seed in range(15):
+            graph = random_graph(14, 25, seed, acyclic=seed % 2 == 0)
+            for normalized in (True, False):
+                values, used = betweenness_centrality(graph, normalized=normalized)
+        
+                self.assertEqual(used, graph.n_nodes)
+                np.testing.assert_allclose(values, networkx_betweenness(graph, normalized), atol=1e-12)
+
+    def test_all_pivots_is_exact(self):
+        """Test that sampling every node as a pivot gives the exact values."""
+        graph = random_graph(20, 40, 3)
+        exact, _ = betweenness_centrality(graph)
+        sampled, used = betweenness_centrality(graph, pivots=list(range(graph.n_nodes))[::-1])
+        
+        self.assertEqual(used, graph.n_nodes)
+        np.testing.assert_allclose(sampled, exact)
+
+    def test_deadline_uses_at_least_one_pivot(self):
+        """Test that an expired deadline still yields an estimate from one pivot."""
+        graph = random_graph(20, 40, 4)
+        values, used = betweenness_centrality(graph, pivots=[0, 1, 2], deadline=0.0)
+        
+        self.assertEqual(used, 1)
+        self.assertEqual(len(values), graph.n_nodes)
+
+    def test_error_bound(self):
+        """Test the pivot count needed for an error bound."""
+        n_pivots = pivots_for_error(500, 0.1, 0.1)
+        
+        self.assertLessEqual(hoeffding_error(500, n_pivots, 0.1), 0.1)
+        self.assertGreater(hoeffding_error(500, n_pivots - 1, 0.1), 0.1)
+
+
+class TestCentralityService(unittest.TestCase):
+    
+    def test_exact_for_small_graphs(self):
+        """Test that small graphs are computed exactly."""
+        graph = random_graph(30, 60, 1)
+        result = CentralityService(exact_threshold=50).centrality(graph)
+        
+        self.assertTrue(result.exact)
+        self.assertEqual(result.error_bound, 0.0)
+        np.testing.assert_allclose(result.values, networkx_betweenness(graph))
+
+    def test_sampled_for_large_graphs(self):
+        """Test that large graphs are sampled within the error bound."""
+        graph = random_graph(600, 900, 2, acyclic=True)
+        service = CentralityService(exact_threshold=100, epsilon=0.2, delta=0.1, seed=0)
+        result = service.centrality(graph)
+        exact, _ = betweenness_centrality(graph)
+        
+        self.assertFalse(result.exact)
+        self.assertLess(result.n_pivots, graph.n_nodes)
+        self.assertLessEqual(result.error_bound, 0.2)
+        self.assertLessEqual(np.abs(result.values - exact).max(), result.error_bound)
+
+    def test_time_budget_on_mid_size_graph(self):
+        """Test that a graph the error budget would compute exactly still honors the time budget."""
+        graph = random_graph(400, 600, 6)
+        self.assertGreaterEqual(pivots_for_error(graph.n_nodes, 0.1, 0.1), graph.n_nodes)
+        exact, _ = betweenness_centrality(graph)
+        
+        limited = CentralityService(time_budget=0.0, seed=0).centrality(graph)
+        self.assertFalse(limited.exact)
+        self.assertEqual(limited.n_pivots, 1)
+        self.assertEqual(limited.error_bound, hoeffding_error(graph.n_nodes, 1, 0.1))
+        
+        generous = CentralityService(time_budget=60.0, seed=0).centrality(graph)
+        self.assertTrue(generous.exact)
+        self.assertEqual(generous.error_bound, 0.0)
+        np.testing.assert_allclose(generous.values, exact, atol=1e-12)
+
+    def test_sampling_is_reproducible(self):
+        """Test that a seeded service gives the same estimate in a fresh instance."""
+        graph = random_graph(400, 600, 5)
+        first = CentralityService(exact_threshold=10, epsilon=0.3, seed=7).centrality(graph)
+        second = CentralityService(exact_threshold=10, epsilon=0.3, seed=7).centrality(graph)
+        
+        np.testing.assert_array_equal(first.values, second.values)
+
+    def test_cache_by_structure(self):
+        """Test that renamed but structurally identical workflows hit the cache."""
+        service = CentralityService()
+        first = service.centrality(chain_workflow(['A', 'B', 'C']))
+        renamed = service.centrality(chain_workflow(['X', 'Y', 'Z']))
+        
+        self.assertEqual((service.hits, service.misses), (1, 1))
+        self.assertEqual(renamed.node_ids, ['id_X', 'id_Y', 'id_Z'])
+        np.testing.assert_array_equal(renamed.values, first.values)
+        
+        service.centrality(chain_workflow(['A', 'B', 'C', 'D']))
+        self.assertEqual(service.misses, 2)
+
+    def test_structural_hash(self):
+        """Test that the hash ignores names but not node types or connections."""
+        base = WorkflowGraph.from_edges(3, [(0, 1), (1, 2)], node_types=['a', 'b', 'c'])
+        same = WorkflowGraph.from_edges(3, [(1, 2), (0, 1)], node_ids=['x', 'y', 'z'], node_types=['a', 'b', 'c'])
+        retyped = WorkflowGraph.from_edges(3, [(0, 1), (1, 2)], node_types=['a', 'b', 'd'])
+        rewired = WorkflowGraph.from_edges(3, [(0, 1), (0, 2)], node_types=['a', 'b', 'c'])
+        
+        self.assertEqual(base.structural_hash(), same.structural_hash())
+        self.assertNotEqual(base.structural_hash(), retyped.structural_hash())
+        self.assertNotEqual(base.structural_hash(), rewired.structural_hash())
+
+    def test_lru_eviction(self):
+        """Test that the default cache is bounded."""
+        service = CentralityService(max_cache_entries=2)
+        for n in range(2, 6):
+            service.centrality(chain_workflow([f'N{i}' for i in range(n)]))
+        
+        self.assertEqual(len(service.cache), 2)
+
+    def test_custom_cache(self):
+        """Test caching in a caller-provided mapping."""
+        cache = {}
+        CentralityService(cache=cache).centrality(chain_workflow(['A', 'B', 'C']))
+        service = CentralityService(cache=cache)
+        service.centrality(chain_workflow(['A', 'B', 'C']))
+        
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(service.hits, 1)
+
+    def test_bottlenecks(self):
+        """Test the most central nodes of a workflow."""
+        bottlenecks = CentralityService().bottlenecks(chain_workflow(['A', 'B', 'C', 'D']), k=2)
+        
+        self.assertEqual([node['name'] for node in bottlenecks], ['B', 'C'])
+        self.assertEqual(bottlenecks[0]['type'], 'n8n-nodes-base.set')
+        self.assertAlmostEqual(bottlenecks[0]['centrality'], 2 / 6)
+
+    def test_invalid_budget(self):
+        """Test that invalid error budgets are rejected."""
+        with self.assertRaises(ValueError):
+            CentralityService(epsilon=0)
+        with self.assertRaises(ValueError):
+            CentralityService(delta=1.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
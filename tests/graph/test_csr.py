@@ -0,0 +1,132 @@
+import unittest
+
+import networkx as nx
+import numpy as np
+
+from n8n_analyzer.core.models import N8nConnection
+from n8n_analyzer.graph.csr import WorkflowGraph, graph_metrics
+from tests.helpers import make_workflow, random_graph
+
+
+class TestWorkflowGraph(unittest.TestCase):
+    
+    def test_from_workflow(self):
+        """Test building the graph from workflow connections."""
+        workflow = make_workflow(
+            [('Start', 'n8n-nodes-base.manualTrigger', {}),
+             ('Fetch', 'n8n-nodes-base.httpRequest', {}),
+             ('Save', 'n8n-nodes-base.postgres', {})],
+            [('Start', 'Fetch'), ('Fetch', 'Save'), ('Fetch', 'Save')]
+        )
+        workflow.connections.append(N8nConnection('Fetch', 'main', 'Missing', 'main'))
+        graph = WorkflowGraph.from_workflow(workflow)
+        
+        self.assertEqual(graph.node_ids, ['id_Start', 'id_Fetch', 'id_Save'])
+        self.assertEqual(graph.node_types[2], 'n8n-nodes-base.postgres')
+        # The parallel connection collapses and the dangling one is dropped
+        self.assertEqual(graph.n_edges, 2)
+        self.assertEqual(graph.successors(1).tolist(), [2])
+        self.assertEqual(graph.predecessors(1).tolist(), [0])
+
+    def test_matches_networkx(self):
+        """Test degrees, reachability and components against networkx."""
+        for seed in range(20):
+            graph = random_graph(12, 15, seed)
+            reference = nx.DiGraph()
+            reference.add_nodes_from(range(graph.n_nodes))
+            reference.add_edges_from(zip(*(array.tolist() for array in graph.edges())))
+        
+            self.assertEqual(graph.out_degree().tolist(), [reference.out_degree(v) for v in reference])
+            self.assertEqual(graph.in_degree().tolist(), [reference.in_degree(v) for v in reference])
+            self.assertEqual(graph.is_dag(), nx.is_directed_acyclic_graph(reference))
+            for v in range(graph.n_nodes):
+                self.assertEqual(set(graph.descendants(v)) - {v}, nx.descendants(reference, v))
+                self.assertEqual(set(graph.ancestors(v)) - {v}, nx.ancestors(reference, v))
+            self.assertEqual(
+                set(np.flatnonzero(graph.reachable([0, 1]))),
+                {0, 1} | nx.descendants(reference, 0) | nx.descendants(reference, 1)
+            )
+        
+            n_components, labels = graph.weakly_connected_components()
+            self.assertEqual(n_components, nx.number_weakly_connected_components(reference))
+            for component in nx.weakly_connected_components(reference):
+                self.assertEqual(len({labels[v] for v in component}), 1)
+
+    def test_topological_order_and_longest_path(self):
+        """Test topological order and critical path on random DAGs."""
+        for seed in range(20):
+            graph = random_graph(15, 25, seed, acyclic=True)
+            reference = nx.DiGraph()
+            reference.add_nodes_from(range(graph.n_nodes))
+            reference.add_edges_from(zip(*(array.tolist() for array in graph.edges())))
+        
+            position = {v: i for i, v in enumerate(graph.topological_order())}
+            self.assertEqual(len(position), graph.n_nodes)
+            self.assertTrue(all(position[a] < position[b] for a, b in reference.edges))
+        
+            length, path = graph.longest_path()
+            self.assertEqual(length, nx.dag_longest_path_length(reference))
+            self.assertEqual(len(path), length + 1)
+            self.assertTrue(all(reference.has_edge(a, b) for a, b in zip(path, path[1:])))
+
+    def test_weighted_longest_path(self):
+        """Test the critical path with node weights."""
+        graph = WorkflowGraph.from_edges(4, [(0, 1), (1, 3), (0, 2), (2, 3)])
+        
+        self.assertEqual(graph.longest_path(weights=[1, 5, 2, 1]), (7, [0, 1, 3]))
+        self.assertEqual(graph.longest_path(weights=[1, 1, 9, 1]), (11, [0, 2, 3]))
+
+    def test_cycle(self):
+        """Test that order-dependent queries reject cyclic graphs."""
+        graph = WorkflowGraph.from_edges(3, [(0, 1), (1, 2), (2, 1)])
+        
+        self.assertFalse(graph.is_dag())
+        with self.assertRaises(ValueError):
+            graph.topological_order()
+        with self.assertRaises(ValueError):
+            graph.longest_path()
+        self.assertEqual(graph.descendants(1), [1, 2])
+
+    def test_to_networkx(self):
+        """Test the conversion to a networkx.DiGraph."""
+        workflow = make_workflow(
+            [('A', 'n8n-nodes-base.set', {}), ('B', 'n8n-nodes-base.if', {})],
+            [('A', 'B')]
+        )
+        converted = WorkflowGraph.from_workflow(workflow).to_networkx()
+        
+        self.assertEqual(list(converted.edges), [('id_A', 'id_B')])
+        self.assertEqual(converted.nodes['id_B']['type'], 'n8n-nodes-base.if')
+
+
+class TestGraphMetrics(unittest.TestCase):
+    
+    def test_metrics(self):
+        """Test the metric summary of a small workflow graph."""
+        graph = WorkflowGraph.from_edges(5, [(0, 1), (1, 2), (0, 2)])
+        metrics = graph_metrics(graph)
+        
+        self.assertEqual(metrics['nodes'], 5)
+        self.assertEqual(metrics['edges'], 3)
+        self.assertAlmostEqual(metrics['density'], 3 / 20)
+        self.assertEqual(metrics['max_out_degree'], 2)
+        self.assertEqual(metrics['max_in_degree'], 2)
+        self.assertEqual(metrics['sources'], 3)
+        self.assertEqual(metrics['sinks'], 3)
+        self.assertEqual(metrics['components'], 3)
+        self.assertTrue(metrics['is_dag'])
+        self.assertEqual(metrics['longest_path'], 2)
+
+    def test_cyclic_and_empty(self):
+        """Test metrics of cyclic and empty graphs."""
+        cyclic = graph_metrics(WorkflowGraph.from_edges(2, [(0, 1), (1, 0)]))
+        empty = graph_metrics(WorkflowGraph.from_edges(0, []))
+        
+        self.assertFalse(cyclic['is_dag'])
+        self.assertIsNone(cyclic['longest_path'])
+        self.assertEqual(empty['nodes'], 0)
+        self.assertEqual(empty['longest_path'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,186 @@
+import random
+import unittest
+
+import numpy as np
+
+from n8n_analyzer.graph.fingerprint import (
+    LSHIndex,
+    MinHasher,
+    deduplicate_workflows,
+    estimate_jaccard,
+    find_near_duplicates,
+    lsh_parameters,
+    workflow_shingles
+)
+from n8n_analyzer.patterns.mining import mine_frequent_itemsets
+from tests.helpers import make_workflow
+
+
+TYPES = ['n8n-nodes-base.' + name for name in ('webhook', 'set', 'if', 'httpRequest', 'slack', 'code', 'merge')]
+
+
+def random_workflow(rng, n_nodes, file_path, prefix='N'):
+    names = [f'{prefix}{i}' for i in range(n_nodes)]
+    nodes = [(name, rng.choice(TYPES), {'value': rng.random()}) for name in names]
+    edges = [(names[rng.randrange(i)], names[i]) for i in range(1, n_nodes)]
+    return make_workflow(nodes, edges, file_path=file_path)
+
+
+def copy_workflow(workflow, file_path, extra_type=None):
+    """A renamed copy of a workflow, optionally with one extra node appended."""
+    nodes = [(f'copy {node.name}', node.type, {}) for node in workflow.nodes]
+    edges = [(f'copy {connection.source_node_id}', f'copy {connection.target_node_id}')
+             for connection in workflow.connections]
+    if extra_type is not None:
+        nodes.append(('copy extra', extra_type, {}))
+        edges.append((nodes[-2][0], 'copy extra'))
+    return make_workflow(nodes, edges, file_path=file_path)
+
+
+class TestShingles(unittest.TestCase):
+    
+    def test_shingles(self):
+        """Test node type and typed edge shingles with occurrence numbers."""
+        workflow = make_workflow(
+            [('A', 'set', {}), ('B', 'set', {}), ('C', 'if', {})],
+            [('A', 'B'), ('B', 'C')]
+        )
+        
+        self.assertEqual(
+            sorted(workflow_shingles(workflow)),
+            ['e:set>if#1', 'e:set>set#1', 't:if#1', 't:set#1', 't:set#2']
+        )
+
+    def test_names_and_parameters_ignored(self):
+        """Test that renamed, re-parameterized copies have the same shingles."""
+        workflow = random_workflow(random.Random(0), 12, 'a.json')
+        
+        self.assertEqual(sorted(workflow_shingles(workflow)), sorted(workflow_shingles(copy_workflow(workflow, 'b.json'))))
+
+
+class TestMinHash(unittest.TestCase):
+    
+    def test_estimates_jaccard(self):
+        """Test that signature agreement estimates the Jaccard similarity."""
+        hasher = MinHasher(num_perm=512, seed=3)
+        a = {f'x{i}' for i in range(100)}
+        b = {f'x{i}' for i in range(30, 130)}
+        exact = len(a & b) / len(a | b)
+        
+        self.assertAlmostEqual(estimate_jaccard(hasher.signature(a), hasher.signature(b)), exact, delta=0.06)
+
+    def test_batch_matches_single(self):
+        """Test that batched signatures equal one-at-a-time signatures, including empty sets."""
+        hasher = MinHasher(num_perm=64)
+        sets = [{'a', 'b'}, set(), {'c'}, {'a', 'b', 'c', 'd'}]
+        batch = hasher.signatures(sets)
+        
+        self.assertEqual(batch.shape, (4, 64))
+        self.assertEqual(batch.dtype, np.uint32)
+        for row, shingles in zip(batch, sets):
+            np.testing.assert_array_equal(row, hasher.signature(shingles))
+        self.assertTrue(np.all(batch[1] == np.uint32(0xFFFFFFFF)))
+
+    def test_streaming_grows_buffer(self):
+        """Test that many one-at-a-time signatures hash each shingle once and match a fresh batch."""
+        rng = random.Random(4)
+        sets = [{f's{rng.randrange(5000)}' for _ in range(rng.randint(0, 20))} for _ in range(400)]
+        hasher = MinHasher(num_perm=32)
+        streamed = np.array([hasher.signature(shingles) for shingles in sets])
+        
+        self.assertGreater(len(hasher._ids), 1024)
+        self.assertEqual(hasher._n_permuted, len(hasher._ids))
+        np.testing.assert_array_equal(streamed, MinHasher(num_perm=32).signatures(sets))
+
+    def test_reproducible(self):
+        """Test that signatures depend only on the seed."""
+        np.testing.assert_array_equal(MinHasher(seed=5).signature(['a', 'b']), MinHasher(seed=5).signature(['b', 'a']))
+
+    def test_invalid_num_perm(self):
+        """Test that a non-positive signature length is rejected."""
+        with self.assertRaises(ValueError):
+            MinHasher(num_perm=0)
+
+
+class TestLSHIndex(unittest.TestCase):
+    
+    def test_lsh_parameters(self):
+        """Test that band and row counts fit the signature and rise with the threshold."""
+        low = lsh_parameters(128, 0.5)
+        high = lsh_parameters(128, 0.9)
+        
+        self.assertLessEqual(low[0] * low[1], 128)
+        self.assertLessEqual(high[0] * high[1], 128)
+        self.assertGreater(high[1], low[1])
+
+    def test_query_and_clusters(self):
+        """Test lookup of near-duplicates and transitive clustering."""
+        rng = random.Random(1)
+        originals = [random_workflow(rng, 15, f'w{i}.json') for i in range(30)]
+        copies = [copy_workflow(originals[0], 'copy0.json'), copy_workflow(originals[5], 'copy5.json'),
+                  copy_workflow(originals[5], 'copy5b.json', extra_type='n8n-nodes-base.noOp')]
+        workflows = originals + copies
+        hasher = MinHasher()
+        index = LSHIndex(threshold=0.8)
+        signatures = hasher.workflow_signatures(workflows)
+        for workflow, signature in zip(workflows, signatures):
+            index.add(workflow.file_path, signature)
+        
+        matches = dict(index.query(signatures[0]))
+        self.assertEqual(set(matches), {'w0.json', 'copy0.json'})
+        self.assertEqual(matches['copy0.json'], 1.0)
+        self.assertEqual(
+            sorted(sorted(cluster) for cluster in index.clusters()),
+            [['copy0.json', 'w0.json'], ['copy5.json', 'copy5b.json', 'w5.json']]
+        )
+
+    def test_invalid(self):
+        """Test that invalid parameters, repeated keys and wrong lengths are rejected."""
+        with self.assertRaises(ValueError):
+            LSHIndex(threshold=0)
+        with self.assertRaises(ValueError):
+            LSHIndex(num_perm=16, bands=5, rows=4)
+        index = LSHIndex(num_perm=16)
+        index.add('a', MinHasher(16).signature(['x']))
+        with self.assertRaises(ValueError):
+            index.add('a', MinHasher(16).signature(['y']))
+        with self.assertRaises(ValueError):
+            index.query(MinHasher(8).signature(['x']))
+
+
+class TestDeduplication(unittest.TestCase):
+    
+    def setUp(self):
+        rng = random.Random(2)
+        self.originals = [random_workflow(rng, 10, f'w{i}.json') for i in range(20)]
+        self.workflows = self.originals + [
+            copy_workflow(self.originals[i], file_path) for i, file_path in ((1, 'dup1.json'), (1, 'dup1b.json'), (4, 'dup4.json'))
+        ]
+
+    def test_find_near_duplicates(self):
+        """Test the corpus-level clustering helper."""
+        clusters = find_near_duplicates(self.workflows)
+        
+        self.assertEqual(
+            sorted(sorted(cluster) for cluster in clusters),
+            [['dup1.json', 'dup1b.json', 'w1.json'], ['dup4.json', 'w4.json']]
+        )
+
+    def test_deduplicate_stream(self):
+        """Test that only the first workflow of each duplicate group is kept."""
+        duplicates = {}
+        kept = list(deduplicate_workflows(self.workflows, duplicates=duplicates))
+        
+        self.assertEqual([workflow.file_path for workflow in kept], [workflow.file_path for workflow in self.originals])
+        self.assertEqual(duplicates, {'dup1.json': 'w1.json', 'dup1b.json': 'w1.json', 'dup4.json': 'w4.json'})
+
+    def test_dedup_feeds_mining(self):
+        """Test that mining the deduplicated stream ignores the copies."""
+        deduplicated = mine_frequent_itemsets(deduplicate_workflows(self.workflows), min_support=0.3)
+        expected = mine_frequent_itemsets(self.originals, min_support=0.3)
+        
+        self.assertEqual(deduplicated, expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,40 @@
+"""
+Shared fixture factories for the n8n-workflow-analyzer tests.
+"""
+
+import random
+
+from n8n_analyzer.core.models import N8nWorkflow, N8nNode, N8nConnection
+from n8n_analyzer.graph.csr import WorkflowGraph
+
+
+def make_workflow(nodes, edges, file_path=None):
+    """Build a workflow from (name, type, parameters) tuples and (source, target) name pairs."""
+    return N8nWorkflow(
+        name="w",
+        nodes=[N8nNode(id=f"id_{name}", name=name, type=node_type, typeVersion=1, position=(0, 0),
+                       parameters=parameters) for name, node_type, parameters in nodes],
+        connections=[N8nConnection(source, "main", target, "main") for source, target in edges],
+        file_path=file_path
+    )
+
+
+def random_transactions(n, n_items, seed=0):
+    """Random item id transactions with a skewed (1 / rank) item distribution."""
+    rng = random.Random(seed)
+    weights = [1 / (i + 1) for i in range(n_items)]
+    return [tuple(set(rng.choices(range(n_items), weights=weights, k=rng.randint(1, 6)))) for _ in range(n)]
+
+
+def random_graph(n, n_edges, seed, acyclic=False):
+    """Random multigraph on n nodes; with acyclic=True edges only point to higher node indices."""
+    rng = random.Random(seed)
+    edges = []
+    for _ in range(n_edges):
+        a, b = rng.randrange(n), rng.randrange(n)
+        if acyclic:
+            if a == b:
+                continue
+            a, b = min(a, b), max(a, b)
+        edges.append((a, b))
+    return WorkflowGraph.from_edges(n, edges)
@@ -0,0 +1,3 @@
+"""
+Pattern mining tests for n8n-workflow-analyzer.
+"""
@@ -0,0 +1,113 @@
+import random
+import unittest
+
+import numpy as np
+from scipy import sparse
+
+from n8n_analyzer.patterns.clustering import WorkflowClusterer, inverse_document_frequency, tfidf
+from tests.helpers import make_workflow
+
+
+TEMPLATES = {
+    'chat': ['webhook', 'openAi', 'set', 'slack'],
+    'etl': ['scheduleTrigger', 'postgres', 'code', 'googleSheets'],
+    'crm': ['hubspotTrigger', 'if', 'salesforce', 'gmail']
+}
+NOISE = ['noOp', 'wait', 'merge', 'httpRequest', 'dateTime']
+
+
+def template_workflow(rng, template, i):
+    """A chain of the template's node types with a random extra node."""
+    types = list(TEMPLATES[template]) + [rng.choice(NOISE)]
+    nodes = [(f'{template}{k}', f'n8n-nodes-base.{node_type}', {}) for k, node_type in enumerate(types)]
+    edges = [(nodes[k][0], nodes[k + 1][0]) for k in range(len(nodes) - 1)]
+    return make_workflow(nodes, edges, file_path=f'{template}_{i}.json')
+
+
+def corpus(seed, per_template):
+    rng = random.Random(seed)
+    workflows = [template_workflow(rng, template, i) for template in TEMPLATES for i in range(per_template)]
+    rng.shuffle(workflows)
+    return workflows
+
+
+def purity(labels, workflows):
+    """Fraction of workflows whose cluster's majority template is their own."""
+    templates = [workflow.file_path.split('_')[0] for workflow in workflows]
+    correct = 0
+    for label in set(labels):
+        members = [template for template, assigned in zip(templates, labels) if assigned == label]
+        correct += max(members.count(template) for template in set(members))
+    return correct / len(workflows)
+
+
+class TestTfidf(unittest.TestCase):
+    
+    def test_matches_sklearn(self):
+        """Test TF-IDF weighting against scikit-learn's TfidfTransformer on binary data."""
+        from sklearn.feature_extraction.text import TfidfTransformer
+        rng = np.random.default_rng(0)
+        dense = (rng.random((30, 12)) < 0.3).astype(np.float32)
+        dense[3] = 0
+        matrix = sparse.csr_matrix(dense)
+        document_frequency = np.bincount(matrix.indices, minlength=12)
+        weighted = tfidf(matrix, inverse_document_frequency(document_frequency, 30))
+        expected = TfidfTransformer().fit_transform(matrix)
+        
+        np.testing.assert_allclose(weighted.toarray(), expected.toarray(), rtol=1e-5, atol=1e-6)
+
+
+class TestWorkflowClusterer(unittest.TestCase):
+    
+    def setUp(self):
+        self.workflows = corpus(0, 30)
+
+    def test_recovers_templates(self):
+        """Test that workflows built from the same template cluster together."""
+        clusterer = WorkflowClusterer(n_clusters=3, n_components=5, random_state=0).fit(self.workflows)
+        
+        self.assertEqual(len(clusterer.labels), len(self.workflows))
+        self.assertEqual(clusterer.keys, [workflow.file_path for workflow in self.workflows])
+        self.assertGreaterEqual(purity(clusterer.labels, self.workflows), 0.95)
+        np.testing.assert_array_equal(clusterer.predict(self.workflows), clusterer.labels)
+
+    def test_top_items(self):
+        """Test that each cluster is characterized by its template's items."""
+        clusterer = WorkflowClusterer(n_clusters=3, n_components=5, random_state=0).fit(self.workflows)
+        tops = {item for items in clusterer.top_items(n=3) for item, _ in items}
+        
+        for template, node_types in TEMPLATES.items():
+            template_items = {f'n8n-nodes-base.{node_type}' for node_type in node_types}
+            template_items |= {f'{a}->{b}' for a, b in zip(node_types, node_types[1:])}
+            self.assertTrue(tops & template_items, template)
+
+    def test_partial_fit(self):
+        """Test incremental updates with new workflows and unseen items."""
+        clusterer = WorkflowClusterer(n_clusters=3, n_components=5, batch_size=16, random_state=0)
+        clusterer.partial_fit(self.workflows[:45])
+        n_features = len(clusterer.features)
+        centers = clusterer.kmeans.cluster_centers_.copy()
+        
+        arrivals = corpus(1, 20)
+        arrivals.append(make_workflow([('X', 'n8n-nodes-base.brandNewNode', {})], [], file_path='new.json'))
+        clusterer.partial_fit(arrivals)
+        
+        self.assertEqual(len(clusterer.features), n_features)
+        self.assertFalse(np.allclose(centers, clusterer.kmeans.cluster_centers_))
+        self.assertGreaterEqual(purity(clusterer.predict(arrivals[:-1]), arrivals[:-1]), 0.95)
+        # A workflow of unseen items only embeds to zero but is still assigned
+        self.assertEqual(len(clusterer.predict(arrivals[-1:])), 1)
+
+    def test_errors(self):
+        """Test unfitted use and too small corpora."""
+        clusterer = WorkflowClusterer(n_clusters=3)
+        with self.assertRaises(ValueError):
+            clusterer.transform(self.workflows)
+        with self.assertRaises(ValueError):
+            clusterer.fit(self.workflows[:2])
+        with self.assertRaises(ValueError):
+            WorkflowClusterer(n_clusters=2, min_df=1000).fit(self.workflows)
+
+
+if __name__ == '__main__':
+    unittest.main()
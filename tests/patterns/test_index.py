@@ -0,0 +1,85 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from n8n_analyzer.core.models import N8nWorkflow, N8nNode
+from n8n_analyzer.patterns.index import TransactionIndex
+from n8n_analyzer.patterns.mining import ItemVocabulary, fpgrowth
+from tests.helpers import random_transactions
+
+
+class TestTransactionIndex(unittest.TestCase):
+    
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.vocabulary = ItemVocabulary(f"item{i}" for i in range(12))
+        self.transactions = random_transactions(300, 12, seed=8)
+        self.index = TransactionIndex.from_transactions(
+            self.transactions, self.vocabulary, keys=[f"w{i}.json" for i in range(300)]
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _expected(self, item_ids):
+        return [i for i, t in enumerate(self.transactions) if set(item_ids) <= set(t)]
+
+    def test_support_queries(self):
+        """Test counts, positions and keys against a corpus scan."""
+        for item_ids in ([0], [0, 1], [2, 5, 7], [11]):
+            items = [f"item{i}" for i in item_ids]
+            expected = self._expected(item_ids)
+            self.assertEqual(self.index.count(items), len(expected))
+            self.assertEqual(self.index.transactions(items), expected)
+            self.assertEqual(self.index.matching_keys(items), [f"w{i}.json" for i in expected])
+            self.assertAlmostEqual(self.index.support(items), len(expected) / 300)
+        
+        self.assertEqual(self.index.count([]), 300)
+        self.assertEqual(self.index.count(["item0", "unknown"]), 0)
+
+    def test_matches_mined_counts(self):
+        """Test that index counts agree with FP-Growth counts for every frequent itemset."""
+        counts, _ = fpgrowth(self.transactions, min_support=0.02)
+        for itemset, count in counts.items():
+            self.assertEqual(self.index.count(self.vocabulary.decode(itemset)), count)
+
+    def test_save_and_load(self):
+        """Test the on-disk round trip, including re-saving a lazily loaded index."""
+        path = os.path.join(self.temp_dir, "index", "types.idx")
+        self.index.save(path)
+        loaded = TransactionIndex.load(path)
+        
+        self.assertEqual(len(loaded), 300)
+        self.assertEqual(loaded.vocabulary.items, self.vocabulary.items)
+        self.assertEqual(loaded.matching_keys(["item1", "item3"]), self.index.matching_keys(["item1", "item3"]))
+        
+        resaved = os.path.join(self.temp_dir, "resaved.idx")
+        loaded.save(resaved)
+        reloaded = TransactionIndex.load(resaved)
+        for i in range(12):
+            self.assertEqual(reloaded.count([f"item{i}"]), self.index.count([f"item{i}"]))
+
+    def test_load_invalid(self):
+        """Test that non-index files are rejected."""
+        path = os.path.join(self.temp_dir, "bogus.idx")
+        with open(path, 'wb') as f:
+            f.write(b"not an index at all")
+        with self.assertRaises(ValueError):
+            TransactionIndex.load(path)
+
+    def test_from_workflows(self):
+        """Test indexing node types of workflows keyed by file path."""
+        workflows = []
+        for i, node_types in enumerate([["start", "set"], ["start", "slack"], ["set"]]):
+            nodes = [N8nNode(id=str(j), name=str(j), type=t, typeVersion=1, position=(0, 0))
+                     for j, t in enumerate(node_types)]
+            workflows.append(N8nWorkflow(name="w", nodes=nodes, connections=[], file_path=f"w{i}.json"))
+        
+        index = TransactionIndex.from_workflows(workflows)
+        self.assertEqual(index.count(["start"]), 2)
+        self.assertEqual(index.matching_keys(["set"]), ["w0.json", "w2.json"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+import unittest
+from itertools import combinations
+
+from n8n_analyzer.core.models import N8nWorkflow, N8nNode
+from n8n_analyzer.patterns.mining import (
+    ItemVocabulary,
+    fpgrowth,
+    min_count_for,
+    mine_frequent_itemsets
+)
+from tests.helpers import random_transactions
+
+try:
+    import pandas as pd
+    from mlxtend.frequent_patterns import fpgrowth as mlxtend_fpgrowth
+    from mlxtend.preprocessing import TransactionEncoder
+except ImportError:
+    mlxtend_fpgrowth = None
+
+
+def brute_force_itemsets(transactions, min_count, max_len=None):
+    """Count every candidate itemset directly."""
+    items = sorted({item for transaction in transactions for item in transaction})
+    results = {}
+    for size in range(1, (max_len or len(items)) + 1):
+        for candidate in combinations(items, size):
+            count = sum(1 for transaction in transactions if set(candidate) <= set(transaction))
+            if count >= min_count:
+                results[frozenset(candidate)] = count
+    return results
+
+
+class TestFPGrowth(unittest.TestCase):
+    
+    def test_matches_brute_force(self):
+        """Test FP-Growth against exhaustive counting on random data."""
+        transactions = random_transactions(300, 12)
+        for min_support in (0.02, 0.1, 0.3):
+            counts, n = fpgrowth(transactions, min_support=min_support)
+            self.assertEqual(n, 300)
+            self.assertEqual(counts, brute_force_itemsets(transactions, min_count_for(min_support, 300)))
+
+    def test_max_len(self):
+        """Test that max_len bounds the itemset size, including single-path trees."""
+        transactions = random_transactions(200, 8, seed=1) + [tuple(range(8))] * 50
+        counts, _ = fpgrowth(transactions, min_support=0.05, max_len=2)
+        
+        self.assertTrue(all(len(itemset) <= 2 for itemset in counts))
+        self.assertEqual(counts, brute_force_itemsets(transactions, min_count_for(0.05, 250), max_len=2))
+        
+        single_path, _ = fpgrowth([(1, 2, 3)] * 4, min_support=0.5, max_len=2)
+        self.assertEqual(set(single_path), {frozenset(s) for s in [(1,), (2,), (3,), (1, 2), (1, 3), (2, 3)]})
+
+    def test_min_support_validation(self):
+        """Test min_support bounds and rounding."""
+        self.assertEqual(min_count_for(0.3, 10), 3)
+        with self.assertRaises(ValueError):
+            min_count_for(0, 10)
+
+    @unittest.skipIf(mlxtend_fpgrowth is None, "mlxtend is not installed")
+    def test_matches_mlxtend(self):
+        """Test that results agree with mlxtend's dense implementation."""
+        transactions = random_transactions(500, 20, seed=2)
+        counts, n = fpgrowth(transactions, min_support=0.03)
+        
+        encoder = TransactionEncoder()
+        frame = pd.DataFrame(encoder.fit(transactions).transform(transactions), columns=encoder.columns_)
+        expected = mlxtend_fpgrowth(frame, min_support=0.03)
+        
+        self.assertEqual(
+            {itemset: round(count / n, 9) for itemset, count in counts.items()},
+            {frozenset(row.itemsets): round(row.support, 9) for row in expected.itertuples()}
+        )
+
+
+class TestWorkflowMining(unittest.TestCase):
+    
+    def _workflow(self, node_types):
+        nodes = [N8nNode(id=str(i), name=str(i), type=t, typeVersion=1, position=(0, 0))
+                 for i, t in enumerate(node_types)]
+        return N8nWorkflow(name="w", nodes=nodes, connections=[])
+
+    def test_mine_from_workflows(self):
+        """Test mining node type itemsets from a workflow stream."""
+        workflows = [
+            self._workflow(["start", "set", "slack"]),
+            self._workflow(["start", "set", "set"]),
+            self._workflow(["webhook", "slack"]),
+            self._workflow(["start", "slack"]),
+        ]
+        vocabulary = ItemVocabulary()
+        itemsets = mine_frequent_itemsets(iter(workflows), min_support=0.5, vocabulary=vocabulary)
+        supports = {itemset.items: itemset.support for itemset in itemsets}
+        
+        self.assertEqual(supports, {
+            frozenset({"start"}): 0.75, frozenset({"slack"}): 0.75, frozenset({"set"}): 0.5,
+            frozenset({"start", "set"}): 0.5, frozenset({"start", "slack"}): 0.5
+        })
+        self.assertEqual(itemsets[0].count, 3)
+        self.assertEqual(len(vocabulary), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
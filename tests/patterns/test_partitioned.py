@@ -0,0 +1,77 @@
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+
+from n8n_analyzer.core.models import N8nWorkflow, N8nNode
+from n8n_analyzer.patterns.mining import (
+    count_itemsets,
+    fpgrowth,
+    mine_frequent_itemsets,
+    transaction_bitsets
+)
+from n8n_analyzer.patterns.partitioned import partitioned_fpgrowth, mine_frequent_itemsets_partitioned
+from tests.helpers import random_transactions
+
+
+class TestBitsetCounting(unittest.TestCase):
+    
+    def test_count_itemsets(self):
+        """Test vertical bitset counting against direct subset checks."""
+        transactions = random_transactions(200, 10, seed=3)
+        bitsets = transaction_bitsets(transactions)
+        itemsets = [frozenset({0}), frozenset({0, 1}), frozenset({1, 2, 3}), frozenset({0, 99})]
+        
+        expected = [sum(1 for t in transactions if itemset <= set(t)) for itemset in itemsets]
+        self.assertEqual(count_itemsets(bitsets, itemsets), expected)
+        
+        with self.assertRaises(ValueError):
+            count_itemsets(bitsets, [frozenset()])
+
+
+class TestPartitionedMining(unittest.TestCase):
+    
+    def test_matches_single_process(self):
+        """Test that SON mining returns exactly the fpgrowth result for any partitioning."""
+        transactions = random_transactions(500, 15, seed=4)
+        for min_support in (0.01, 0.05, 0.2):
+            expected = fpgrowth(transactions, min_support=min_support)
+            for n_partitions in (1, 3, 7):
+                result = partitioned_fpgrowth(transactions, min_support=min_support, n_partitions=n_partitions)
+                self.assertEqual(result, expected)
+
+    def test_skewed_partitions(self):
+        """Test an itemset frequent overall but concentrated in a single stripe."""
+        transactions = [(1, 2) if i % 4 == 0 else (3,) for i in range(40)]
+        expected = fpgrowth(transactions, min_support=0.25)
+        self.assertIn(frozenset({1, 2}), expected[0])
+        self.assertEqual(partitioned_fpgrowth(transactions, min_support=0.25, n_partitions=4), expected)
+
+    def test_process_pool(self):
+        """Test mining in worker processes, with max_len and a shared executor."""
+        transactions = random_transactions(300, 12, seed=5)
+        expected = fpgrowth(transactions, min_support=0.03, max_len=3)
+        
+        self.assertEqual(partitioned_fpgrowth(transactions, min_support=0.03, max_len=3, workers=2), expected)
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            result = partitioned_fpgrowth(
+                transactions, min_support=0.03, max_len=3, n_partitions=4, executor=executor
+            )
+        self.assertEqual(result, expected)
+
+    def test_empty(self):
+        """Test that no transactions yield no itemsets."""
+        self.assertEqual(partitioned_fpgrowth([], min_support=0.5), ({}, 0))
+
+    def test_mine_from_workflows(self):
+        """Test the workflow-level wrapper against mine_frequent_itemsets."""
+        workflows = []
+        for transaction in random_transactions(120, 8, seed=6):
+            nodes = [N8nNode(id=str(t), name=str(t), type=f"type{t}", typeVersion=1, position=(0, 0))
+                     for t in transaction]
+            workflows.append(N8nWorkflow(name="w", nodes=nodes, connections=[]))
+        
+        expected = mine_frequent_itemsets(workflows, min_support=0.1)
+        self.assertEqual(mine_frequent_itemsets_partitioned(workflows, min_support=0.1, n_partitions=3), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
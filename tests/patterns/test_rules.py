@@ -0,0 +1,106 @@
+import math
+import unittest
+from itertools import combinations
+
+from n8n_analyzer.patterns.mining import ItemVocabulary, fpgrowth
+from n8n_analyzer.patterns.rules import generate_rules, iter_rule_batches, top_rules
+from tests.helpers import random_transactions
+
+try:
+    import pandas as pd
+    from mlxtend.frequent_patterns import association_rules, fpgrowth as mlxtend_fpgrowth
+    from mlxtend.preprocessing import TransactionEncoder
+except ImportError:
+    association_rules = None
+
+
+class TestAssociationRules(unittest.TestCase):
+    
+    def setUp(self):
+        self.transactions = random_transactions(400, 10, seed=7)
+        self.counts, self.n = fpgrowth(self.transactions, min_support=0.02)
+
+    def test_metrics(self):
+        """Test rule metrics on a hand-computed example."""
+        vocabulary = ItemVocabulary()
+        transactions = [vocabulary.encode(t) for t in [
+            ["start", "set"], ["start", "set"], ["start", "slack"], ["set"]
+        ]]
+        counts, n = fpgrowth(transactions, min_support=0.25)
+        rules = {(tuple(r.antecedent), tuple(r.consequent)): r
+                 for r in generate_rules(counts, n, vocabulary, min_confidence=0.0)}
+        
+        rule = rules[(("start",), ("set",))]
+        self.assertEqual(rule.count, 2)
+        self.assertAlmostEqual(rule.support, 0.5)
+        self.assertAlmostEqual(rule.confidence, 2 / 3)
+        self.assertAlmostEqual(rule.lift, (2 / 3) / 0.75)
+        self.assertAlmostEqual(rule.leverage, 0.5 - 0.75 * 0.75)
+        self.assertAlmostEqual(rule.conviction, (1 - 0.75) / (1 - 2 / 3))
+        self.assertTrue(math.isinf(rules[(("slack",), ("start",))].conviction))
+
+    def test_thresholds_and_batching(self):
+        """Test that batch size does not change the rules and thresholds are applied."""
+        small = [rule for batch in iter_rule_batches(self.counts, self.n, min_confidence=0.3, batch_size=7)
+                 for rule in batch.rules()]
+        large = [rule for batch in iter_rule_batches(self.counts, self.n, min_confidence=0.3)
+                 for rule in batch.rules()]
+        self.assertEqual(sorted(small, key=repr), sorted(large, key=repr))
+        self.assertTrue(all(rule.confidence >= 0.3 for rule in small))
+        
+        consequent_limited = generate_rules(self.counts, self.n, min_confidence=0.0, max_consequent_len=1)
+        self.assertTrue(all(len(rule.consequent) == 1 for rule in consequent_limited))
+        self.assertTrue(all(rule.lift >= 1.2 for rule in generate_rules(self.counts, self.n, min_lift=1.2)))
+
+    def test_batch_size_bounds_large_itemsets(self):
+        """Test that a single large itemset is split over batches of at most batch_size rules."""
+        items = frozenset(range(8))
+        counts = {frozenset(subset): 10 for size in range(1, 9) for subset in combinations(items, size)}
+        batches = list(iter_rule_batches(counts, 20, batch_size=16))
+        
+        self.assertTrue(all(len(batch) <= 16 for batch in batches))
+        self.assertEqual(sum(len(batch) for batch in batches), sum(2 ** len(itemset) - 2 for itemset in counts))
+
+    def test_top_rules_streaming(self):
+        """Test that streaming top-K equals the head of the full sorted rule set."""
+        all_rules = generate_rules(self.counts, self.n, min_confidence=0.1)
+        top = top_rules(self.counts, self.n, k=15, min_confidence=0.1, batch_size=10)
+        
+        self.assertEqual(len(top), 15)
+        self.assertEqual([rule.lift for rule in top], [rule.lift for rule in all_rules[:15]])
+        by_confidence = top_rules(self.counts, self.n, k=5, metric='confidence')
+        self.assertEqual(by_confidence[0].confidence, max(rule.confidence for rule in all_rules))
+        
+        with self.assertRaises(ValueError):
+            top_rules(self.counts, self.n, metric='interest')
+
+    def test_missing_subset(self):
+        """Test that counts that are not downward closed are rejected."""
+        with self.assertRaises(ValueError):
+            generate_rules({frozenset({1, 2}): 3, frozenset({1}): 4}, 10)
+
+    @unittest.skipIf(association_rules is None, "mlxtend not installed")
+    def test_matches_mlxtend(self):
+        """Test metrics against mlxtend's association_rules."""
+        encoder = TransactionEncoder()
+        frame = pd.DataFrame(encoder.fit(self.transactions).transform(self.transactions), columns=encoder.columns_)
+        frequent = mlxtend_fpgrowth(frame, min_support=0.02)
+        expected = association_rules(frequent, metric='confidence', min_threshold=0.2)
+        expected = {
+            (frozenset(row.antecedents), frozenset(row.consequents)): (row.support, row.confidence, row.lift, row.conviction)
+            for row in expected.itertuples()
+        }
+        
+        rules = generate_rules(self.counts, self.n, min_confidence=0.2)
+        self.assertEqual(len(rules), len(expected))
+        for rule in rules:
+            support, confidence, lift, conviction = expected[(rule.antecedent, rule.consequent)]
+            self.assertAlmostEqual(rule.support, support)
+            self.assertAlmostEqual(rule.confidence, confidence)
+            self.assertAlmostEqual(rule.lift, lift)
+            if not math.isinf(rule.conviction):
+                self.assertAlmostEqual(rule.conviction, conviction)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+import os
+import random
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+import ujson
+
+from n8n_analyzer.patterns.sampling import (
+    category_from_filename,
+    estimate_support,
+    mine_sampled_itemsets,
+    sample_workflow_files
+)
+
+
+class TestSampledMining(unittest.TestCase):
+    
+    def setUp(self):
+        """Write a corpus where 'automation' workflows use slack far more often."""
+        self.temp_dir = tempfile.mkdtemp()
+        rng = random.Random(11)
+        self.files = []
+        self.node_types = []
+        for i in range(400):
+            category = "automation" if i % 4 == 0 else "monitoring"
+            types = ["start"]
+            if rng.random() < (0.9 if category == "automation" else 0.1):
+                types.append("slack")
+            if rng.random() < 0.5:
+                types.append("set")
+            path = os.path.join(self.temp_dir, f"workflow_{i:04d}_{category}.json")
+            with open(path, 'w') as f:
+                ujson.dump({
+                    "name": f"w{i}",
+                    "nodes": [{"id": t, "name": t, "type": t, "typeVersion": 1, "position": [0, 0]} for t in types],
+                    "connections": {}
+                }, f)
+            self.files.append(path)
+            self.node_types.append(set(types))
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_category_from_filename(self):
+        """Test extracting the category suffix."""
+        self.assertEqual(category_from_filename("/x/workflow_0003_file-processing.json"), "file-processing")
+        self.assertEqual(category_from_filename("workflow_0003.json"), "")
+        self.assertEqual(category_from_filename("plain.json"), "")
+
+    def test_stratified_sample(self):
+        """Test proportional allocation and reproducibility."""
+        sample = sample_workflow_files(self.files, fraction=0.1, stratify=True, seed=1)
+        
+        self.assertEqual(sample.population, {"automation": 100, "monitoring": 300})
+        strata = list(sample.strata.values())
+        self.assertEqual(strata.count("automation"), 10)
+        self.assertEqual(strata.count("monitoring"), 30)
+        self.assertEqual(sample.files, sample_workflow_files(self.files, fraction=0.1, stratify=True, seed=1).files)
+        self.assertEqual(len(sample_workflow_files(self.files, size=25, seed=1).files), 25)
+        
+        with self.assertRaises(ValueError):
+            sample_workflow_files(self.files)
+        with self.assertRaises(ValueError):
+            sample_workflow_files(self.files, fraction=1.5)
+
+    def test_full_sample_is_exact(self):
+        """Test that a census gives exact supports with zero-width intervals."""
+        results = mine_sampled_itemsets(self.files, min_support=0.2, fraction=1.0, stratify=True, seed=2)
+        truth = sum(1 for types in self.node_types if {"start", "slack"} <= types) / 400
+        
+        itemset = next(r for r in results if r.items == frozenset({"start", "slack"}))
+        self.assertAlmostEqual(itemset.support, truth)
+        self.assertAlmostEqual(itemset.lower, truth)
+        self.assertAlmostEqual(itemset.upper, truth)
+
+    def test_sample_estimates_and_verification(self):
+        """Test that intervals cover the true supports and top-K verification is exact."""
+        results = mine_sampled_itemsets(
+            self.files, min_support=0.2, fraction=0.25, stratify=True, seed=3, verify_top_k=3, fields=()
+        )
+        found = {r.items: r for r in results}
+        
+        for items in ({"start"}, {"set"}, {"slack"}, {"start", "set"}):
+            truth = sum(1 for types in self.node_types if items <= types) / 400
+            itemset = found[frozenset(items)]
+            self.assertLessEqual(itemset.lower, truth)
+            self.assertGreaterEqual(itemset.upper, truth)
+        
+        for itemset in results[:3]:
+            expected = sum(1 for types in self.node_types if itemset.items <= types)
+            self.assertEqual(itemset.exact_count, expected)
+            self.assertAlmostEqual(itemset.exact_support, expected / 400)
+        self.assertTrue(all(itemset.exact_count is None for itemset in results[3:]))
+
+    def test_estimate_support(self):
+        """Test the stratified estimator against a hand computation."""
+        estimates = estimate_support(np.array([[5, 1]]), np.array([10, 10]), np.array([100, 300]))
+        self.assertAlmostEqual(estimates['support'][0], 0.25 * 0.5 + 0.75 * 0.1)
+        self.assertLess(estimates['lower'][0], estimates['support'][0])
+        self.assertGreater(estimates['upper'][0], estimates['support'][0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+import random
+import unittest
+from itertools import product
+
+from n8n_analyzer.patterns.sequences import extract_paths, mine_sequential_patterns, prefixspan
+from tests.helpers import make_workflow
+
+
+def is_subsequence(pattern, path):
+    iterator = iter(path)
+    return all(item in iterator for item in pattern)
+
+
+def brute_force_sequences(path_sets, min_count, max_length):
+    """Count every candidate sequence over the alphabet directly."""
+    alphabet = sorted({item for paths in path_sets for path in paths for item in path})
+    results = {}
+    for length in range(1, max_length + 1):
+        for candidate in product(alphabet, repeat=length):
+            count = sum(1 for paths in path_sets if any(is_subsequence(candidate, path) for path in paths))
+            if count >= min_count:
+                results[candidate] = count
+    return results
+
+
+class TestSequentialMining(unittest.TestCase):
+    
+    def test_matches_brute_force(self):
+        """Test PrefixSpan against exhaustive subsequence counting."""
+        rng = random.Random(9)
+        path_sets = [
+            [tuple(rng.randrange(5) for _ in range(rng.randint(1, 5))) for _ in range(rng.randint(1, 3))]
+            for _ in range(60)
+        ]
+        for min_count in (3, 10):
+            counts, n = prefixspan(path_sets, max_pattern_length=3, min_count=min_count)
+            self.assertEqual(n, 60)
+            self.assertEqual(counts, brute_force_sequences(path_sets, min_count, 3))
+
+    def test_support_counts_workflows(self):
+        """Test that a pattern occurring in several paths of one workflow counts once."""
+        counts, _ = prefixspan([[(1, 2), (1, 2), (1, 3)], [(2, 1)]], min_count=1)
+        self.assertEqual(counts[(1, 2)], 1)
+        self.assertEqual(counts[(1,)], 2)
+        self.assertEqual(counts[(2, 1)], 1)
+
+    def test_extract_paths(self):
+        """Test path enumeration, windows over long chains and the path cap."""
+        workflow = make_workflow(
+            [("S", "start", {}), ("A", "a", {}), ("B", "b", {}), ("C", "c", {})],
+            [("S", "A"), ("S", "B"), ("A", "C"), ("B", "C"), ("C", "S")]
+        )
+        paths = extract_paths(workflow, max_path_length=10)
+        self.assertIn(("start", "a", "c"), paths)
+        self.assertIn(("start", "b", "c"), paths)
+        self.assertIn(("c", "start", "a"), paths)  # cycles end before revisiting a node
+        
+        chain = make_workflow([(str(i), f"t{i}", {}) for i in range(10)], [(str(i), str(i + 1)) for i in range(9)])
+        windows = extract_paths(chain, max_path_length=3)
+        self.assertEqual(windows[0], ("t0", "t1", "t2"))
+        self.assertIn(("t7", "t8", "t9"), windows)
+        self.assertTrue(all(len(path) <= 3 for path in windows))
+
+    def test_bounded_on_branching(self):
+        """Test that a fully branched layered graph stays within the path cap."""
+        layers = [[f"{layer}_{i}" for i in range(4)] for layer in range(12)]
+        nodes = [(name, f"type{layer}", {}) for layer, names in enumerate(layers) for name in names]
+        edges = [(a, b) for upper, lower in zip(layers, layers[1:]) for a in upper for b in lower]
+        workflow = make_workflow(nodes, edges)
+        
+        self.assertEqual(len(extract_paths(workflow, max_path_length=12, max_paths=50)), 50)
+        patterns = mine_sequential_patterns([workflow] * 3, min_support=1.0, max_pattern_length=3)
+        self.assertIn(("type0", "type1", "type2"), [pattern.items for pattern in patterns])
+
+    def test_cap_covers_every_trigger(self):
+        """Test that the path cap is shared across triggers instead of spent on the first one."""
+        layers = [[f"{layer}_{i}" for i in range(3)] for layer in range(8)]
+        nodes = [("Hook", "webhook", {}), ("Cron", "cron", {})]
+        nodes += [(name, f"type{layer}", {}) for layer, names in enumerate(layers) for name in names]
+        edges = [(a, b) for upper, lower in zip(layers, layers[1:]) for a in upper for b in lower]
+        edges += [(trigger, name) for trigger in ("Hook", "Cron") for name in layers[0]]
+        workflow = make_workflow(nodes, edges)
+        paths = extract_paths(workflow, max_path_length=10, max_paths=20)
+        
+        self.assertEqual(len(paths), 20)
+        self.assertEqual(sum(path[0] == "webhook" for path in paths), 10)
+        self.assertEqual(sum(path[0] == "cron" for path in paths), 10)
+
+    def test_mine_from_workflows(self):
+        """Test mining node type sequences from workflows."""
+        workflows = [
+            make_workflow([("W", "webhook", {}), ("S", "set", {}), ("M", "slack", {})], [("W", "S"), ("S", "M")]),
+            make_workflow([("W", "webhook", {}), ("M", "slack", {})], [("W", "M")]),
+            make_workflow([("M", "slack", {}), ("W", "webhook", {})], [("M", "W")]),
+        ]
+        supports = {p.items: p.support for p in mine_sequential_patterns(workflows, min_support=0.6)}
+        
+        self.assertAlmostEqual(supports[("webhook", "slack")], 2 / 3)
+        self.assertNotIn(("slack", "webhook"), supports)
+        self.assertAlmostEqual(supports[("slack",)], 1.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
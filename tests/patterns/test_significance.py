@@ -0,0 +1,103 @@
+import random
+import unittest
+
+import numpy as np
+
+from n8n_analyzer.patterns.mining import ItemVocabulary, fpgrowth
+from n8n_analyzer.patterns.rules import generate_rules
+from n8n_analyzer.patterns.significance import (
+    assess_rules,
+    benjamini_hochberg,
+    bonferroni,
+    bootstrap_counts,
+    chi_square_test,
+    itemset_incidence,
+    permutation_p_values
+)
+from scipy import stats as scipy_stats
+from tests.helpers import random_transactions
+
+
+class TestSignificance(unittest.TestCase):
+    
+    def test_incidence_counts(self):
+        """Test that collapsed incidence reproduces exact itemset counts."""
+        transactions = random_transactions(300, 10, seed=12)
+        itemsets = [frozenset({0}), frozenset({0, 1}), frozenset({2, 3}), frozenset({9})]
+        incidence = itemset_incidence(transactions, itemsets)
+        
+        expected = [sum(1 for t in transactions if itemset <= set(t)) for itemset in itemsets]
+        self.assertEqual(incidence.counts().tolist(), expected)
+        self.assertEqual(incidence.n_transactions, 300)
+        self.assertLess(len(incidence.multiplicities), 300)
+
+    def test_bootstrap_counts(self):
+        """Test that Poisson bootstrap replicates are centered on the exact counts."""
+        transactions = random_transactions(500, 6, seed=13)
+        incidence = itemset_incidence(transactions, [frozenset({0}), frozenset({1, 2})])
+        counts, totals = bootstrap_counts(incidence, n_bootstrap=2000, seed=0, chunk_size=3)
+        
+        self.assertEqual(counts.shape, (2000, 2))
+        np.testing.assert_allclose(counts.mean(axis=0), incidence.counts(), rtol=0.02)
+        self.assertAlmostEqual(totals.mean(), 500, delta=5)
+        np.testing.assert_array_equal(bootstrap_counts(incidence, 10, seed=1)[0], bootstrap_counts(incidence, 10, seed=1)[0])
+
+    def test_tests_match_scipy(self):
+        """Test chi-square and permutation p-values against scipy."""
+        n_union, n_antecedent, n_consequent, n = np.array([30, 5]), np.array([40, 50]), np.array([60, 45]), 200
+        statistic, p_values = chi_square_test(n_union, n_antecedent, n_consequent, n)
+        permutation = permutation_p_values(n_union, n_antecedent, n_consequent, n)
+        for i in range(2):
+            a, b, c = n_union[i], n_antecedent[i] - n_union[i], n_consequent[i] - n_union[i]
+            table = [[a, b], [c, n - a - b - c]]
+            expected_stat, expected_p, _, _ = scipy_stats.chi2_contingency(table, correction=False)
+            self.assertAlmostEqual(statistic[i], expected_stat)
+            self.assertAlmostEqual(p_values[i], expected_p)
+            self.assertAlmostEqual(permutation[i], scipy_stats.fisher_exact(table, alternative='greater')[1])
+
+    def test_adjustments(self):
+        """Test Bonferroni and Benjamini-Hochberg adjustment."""
+        p_values = np.array([0.01, 0.04, 0.03, 0.2])
+        np.testing.assert_allclose(bonferroni(p_values), [0.04, 0.16, 0.12, 0.8])
+        np.testing.assert_allclose(benjamini_hochberg(p_values), [0.04, 0.16 / 3, 0.16 / 3, 0.2])
+        self.assertEqual(len(benjamini_hochberg(np.array([]))), 0)
+
+    def test_assess_rules(self):
+        """Test that a planted association is significant and an independent one is not."""
+        rng = random.Random(14)
+        vocabulary = ItemVocabulary()
+        transactions = []
+        for _ in range(600):
+            items = []
+            if rng.random() < 0.4:
+                items.append("webhook")
+                if rng.random() < 0.9:
+                    items.append("respond")
+            elif rng.random() < 0.1:
+                items.append("respond")
+            if rng.random() < 0.5:
+                items.append("set")
+            transactions.append(vocabulary.encode(items))
+        
+        counts, n = fpgrowth(transactions, min_support=0.05)
+        rules = generate_rules(counts, n, vocabulary, min_confidence=0.0)
+        results = {(tuple(r.rule.antecedent), tuple(r.rule.consequent)): r
+                   for r in assess_rules(rules, transactions, vocabulary, n_bootstrap=500, seed=0)}
+        
+        planted = results[(("webhook",), ("respond",))]
+        self.assertLess(planted.q_value, 1e-6)
+        self.assertLess(planted.p_bonferroni, 1e-6)
+        self.assertLessEqual(planted.confidence_interval[0], planted.rule.confidence)
+        self.assertGreaterEqual(planted.confidence_interval[1], planted.rule.confidence)
+        self.assertGreater(planted.lift_interval[0], 1.0)
+        
+        independent = results[(("set",), ("webhook",))]
+        self.assertGreater(independent.p_value, 0.01)
+        self.assertGreaterEqual(independent.p_bonferroni, independent.p_value)
+        
+        with self.assertRaises(ValueError):
+            assess_rules(rules[:1], transactions, ItemVocabulary(["webhook"]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+import random
+import unittest
+from itertools import combinations
+
+import networkx as nx
+
+from n8n_analyzer.patterns.subgraphs import decode_subgraph, gspan, mine_frequent_subgraphs
+from tests.helpers import make_workflow
+
+
+def to_digraph(labels, edges):
+    graph = nx.DiGraph()
+    graph.add_nodes_from((v, {'label': label}) for v, label in enumerate(labels))
+    graph.add_edges_from(edges)
+    return graph
+
+
+def brute_force_subgraphs(graphs, min_count, max_edges):
+    """Enumerate connected edge subsets of every graph and group them by isomorphism."""
+    classes = []  # [representative, set of graph ids]
+    match = nx.algorithms.isomorphism.categorical_node_match('label', None)
+    for graph_id, (labels, edges) in enumerate(graphs):
+        for size in range(1, max_edges + 1):
+            for subset in combinations(edges, size):
+                pattern = nx.DiGraph()
+                pattern.add_nodes_from((v, {'label': labels[v]}) for edge in subset for v in edge)
+                pattern.add_edges_from(subset)
+                if not nx.is_weakly_connected(pattern):
+                    continue
+                for representative, supporters in classes:
+                    if nx.is_isomorphic(representative, pattern, node_match=match):
+                        supporters.add(graph_id)
+                        break
+                else:
+                    classes.append([pattern, {graph_id}])
+    return [(pattern, len(supporters)) for pattern, supporters in classes if len(supporters) >= min_count]
+
+
+class TestGSpan(unittest.TestCase):
+    
+    def test_matches_brute_force(self):
+        """Test gSpan against isomorphism-grouped enumeration of all connected subgraphs."""
+        rng = random.Random(10)
+        graphs = []
+        for _ in range(25):
+            n = rng.randint(2, 6)
+            labels = [rng.randrange(3) for _ in range(n)]
+            edges = sorted({(a, b) for a, b in (sorted(rng.sample(range(n), 2)) for _ in range(rng.randint(1, 7)))})
+            graphs.append((labels, edges))
+        
+        counts, n_graphs = gspan(graphs, max_edges=3, min_count=3)
+        expected = brute_force_subgraphs(graphs, 3, 3)
+        self.assertEqual(n_graphs, 25)
+        self.assertEqual(len(counts), len(expected))
+        
+        match = nx.algorithms.isomorphism.categorical_node_match('label', None)
+        for code, count in counts.items():
+            pattern = to_digraph(*decode_subgraph(code))
+            matches = [c for p, c in expected if nx.is_isomorphic(p, pattern, node_match=match)]
+            self.assertEqual(matches, [count])
+
+    def test_isomorphic_patterns_counted_once(self):
+        """Test that differently numbered copies of one structure yield a single pattern."""
+        diamond = ([0, 1, 2, 3], [(0, 1), (0, 2), (1, 3), (2, 3)])
+        relabeled = ([3, 2, 1, 0], [(3, 2), (3, 1), (2, 0), (1, 0)])
+        shuffled = ([1, 3, 0, 2], [(2, 0), (2, 3), (0, 1), (3, 1)])
+        counts, _ = gspan([diamond, relabeled, shuffled], max_edges=4, min_count=3)
+        
+        full = [code for code in counts if len(code) == 4]
+        self.assertEqual(len(full), 1)
+        labels, edges = decode_subgraph(full[0])
+        self.assertTrue(nx.is_isomorphic(
+            to_digraph(labels, edges), to_digraph(*diamond),
+            node_match=nx.algorithms.isomorphism.categorical_node_match('label', None)
+        ))
+
+    def test_direction_matters(self):
+        """Test that a->b and b->a are different patterns and two-way edges are supported."""
+        counts, _ = gspan([([0, 1], [(0, 1)]), ([0, 1], [(1, 0)]), ([0, 1], [(0, 1), (1, 0)])], min_count=1)
+        self.assertEqual(len(counts), 3)
+        self.assertTrue(all(count == 1 for count in counts.values()))
+
+    def test_max_edges(self):
+        """Test the pattern size cap."""
+        chain = ([0] * 8, [(i, i + 1) for i in range(7)])
+        counts, _ = gspan([chain, chain], max_edges=3, min_count=2)
+        self.assertEqual(sorted(len(code) for code in counts), [1, 2, 3])
+        self.assertEqual(gspan([chain], max_edges=0, min_count=1), ({}, 1))
+
+    def test_mine_from_workflows(self):
+        """Test finding an IF fan-out/fan-in structure in workflows."""
+        def branching(extra):
+            return make_workflow(
+                [("S", "start", {}), ("I", "if", {}), ("A", "set", {}), ("B", "http", {}), ("M", "merge", {}),
+                 ("X", extra, {})],
+                [("S", "I"), ("I", "A"), ("I", "B"), ("A", "M"), ("B", "M"), ("M", "X")]
+            )
+        workflows = [branching("slack"), branching("email"), make_workflow([("S", "start", {})], [])]
+        subgraphs = mine_frequent_subgraphs(workflows, min_support=0.6, max_edges=4)
+        
+        diamond = [s for s in subgraphs if sorted(s.nodes) == ["http", "if", "merge", "set"] and len(s.edges) == 4]
+        self.assertEqual(len(diamond), 1)
+        self.assertAlmostEqual(diamond[0].support, 2 / 3)
+        nodes = diamond[0].nodes
+        self.assertEqual(
+            sorted((nodes[a], nodes[b]) for a, b in diamond[0].edges),
+            [("http", "merge"), ("if", "http"), ("if", "set"), ("set", "merge")]
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import unittest
+
+import numpy as np
+
+from n8n_analyzer.core.models import N8nWorkflow, N8nNode
+from n8n_analyzer.patterns.mining import fpgrowth, mine_frequent_itemsets
+from n8n_analyzer.patterns.rules import generate_rules
+from n8n_analyzer.patterns.sweep import SupportSweep
+from tests.helpers import random_transactions
+
+
+class TestSupportSweep(unittest.TestCase):
+    
+    def setUp(self):
+        self.transactions = random_transactions(400, 12, seed=15)
+        self.sweep = SupportSweep.mine(self.transactions, min_support=0.01)
+        self.thresholds = [0.01, 0.02, 0.05, 0.1, 0.3, 0.75, 1.0]
+
+    def test_matches_re_mining(self):
+        """Test that every threshold gives exactly what mining at it gives."""
+        for min_support in self.thresholds:
+            expected, _ = fpgrowth(self.transactions, min_support=min_support)
+            self.assertEqual(self.sweep.itemset_counts(min_support), expected)
+
+    def test_curves(self):
+        """Test itemset and rule count curves against re-mining."""
+        curve = self.sweep.itemset_curve(self.thresholds)
+        pairs = self.sweep.itemset_curve(self.thresholds, size=2)
+        rule_curve = self.sweep.rule_curve(self.thresholds, min_confidence=0.3)
+        for i, min_support in enumerate(self.thresholds):
+            expected, n = fpgrowth(self.transactions, min_support=min_support)
+            self.assertEqual(curve[i], len(expected))
+            self.assertEqual(pairs[i], sum(1 for itemset in expected if len(itemset) == 2))
+            self.assertEqual(rule_curve[i], len(generate_rules(expected, n, min_confidence=0.3)))
+        self.assertTrue(np.all(np.diff(curve) <= 0))
+        
+        with self.assertRaises(ValueError):
+            self.sweep.itemset_curve([0.001])
+
+    def test_rules_and_suggestion(self):
+        """Test rules at a threshold and the threshold suggestion."""
+        expected, n = fpgrowth(self.transactions, min_support=0.05)
+        self.assertEqual(self.sweep.rules(0.05, min_confidence=0.2), generate_rules(expected, n, min_confidence=0.2))
+        
+        for target in (1, 10, 50):
+            threshold = self.sweep.suggest_min_support(target)
+            self.assertLessEqual(self.sweep.itemset_curve([threshold])[0], target)
+            lower = threshold - 1 / 400
+            if lower >= self.sweep.min_support:
+                self.assertGreater(self.sweep.itemset_curve([lower])[0], target)
+        self.assertEqual(self.sweep.suggest_min_support(10 ** 6), 0.01)
+
+    def test_from_workflows(self):
+        """Test decoded itemsets at a threshold against mine_frequent_itemsets."""
+        workflows = [
+            N8nWorkflow(name="w", connections=[], nodes=[
+                N8nNode(id=str(t), name=str(t), type=f"type{t}", typeVersion=1, position=(0, 0)) for t in transaction
+            ])
+            for transaction in self.transactions
+        ]
+        sweep = SupportSweep.from_workflows(workflows, min_support=0.02)
+        self.assertEqual(sweep.frequent_itemsets(0.1), mine_frequent_itemsets(workflows, min_support=0.1))
+        
+        with self.assertRaises(ValueError):
+            self.sweep.frequent_itemsets(0.1)
+
+
+if __name__ == '__main__':
+    unittest.main()
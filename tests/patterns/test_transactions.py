@@ -0,0 +1,91 @@
+import unittest
+
+from n8n_analyzer.patterns.mining import ItemVocabulary, fpgrowth, mine_frequent_itemsets
+from n8n_analyzer.patterns.transactions import TransactionEncoder, short_type, sparse
+from tests.helpers import make_workflow
+
+
+class TestTransactionEncoder(unittest.TestCase):
+    
+    def setUp(self):
+        self.workflow = make_workflow(
+            [
+                ("Hook", "n8n-nodes-base.webhook", {"httpMethod": "POST", "path": "abc"}),
+                ("Call", "n8n-nodes-base.httpRequest", {"method": "POST", "url": "https://example.com"}),
+                ("Check", "n8n-nodes-base.if", {"operation": "={{ $json.op }}"}),
+                ("Notify", "n8n-nodes-base.slack", {"resource": "message"}),
+            ],
+            [("Hook", "Call"), ("Call", "Check"), ("Check", "Notify"), ("Notify", "Hook"), ("Check", "Ghost")]
+        )
+
+    def test_items(self):
+        """Test node type, type+parameter and chain features."""
+        items = TransactionEncoder(chain_length=3).items(self.workflow)
+        
+        self.assertIn("n8n-nodes-base.webhook", items)
+        self.assertIn("webhook_httpMethod_POST", items)
+        self.assertIn("httpRequest_method_POST", items)
+        self.assertIn("slack_resource_message", items)
+        self.assertNotIn("webhook_path_abc", items)  # not a categorical key
+        self.assertFalse(any(item.startswith("if_operation") for item in items))  # expression
+        
+        self.assertIn("webhook->httpRequest", items)
+        self.assertIn("webhook->httpRequest->if", items)
+        self.assertIn("slack->webhook->httpRequest", items)  # cycle, but the path itself is simple
+        self.assertNotIn("webhook->httpRequest->if->slack", items)  # longer than chain_length
+        self.assertFalse(any("Ghost" in item for item in items))
+
+    def test_feature_switches(self):
+        """Test disabling feature groups and opening up all scalar parameters."""
+        types_only = TransactionEncoder(parameter_keys=(), chain_length=0).items(self.workflow)
+        self.assertEqual(types_only, {node.type for node in self.workflow.nodes})
+        
+        all_params = TransactionEncoder(node_types=False, parameter_keys=None, chain_length=0).items(self.workflow)
+        self.assertIn("webhook_path_abc", all_params)
+        self.assertIn("httpRequest_url_https://example.com", all_params)
+        
+        short_values = TransactionEncoder(parameter_keys=None, max_value_length=10, chain_length=0).items(self.workflow)
+        self.assertNotIn("httpRequest_url_https://example.com", short_values)
+
+    def test_batches(self):
+        """Test CSR batches against per-workflow encoding with a shared vocabulary."""
+        workflows = [
+            make_workflow([("A", "t.start", {}), ("B", f"t.node{i % 4}", {"mode": i % 2})], [("A", "B")], f"w{i}.json")
+            for i in range(25)
+        ]
+        vocabulary = ItemVocabulary()
+        encoder = TransactionEncoder(vocabulary=vocabulary)
+        batches = list(encoder.iter_batches(iter(workflows), batch_size=10))
+        
+        self.assertEqual([len(batch) for batch in batches], [10, 10, 5])
+        self.assertEqual([key for batch in batches for key in batch.keys], [w.file_path for w in workflows])
+        transactions = [t for batch in batches for t in batch]
+        self.assertEqual(transactions, [vocabulary.encode(encoder.items(w), grow=False) for w in workflows])
+        self.assertTrue(all(batches[i].n_items <= batches[i + 1].n_items for i in range(2)))
+        
+        counts, n = fpgrowth(transactions, min_support=0.2)
+        itemsets = mine_frequent_itemsets(workflows, min_support=0.2, item_extractor=encoder.items)
+        self.assertEqual(len(counts), len(itemsets))
+        
+        with self.assertRaises(ValueError):
+            next(encoder.iter_batches(workflows, batch_size=0))
+
+    @unittest.skipIf(sparse is None, "scipy not installed")
+    def test_to_csr(self):
+        """Test conversion of a batch to a scipy matrix."""
+        encoder = TransactionEncoder()
+        batch = next(encoder.iter_batches([self.workflow, self.workflow]))
+        matrix = batch.to_csr()
+        
+        self.assertEqual(matrix.shape, (2, len(encoder.vocabulary)))
+        self.assertEqual(matrix.sum(), 2 * len(encoder.items(self.workflow)))
+        self.assertEqual(batch.to_csr(n_items=100).shape, (2, 100))
+
+    def test_short_type(self):
+        """Test stripping the package prefix of node types."""
+        self.assertEqual(short_type("n8n-nodes-base.httpRequest"), "httpRequest")
+        self.assertEqual(short_type("custom"), "custom")
+
+
+if __name__ == '__main__':
+    unittest.main()